@@ -0,0 +1,69 @@
+"""
+Times image sequence detection on a million frame names, and compares importing a folder of
+frames one file per clip with ``import_media(..., sequences=True)`` on the offline fake Resolve.
+
+    python benchmarks/image_sequences.py --files 1000000 --shots 200 --on-disk 5000
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from pydavinci.fakeresolve import FakeResolveServer  # noqa: E402
+from pydavinci.wrappers.resolve import Resolve  # noqa: E402
+from pydavinci.wrappers.sequences import find_sequences, scan_sequences  # noqa: E402
+
+
+def frame_names(files: int, shots: int) -> List[str]:
+    # every 500th frame is missing, like a pull with dropped frames
+    per_shot = files // shots
+    return [
+        f"/mnt/vfx/sh{shot:04d}/plate/sh{shot:04d}_plate_v001.{frame:07d}.exr"
+        for shot in range(shots)
+        for frame in range(1001, 1001 + per_shot)
+        if frame % 500
+    ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=1000000)
+    parser.add_argument("--shots", type=int, default=200)
+    parser.add_argument("--on-disk", type=int, default=5000)
+    args = parser.parse_args()
+
+    names = frame_names(args.files, args.shots)
+    start = time.perf_counter()
+    sequences, singles = find_sequences(names)
+    elapsed = time.perf_counter() - start
+    print(
+        f"find_sequences {len(names):>9} names {len(sequences):>6} sequences "
+        f"{len(singles):>6} singles {elapsed:>8.3f} s"
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for frame in range(1001, 1001 + args.on_disk):
+            (Path(tmp) / f"plate.{frame:04d}.dpx").touch()
+
+        start = time.perf_counter()
+        sequences, singles = scan_sequences([tmp])
+        print(f"scan_sequences {args.on_disk:>9} files {time.perf_counter() - start:>36.3f} s")
+
+        server = FakeResolveServer()
+        server.populate(clips=0, timelines=0)
+        with server:
+            pool = Resolve().media_pool
+            for label, sequence in (("per frame", False), ("sequences", True)):
+                server.reset_stats()
+                start = time.perf_counter()
+                clips = pool.import_media([tmp], sequences=sequence)
+                elapsed = time.perf_counter() - start
+                print(
+                    f"import {label:<9} {len(clips):>7} clips {server.round_trips:>8} calls "
+                    f"{elapsed:>8.3f} s"
+                )
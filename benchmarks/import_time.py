@@ -0,0 +1,82 @@
+"""
+Measures how long ``import pydavinci`` takes in a fresh interpreter.
+
+Since the connection to Davinci Resolve is lazy, importing the package shouldn't load
+``fusionscript`` nor talk to Resolve. The eager run imports the same modules after connecting,
+as ``pydavinci.main`` did at import time before, and needs a running Resolve. Run it with:
+
+    python benchmarks/import_time.py --runs 20
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = str(Path(__file__).resolve().parent.parent / "src")
+
+IMPORT_ONLY = """
+import sys, time
+t = time.perf_counter()
+import pydavinci.wrappers.resolve
+import pydavinci.wrappers.timeline
+import pydavinci.wrappers.mediapool
+elapsed = time.perf_counter() - t
+import pydavinci.main
+assert "fusionscript" not in sys.modules, "fusionscript was loaded at import time"
+assert not pydavinci.main.connection.connected
+print(elapsed)
+"""
+
+IMPORT_EAGER = """
+import time
+t = time.perf_counter()
+import pydavinci.main
+pydavinci.main.connection.connect()
+import pydavinci.wrappers.resolve
+import pydavinci.wrappers.timeline
+import pydavinci.wrappers.mediapool
+print(time.perf_counter() - t)
+"""
+
+
+def run(code: str, runs: int) -> list:
+    timings = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            env={**os.environ, "PYTHONPATH": SRC},
+        )
+        if out.returncode != 0:
+            raise SystemExit(out.stderr)
+        timings.append(float(out.stdout.strip().splitlines()[-1]))
+    return timings
+
+
+def report(label: str, timings: list) -> None:
+    print(
+        f"{label:<20} median {statistics.median(timings) * 1000:8.2f} ms | "
+        f"min {min(timings) * 1000:8.2f} ms | max {max(timings) * 1000:8.2f} ms"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    lazy = run(IMPORT_ONLY, args.runs)
+    report("import (lazy)", lazy)
+    try:
+        eager = run(IMPORT_EAGER, args.runs)
+    except SystemExit as e:
+        reason = str(e.code).strip().splitlines()[-1]
+        print(f"{'import (eager)':<20} skipped, couldn't connect to Davinci Resolve: {reason}")
+    else:
+        report("import (eager)", eager)
+        saved = statistics.median(eager) - statistics.median(lazy)
+        print(f"{'saved at import':<20} median {saved * 1000:8.2f} ms")
@@ -0,0 +1,90 @@
+"""
+Measures the memory held per ``Marker`` and per wrapper with the ``__slots__`` layouts,
+against the previous ``__dict__`` based layouts, on the offline fake Resolve.
+
+    python benchmarks/memory.py --count 100000
+"""
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from pydavinci.fakeresolve import FakeResolveServer  # noqa: E402
+from pydavinci.wrappers.marker import Marker, MarkerData  # noqa: E402
+from pydavinci.wrappers.mediapoolitem import MediaPoolItem  # noqa: E402
+from pydavinci.wrappers.resolve import Resolve  # noqa: E402
+from pydavinci.wrappers.timelineitem import TimelineItem  # noqa: E402
+
+
+class DictMarker:
+    # layout of ``Marker`` before ``__slots__``: instance ``__dict__`` plus a ``MarkerData`` dict
+    def __init__(self, interface: Any, parent: Any, data: MarkerData, frameid: int) -> None:
+        self._frameid = frameid
+        self._data = data
+        self._parent_obj = parent
+        self._interface = interface
+
+
+class DictWrapper:
+    # layout of ``TimelineItem`` / ``MediaPoolItem`` before ``__slots__``
+    def __init__(self, obj: Any) -> None:
+        self._obj = obj
+        self._markers = None
+
+
+def marker_data(frame: int) -> MarkerData:
+    # distinct strings per marker, like real review notes
+    return {
+        "frameid": frame,
+        "color": "Blue",
+        "name": f"shot {frame}",
+        "note": f"note {frame}",
+        "duration": 1,
+        "customdata": f"id:{frame}",
+    }
+
+
+def per_object(count: int, build: Callable[[int], Any]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    keep: List[Any] = [build(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del keep
+    return (after - before) / count
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=100000)
+    args = parser.parse_args()
+
+    server = FakeResolveServer()
+    server.populate(clips=1, timelines=1)
+    with server:
+        resolve = Resolve()
+        markers = resolve.project.timeline.markers
+        parent = markers._parent_obj
+        item_obj = resolve.project.timeline.items("video", 1)[0]._obj
+        clip_obj = resolve.media_pool.root_folder.clips[0]._obj
+        rows = [
+            (
+                "Marker",
+                lambda i: DictMarker(markers, parent, marker_data(i), i),
+                lambda i: Marker(markers, parent, marker_data(i), i),
+            ),
+            ("TimelineItem", lambda i: DictWrapper(item_obj), lambda i: TimelineItem(item_obj)),
+            ("MediaPoolItem", lambda i: DictWrapper(clip_obj), lambda i: MediaPoolItem(clip_obj)),
+        ]
+        print(f"{'class':<16}{'dict bytes':>12}{'slots bytes':>13}{'saved':>8}")
+        for name, old, new in rows:
+            old_size = per_object(args.count, old)
+            new_size = per_object(args.count, new)
+            saved = 1 - new_size / old_size
+            print(f"{name:<16}{old_size:>12.0f}{new_size:>13.0f}{saved:>8.0%}")
@@ -0,0 +1,75 @@
+"""
+Builds a synthetic tree of moved media spread over several roots, then times indexing it
+and planning the relink of every clip on the offline fake Resolve.
+
+    python benchmarks/relink.py --files 1000000 --roots 4 --per-dir 1000 --clips 20000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from pydavinci.fakeresolve import FakeResolveServer  # noqa: E402
+from pydavinci.wrappers.relink import FileIndex  # noqa: E402
+from pydavinci.wrappers.resolve import Resolve  # noqa: E402
+
+
+def build_tree(base: str, files: int, roots: int, per_dir: int) -> None:
+    # /root_N/A0001/A0001C0001.mov, one reel per directory, reels spread across roots
+    for i in range(0, files, per_dir):
+        reel = f"A{i // per_dir + 1:04d}"
+        directory = os.path.join(base, f"root_{(i // per_dir) % roots}", reel)
+        os.makedirs(directory)
+        for n in range(min(per_dir, files - i)):
+            open(os.path.join(directory, f"{reel}C{n + 1:04d}.mov"), "w").close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=1000000)
+    parser.add_argument("--roots", type=int, default=4)
+    parser.add_argument("--per-dir", type=int, default=1000)
+    parser.add_argument("--clips", type=int, default=20000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as base:
+        start = time.perf_counter()
+        build_tree(base, args.files, args.roots, args.per_dir)
+        print(f"tree     {args.files:>9} files {time.perf_counter() - start:>9.3f} s")
+
+        roots = [os.path.join(base, f"root_{r}") for r in range(args.roots)]
+        start = time.perf_counter()
+        files = FileIndex(roots)
+        print(f"index    {len(files):>9} files {time.perf_counter() - start:>9.3f} s")
+
+        server = FakeResolveServer()
+        server.populate(clips=0, timelines=0)
+        with server:
+            pool = Resolve().media_pool
+            # clips of the first reels, still pointing at the old volume
+            paths = [
+                f"/Volumes/OLD/A{i // args.per_dir + 1:04d}/A{i // args.per_dir + 1:04d}"
+                f"C{i % args.per_dir + 1:04d}.mov"
+                for i in range(min(args.clips, args.files))
+            ]
+            clips = pool.import_media(paths)
+            pool.unlink_clips(clips)
+
+            server.reset_stats()
+            start = time.perf_counter()
+            plan = pool.relink(files, dry_run=True)
+            elapsed = time.perf_counter() - start
+            print(
+                f"plan     {len(clips):>9} clips {elapsed:>9.3f} s {server.round_trips:>8} calls, "
+                f"{plan.calls} RelinkClips instead of {len(clips)}"
+            )
+
+            server.reset_stats()
+            start = time.perf_counter()
+            plan.apply()
+            print(f"apply    {plan.calls:>9} calls {time.perf_counter() - start:>9.3f} s")
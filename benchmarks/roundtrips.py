@@ -0,0 +1,58 @@
+"""
+Walks a synthetic project through the pydavinci wrappers against the offline fake Resolve and
+reports remote round trips, the busiest remote methods and wall time.
+
+    python benchmarks/roundtrips.py --clips 500 --tracks 4 --latency 0.0002
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from pydavinci.fakeresolve import FakeResolveServer  # noqa: E402
+from pydavinci.wrappers.resolve import Resolve  # noqa: E402
+
+
+def traverse(resolve: Resolve, keep: list) -> int:
+    fields = 0
+    timeline = resolve.project.timeline
+    for index in range(1, timeline.track_count("video") + 1):
+        items = timeline.items("video", index)
+        keep.append(items)
+        for item in items:
+            _ = item.name, item.start, item.end, item.duration
+            fields += 4
+    clips = resolve.media_pool.root_folder.clips
+    keep.append(clips)
+    for clip in clips:
+        _ = clip.properties
+        fields += 1
+    return fields
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clips", type=int, default=500)
+    parser.add_argument("--tracks", type=int, default=4)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds per remote call")
+    parser.add_argument("--passes", type=int, default=1, help="traversals of the same project")
+    args = parser.parse_args()
+
+    server = FakeResolveServer(latency=args.latency)
+    server.populate(clips=args.clips, timelines=1, video_tracks=args.tracks)
+    with server:
+        resolve = Resolve()
+        server.reset_stats()
+        start = time.perf_counter()
+        keep: list = []
+        fields = sum(traverse(resolve, keep) for _ in range(args.passes))
+        elapsed = time.perf_counter() - start
+
+    print(f"fields read      {fields}")
+    print(f"round trips      {server.round_trips}")
+    print(f"wall time        {elapsed:.3f} s ({server.round_trips / elapsed:,.0f} calls/s)")
+    for method, count in server.calls.most_common(8):
+        print(f"  {method:<36} {count}")
@@ -0,0 +1,58 @@
+"""
+Compares reading every item field through ``TimelineItem`` wrappers with
+``Timeline.snapshot()`` on the offline fake Resolve.
+
+    python benchmarks/timeline_snapshot.py --items 20000 --tracks 8 --latency 0.0001
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from pydavinci.fakeresolve import FakeResolveServer  # noqa: E402
+from pydavinci.wrappers.resolve import Resolve  # noqa: E402
+
+
+def with_wrappers(timeline) -> int:  # type: ignore
+    rows = 0
+    for track_type in ("video", "audio", "subtitle"):
+        for index in range(1, timeline.track_count(track_type) + 1):
+            for item in timeline.items(track_type, index):
+                _ = item.name, item.start, item.end, item.duration
+                _ = item.left_offset, item.right_offset, item.id
+                rows += 1
+    return rows
+
+
+def measure(server: FakeResolveServer, label: str, func) -> None:  # type: ignore
+    server.reset_stats()
+    start = time.perf_counter()
+    rows = func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<12} {rows:>8} rows {server.round_trips:>10} calls {elapsed:>9.3f} s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=20000)
+    parser.add_argument("--tracks", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = FakeResolveServer(latency=args.latency)
+    server.populate(clips=args.items // args.tracks, timelines=1, video_tracks=args.tracks)
+    with server:
+        timeline = Resolve().project.timeline
+        measure(server, "wrappers", lambda: with_wrappers(timeline))
+        measure(server, "snapshot", lambda: len(timeline.snapshot()))
+
+        snap = timeline.snapshot()
+        start = time.perf_counter()
+        short = snap.filter(snap["duration"] < 24)
+        cuts = len(set(snap["start"].tolist()))
+        print(
+            f"analytics    {time.perf_counter() - start:.4f} s ({len(short)} short, {cuts} cut points)"
+        )
@@ -1,5 +1,4 @@
 # type: ignore
-import time
 from collections import defaultdict
 
 from pydavinci import davinci
@@ -65,32 +64,23 @@ job_ids = generate_premiere_proxies(
     proxyfactor=2,
 )
 
-project.render(job_ids)
-
-
-for i in len(job_ids):
-
-    render_status = project.render_status(job_ids[i])["JobStatus"]
-
-    while render_status != "Complete":
-        time.sleep(3)
-        status = project.render_status(job_ids[i])
-        try:
-            percentage = status["CompletionPercentage"]
-            time_left = status["EstimatedTimeRemainingInMs"] / 1000
-
-        except KeyError:
-            time.sleep(2)
-            break
-
-        print(
-            f"Job ID {job_ids[i]} | Rendering time left: {time_left} | Percentage completed: {percentage}%\r",
-            end="",
-            flush=True,
-        )
-
-        render_status = status["JobStatus"]
+monitor = project.render_monitor(job_ids)
+monitor.on_progress(
+    lambda event: print(
+        f"Job ID {event.job_id} | Percentage completed: {event.percentage}% "
+        f"| {event.stats.fps:.0f} fps\r",
+        end="",
+        flush=True,
+    )
+)
+monitor.on_complete(
+    lambda event: print(
+        f"\nJob ID {event.job_id} | Rendering complete. "
+        f"| Total render time: {event.status.get('TimeTakenToRenderInMs', 0) / 1000}"
+    )
+)
+monitor.on_failure(lambda event: print(f"\nJob ID {event.job_id} | {event.status['JobStatus']}"))
 
-    time_to_render = project.render_status(job_ids[i])["TimeTakenToRenderInMs"] / 1000
-    print("\n")
-    print(f"Job ID {job_ids[i]} | Rendering complete. | Total render time: {time_to_render}")
+project.render(job_ids)
+monitor.wait()
+print(monitor.stats)
@@ -0,0 +1,1741 @@
+"""
+Offline, in-process stand-in for the ``fusionscript.scriptapp("Resolve")`` object graph.
+
+Every remote object handed out is a [``FakeRemoteObject``][pydavinci.fakeresolve.FakeRemoteObject],
+the same way ``fusionscript`` only hands out ``PyRemoteObject``s, and the methods exposed follow
+the signatures in ``pydavinci/wrappers/_resolve_stubs.pyi``. Each call can be slowed down with
+a configurable latency to model the real IPC cost, and every call is counted so round trips
+and throughput can be measured with no Resolve installed.
+
+```python
+from pydavinci.fakeresolve import FakeResolveServer
+from pydavinci import davinci
+
+server = FakeResolveServer(latency=0.0005)
+server.install()  # plugs the fake in place of pydavinci.main.resolve_obj
+
+resolve = davinci.Resolve()
+resolve.project_manager.create_project("bench")
+...
+print(server.round_trips, server.calls.most_common(5))
+server.uninstall()
+```
+"""
+
+import csv
+import os
+import threading
+import time
+import uuid
+from collections import Counter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
+
+from pydavinci.utils import frames_to_timecode, timecode_to_frames
+
+if TYPE_CHECKING:
+    from pydavinci.wrappers._resolve_stubs import PyRemoteResolve
+
+TRACK_TYPES = ("video", "audio", "subtitle")
+PAGES = ("media", "cut", "edit", "fusion", "color", "fairlight", "deliver")
+TIMELINE_START = 86400  # 01:00:00:00 at 24fps
+
+
+def _new_id() -> str:
+    return str(uuid.uuid4())
+
+
+class FakeRemoteObject:
+    """Handle to an object living in a [``FakeResolveServer``][pydavinci.fakeresolve.FakeResolveServer].
+
+    Attribute access on a handle returns a callable that goes through the server, which applies
+    the configured latency and records the call, like a round trip to Resolve would.
+    """
+
+    __slots__ = ("_server", "_impl")
+
+    def __init__(self, server: "FakeResolveServer", impl: "_Remote") -> None:
+        self._server = server
+        self._impl = impl
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_") or not hasattr(type(self._impl), name):
+            raise AttributeError(f"{self._impl.kind} has no method '{name}'")
+
+        def remote_call(*args: Any, **kwargs: Any) -> Any:
+            return self._server._call(self._impl, name, args, kwargs)
+
+        remote_call.__name__ = name
+        return remote_call
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, FakeRemoteObject) and other._impl is self._impl
+
+    def __hash__(self) -> int:
+        return id(self._impl)
+
+    def __repr__(self) -> str:
+        return f"FakeRemoteObject({self._impl.kind})"
+
+
+class _Remote:
+    """Base for every object exposed by the fake server. Public ``CamelCase`` methods are remote."""
+
+    kind = "Object"
+
+    def __init__(self, server: "FakeResolveServer") -> None:
+        self._server = server
+        self._uid = _new_id()
+
+    def GetUniqueId(self) -> str:
+        return self._uid
+
+
+class _MarkerMixin:
+    _markers: Dict[int, Dict[str, Any]]
+
+    def _marker_limit(self) -> Optional[int]:
+        return None
+
+    def AddMarker(
+        self, frameid: int, color: str, name: str, note: str, duration: int, customData: str
+    ) -> bool:
+        frameid = int(frameid)
+        limit = self._marker_limit()
+        if frameid in self._markers or frameid < 0 or duration < 1:
+            return False
+        if limit is not None and frameid >= limit:
+            return False
+        self._markers[frameid] = {
+            "color": color,
+            "duration": int(duration),
+            "note": note,
+            "name": name,
+            "customData": customData,
+        }
+        return True
+
+    def GetMarkers(self) -> Dict[int, Dict[str, Any]]:
+        return {frame: dict(data) for frame, data in sorted(self._markers.items())}
+
+    def _first_custom(self, customData: str) -> Optional[int]:
+        for frame in sorted(self._markers):
+            if self._markers[frame]["customData"] == customData:
+                return frame
+        return None
+
+    def GetMarkerByCustomData(self, customData: str) -> Dict[int, Dict[str, Any]]:
+        frame = self._first_custom(customData)
+        if frame is None:
+            return {}
+        return {frame: dict(self._markers[frame])}
+
+    def UpdateMarkerCustomData(self, frameId: int, customData: str) -> bool:
+        if frameId not in self._markers:
+            return False
+        self._markers[frameId]["customData"] = customData
+        return True
+
+    def GetMarkerCustomData(self, frameId: int) -> str:
+        if frameId not in self._markers:
+            return ""
+        return self._markers[frameId]["customData"]
+
+    def DeleteMarkersByColor(self, color: str) -> bool:
+        frames = [f for f, m in self._markers.items() if color == "All" or m["color"] == color]
+        for frame in frames:
+            del self._markers[frame]
+        return bool(frames)
+
+    def DeleteMarkerAtFrame(self, frameNum: int) -> bool:
+        return self._markers.pop(frameNum, None) is not None
+
+    def DeleteMarkerByCustomData(self, customData: str) -> bool:
+        frame = self._first_custom(customData)
+        if frame is None:
+            return False
+        del self._markers[frame]
+        return True
+
+
+class _FlagColorMixin:
+    _flags: List[str]
+    _clip_color: str
+
+    def AddFlag(self, color: str) -> bool:
+        if color not in self._flags:
+            self._flags.append(color)
+        return True
+
+    def GetFlagList(self) -> List[str]:
+        return list(self._flags)
+
+    def ClearFlags(self, color: str) -> bool:
+        if color == "All":
+            self._flags.clear()
+        elif color in self._flags:
+            self._flags.remove(color)
+        else:
+            return False
+        return True
+
+    def GetClipColor(self) -> str:
+        return self._clip_color
+
+    def SetClipColor(self, colorName: str) -> bool:
+        self._clip_color = colorName
+        return True
+
+    def ClearClipColor(self) -> bool:
+        self._clip_color = ""
+        return True
+
+
+class _MediaPoolItem(_MarkerMixin, _FlagColorMixin, _Remote):
+    kind = "MediaPoolItem"
+
+    def __init__(
+        self, server: "FakeResolveServer", path: str, frames: int, fps: float = 24.0
+    ) -> None:
+        super().__init__(server)
+        self._media_id = _new_id()
+        self._markers = {}
+        self._flags = []
+        self._clip_color = ""
+        self._metadata: Dict[str, str] = {}
+        self._mattes: List[str] = []
+        self.folder: Optional["_Folder"] = None
+        name = os.path.basename(path)
+        self._properties: Dict[str, Any] = {
+            "Clip Name": name,
+            "File Name": name,
+            "File Path": path,
+            "Reel Name": "",
+            "Frames": str(frames),
+            "FPS": fps,
+            "Start": "0",
+            "End": str(frames - 1),
+            "Start TC": "00:00:00:00",
+            "End TC": frames_to_timecode(frames, int(round(fps))),
+            "Duration": frames_to_timecode(frames, int(round(fps))),
+            "Type": "Video",
+            "Proxy": "None",
+            "Proxy Media Path": "",
+            "Online Status": "Online",
+        }
+
+    @property
+    def frames(self) -> int:
+        return int(self._properties["Frames"])
+
+    def _marker_limit(self) -> Optional[int]:
+        return self.frames
+
+    def GetName(self) -> str:
+        return self._properties["Clip Name"]
+
+    def GetMetadata(self, metadataType: Optional[str] = None) -> Union[str, Dict[str, str]]:
+        if metadataType:
+            return self._metadata.get(metadataType, "")
+        return dict(self._metadata)
+
+    def SetMetadata(self, metadata: Any, value: Any = None) -> bool:
+        if isinstance(metadata, dict):
+            self._metadata.update({k: str(v) for k, v in metadata.items()})
+        else:
+            self._metadata[metadata] = str(value)
+        return True
+
+    def GetMediaId(self) -> str:
+        return self._media_id
+
+    def GetClipProperty(self, propertyName: Optional[str] = None) -> Union[str, Dict[str, Any]]:
+        if propertyName:
+            return self._properties.get(propertyName, "")
+        return dict(self._properties)
+
+    def SetClipProperty(self, propertyName: str, propertyValue: Any) -> bool:
+        if propertyName not in self._properties:
+            return False
+        self._properties[propertyName] = propertyValue
+        return True
+
+    def LinkProxyMedia(self, proxyMediaFilePath: str) -> bool:
+        if self._server.require_existing_files and not os.path.exists(proxyMediaFilePath):
+            return False
+        self._properties["Proxy Media Path"] = proxyMediaFilePath
+        self._properties["Proxy"] = "Linked"
+        return True
+
+    def UnlinkProxyMedia(self) -> bool:
+        if not self._properties["Proxy Media Path"]:
+            return False
+        self._properties["Proxy Media Path"] = ""
+        self._properties["Proxy"] = "None"
+        return True
+
+    def ReplaceClip(self, filePath: str) -> bool:
+        if self._server.require_existing_files and not os.path.exists(filePath):
+            return False
+        name = os.path.basename(filePath)
+        self._properties.update({"File Path": filePath, "File Name": name, "Clip Name": name})
+        self._properties["Online Status"] = "Online"
+        return True
+
+
+class _Folder(_Remote):
+    kind = "Folder"
+
+    def __init__(
+        self, server: "FakeResolveServer", name: str, parent: Optional["_Folder"] = None
+    ) -> None:
+        super().__init__(server)
+        self.name = name
+        self.parent = parent
+        self.clips: List[_MediaPoolItem] = []
+        self.subfolders: List["_Folder"] = []
+
+    def add_clip(self, clip: _MediaPoolItem) -> None:
+        if clip.folder is not None:
+            clip.folder.clips.remove(clip)
+        clip.folder = self
+        self.clips.append(clip)
+
+    def walk(self) -> Iterable["_Folder"]:
+        yield self
+        for sub in self.subfolders:
+            yield from sub.walk()
+
+    def GetClipList(self) -> List[_MediaPoolItem]:
+        return list(self.clips)
+
+    def GetName(self) -> str:
+        return self.name
+
+    def GetSubFolderList(self) -> List["_Folder"]:
+        return list(self.subfolders)
+
+
+class _TimelineItem(_MarkerMixin, _FlagColorMixin, _Remote):
+    kind = "TimelineItem"
+
+    def __init__(
+        self,
+        server: "FakeResolveServer",
+        timeline: "_Timeline",
+        name: str,
+        start: int,
+        duration: int,
+        clip: Optional[_MediaPoolItem] = None,
+        left_offset: int = 0,
+        right_offset: int = 0,
+    ) -> None:
+        super().__init__(server)
+        self.timeline = timeline
+        self.name = name
+        self.start = start
+        self.duration = duration
+        self.clip = clip
+        self.left_offset = left_offset
+        self.right_offset = right_offset
+        self._markers = {}
+        self._flags = []
+        self._clip_color = ""
+        self._properties: Dict[str, Any] = {
+            "Pan": 0.0,
+            "Tilt": 0.0,
+            "ZoomX": 1.0,
+            "ZoomY": 1.0,
+            "RotationAngle": 0.0,
+            "Opacity": 100.0,
+            "CompositeMode": 0,
+            "RetimeProcess": 0,
+        }
+        self._versions: Dict[int, List[str]] = {0: ["Version 1"], 1: []}
+        self._current_version: Tuple[int, str] = (0, "Version 1")
+        self._luts: Dict[int, str] = {}
+        self._cdl: Dict[str, str] = {}
+        self._takes: List[Dict[str, Any]] = []
+        self._selected_take = 0
+        self._comps: List[str] = []
+
+    def _marker_limit(self) -> Optional[int]:
+        return self.duration
+
+    def GetName(self) -> str:
+        return self.name
+
+    def GetDuration(self) -> int:
+        return self.duration
+
+    def GetStart(self) -> int:
+        return self.start
+
+    def GetEnd(self) -> int:
+        return self.start + self.duration
+
+    def GetLeftOffset(self) -> int:
+        return self.left_offset
+
+    def GetRightOffset(self) -> int:
+        return self.right_offset
+
+    def GetProperty(self, propertyKey: Optional[str] = None) -> Any:
+        if propertyKey:
+            return self._properties.get(propertyKey)
+        return dict(self._properties)
+
+    def SetProperty(self, propertyKey: str, propertyValue: Union[str, int, float]) -> bool:
+        if propertyKey not in self._properties:
+            return False
+        self._properties[propertyKey] = propertyValue
+        return True
+
+    def GetMediaPoolItem(self) -> Optional[_MediaPoolItem]:
+        return self.clip
+
+    def GetFusionCompCount(self) -> int:
+        return len(self._comps)
+
+    def GetFusionCompNameList(self) -> List[str]:
+        return list(self._comps)
+
+    def AddFusionComp(self) -> Any:
+        self._comps.append(f"Composition {len(self._comps) + 1}")
+        return None
+
+    def DeleteFusionCompByName(self, compName: str) -> bool:
+        if compName not in self._comps:
+            return False
+        self._comps.remove(compName)
+        return True
+
+    def RenameFusionCompByName(self, oldName: str, newName: str) -> bool:
+        if oldName not in self._comps:
+            return False
+        self._comps[self._comps.index(oldName)] = newName
+        return True
+
+    def AddVersion(self, versionName: str, versionType: int) -> bool:
+        if versionName in self._versions[versionType]:
+            return False
+        self._versions[versionType].append(versionName)
+        self._current_version = (versionType, versionName)
+        return True
+
+    def GetCurrentVersion(self) -> Dict[str, Any]:
+        return {"versionName": self._current_version[1], "versionType": self._current_version[0]}
+
+    def DeleteVersionByName(self, versionName: str, versionType: int) -> bool:
+        if versionName not in self._versions[versionType]:
+            return False
+        if self._current_version == (versionType, versionName):
+            return False
+        self._versions[versionType].remove(versionName)
+        return True
+
+    def LoadVersionByName(self, versionName: str, versionType: int) -> bool:
+        if versionName not in self._versions[versionType]:
+            return False
+        self._current_version = (versionType, versionName)
+        return True
+
+    def RenameVersionByName(self, oldName: str, newName: str, versionType: int) -> bool:
+        versions = self._versions[versionType]
+        if oldName not in versions or newName in versions:
+            return False
+        versions[versions.index(oldName)] = newName
+        if self._current_version == (versionType, oldName):
+            self._current_version = (versionType, newName)
+        return True
+
+    def GetVersionNameList(self, versionType: int) -> List[str]:
+        return list(self._versions[versionType])
+
+    def GetNumNodes(self) -> int:
+        return max([1, *self._luts.keys()])
+
+    def SetLUT(self, nodeIndex: int, lutPath: str) -> bool:
+        self._luts[nodeIndex] = lutPath
+        return True
+
+    def GetLUT(self, nodeIndex: int) -> str:
+        return self._luts.get(nodeIndex, "")
+
+    def SetCDL(self, cdl: Dict[str, str]) -> bool:
+        self._cdl = dict(cdl)
+        return True
+
+    def AddTake(
+        self, mediapoolitem: _MediaPoolItem, startFrame: int = 0, endFrame: int = 0
+    ) -> bool:
+        if not self._takes and self.clip is not None:
+            self._takes.append(
+                {"mediaPoolItem": self.clip, "startFrame": 0, "endFrame": self.clip.frames - 1}
+            )
+            self._selected_take = 1
+        end = endFrame or mediapoolitem.frames - 1
+        self._takes.append(
+            {"mediaPoolItem": mediapoolitem, "startFrame": startFrame, "endFrame": end}
+        )
+        return True
+
+    def GetSelectedTakeIndex(self) -> int:
+        return self._selected_take
+
+    def GetTakesCount(self) -> int:
+        return len(self._takes)
+
+    def GetTakeByIndex(self, idx: int) -> Dict[str, Any]:
+        if not 1 <= idx <= len(self._takes):
+            return {}
+        return dict(self._takes[idx - 1])
+
+    def DeleteTakeByIndex(self, idx: int) -> bool:
+        if not 1 <= idx <= len(self._takes):
+            return False
+        del self._takes[idx - 1]
+        self._selected_take = min(self._selected_take, len(self._takes))
+        return True
+
+    def SelectTakeByIndex(self, idx: int) -> bool:
+        if not 1 <= idx <= len(self._takes):
+            return False
+        self._selected_take = idx
+        return True
+
+    def FinalizeTake(self) -> bool:
+        if not self._takes:
+            return False
+        self.clip = self._takes[self._selected_take - 1]["mediaPoolItem"]
+        self._takes.clear()
+        self._selected_take = 0
+        return True
+
+    def CopyGrades(self, items: List["_TimelineItem"]) -> bool:
+        for item in items:
+            item._luts = dict(self._luts)
+            item._cdl = dict(self._cdl)
+        return True
+
+
+class _Timeline(_MarkerMixin, _Remote):
+    kind = "Timeline"
+
+    def __init__(self, server: "FakeResolveServer", project: "_Project", name: str) -> None:
+        super().__init__(server)
+        self.project = project
+        self.name = name
+        self.start_frame = TIMELINE_START
+        self.tracks: Dict[str, List[List[_TimelineItem]]] = {
+            "video": [[]],
+            "audio": [[]],
+            "subtitle": [],
+        }
+        self.track_names: Dict[str, List[str]] = {
+            "video": ["Video 1"],
+            "audio": ["Audio 1"],
+            "subtitle": [],
+        }
+        self.playhead = TIMELINE_START
+        self.settings: Dict[str, str] = {"useCustomSettings": "0"}
+        self._markers = {}
+
+    @property
+    def end_frame(self) -> int:
+        ends = [item.start + item.duration for track in self.tracks["video"] for item in track]
+        ends += [item.start + item.duration for track in self.tracks["audio"] for item in track]
+        return max(ends, default=self.start_frame)
+
+    def _marker_limit(self) -> Optional[int]:
+        length = self.end_frame - self.start_frame
+        return length if length else None
+
+    def _track(self, track_type: str, index: int) -> List[_TimelineItem]:
+        tracks = self.tracks[track_type]
+        while len(tracks) < index:
+            tracks.append([])
+            self.track_names[track_type].append(f"{track_type.capitalize()} {len(tracks)}")
+        return tracks[index - 1]
+
+    def append(
+        self,
+        clip: _MediaPoolItem,
+        start_frame: int = 0,
+        end_frame: Optional[int] = None,
+        track_index: int = 1,
+        media_types: Iterable[str] = ("video", "audio"),
+    ) -> _TimelineItem:
+        end_frame = clip.frames - 1 if end_frame is None else end_frame
+        duration = end_frame - start_frame + 1
+        video = None
+        for track_type in media_types:
+            track = self._track(track_type, track_index)
+            position = track[-1].start + track[-1].duration if track else self.start_frame
+            item = _TimelineItem(
+                self._server,
+                self,
+                clip.GetName(),
+                position,
+                duration,
+                clip,
+                left_offset=start_frame,
+                right_offset=clip.frames - 1 - end_frame,
+            )
+            track.append(item)
+            video = video or item
+        return video  # type: ignore
+
+    def GetName(self) -> str:
+        return self.name
+
+    def SetName(self, timelineName: str) -> bool:
+        if any(t.name == timelineName for t in self.project.timelines):
+            return False
+        self.name = timelineName
+        return True
+
+    def GetStartFrame(self) -> int:
+        return self.start_frame
+
+    def GetEndFrame(self) -> int:
+        return self.end_frame
+
+    def GetTrackCount(self, trackType: str) -> int:
+        return len(self.tracks[trackType])
+
+    def GetItemListInTrack(self, trackType: str, index: int) -> List[_TimelineItem]:
+        tracks = self.tracks[trackType]
+        if not 1 <= index <= len(tracks):
+            return []
+        return sorted(tracks[index - 1], key=lambda item: item.start)
+
+    def GetItemsInTrack(self, trackType: str, index: int) -> Dict[int, _TimelineItem]:
+        return dict(enumerate(self.GetItemListInTrack(trackType, index), start=1))
+
+    def GetTrackName(self, trackType: str, trackIndex: int) -> str:
+        names = self.track_names[trackType]
+        return names[trackIndex - 1] if 1 <= trackIndex <= len(names) else ""
+
+    def SetTrackName(self, trackType: str, trackIndex: int, name: str) -> bool:
+        names = self.track_names[trackType]
+        if not 1 <= trackIndex <= len(names):
+            return False
+        names[trackIndex - 1] = name
+        return True
+
+    def ApplyGradeFromDRX(self, path: str, gradeMode: int, items: List[_TimelineItem]) -> bool:
+        return bool(items)
+
+    def GetCurrentTimecode(self) -> str:
+        return frames_to_timecode(self.playhead)
+
+    def SetCurrentTimecode(self, timecode: str) -> bool:
+        self.playhead = timecode_to_frames(timecode)
+        return True
+
+    def GetCurrentVideoItem(self) -> Optional[_TimelineItem]:
+        for track in reversed(self.tracks["video"]):
+            for item in track:
+                if item.start <= self.playhead < item.start + item.duration:
+                    return item
+        return None
+
+    def GetCurrentClipThumbnailImage(self) -> Dict[str, Any]:
+        return {"width": 0, "height": 0, "format": "RGB 8 bit", "data": ""}
+
+    def DuplicateTimeline(self, timelineName: Optional[str] = None) -> "_Timeline":
+        copy = self.project.add_timeline(timelineName or f"{self.name} Copy")
+        for track_type, tracks in self.tracks.items():
+            copy.tracks[track_type] = [
+                [
+                    _TimelineItem(
+                        self._server,
+                        copy,
+                        item.name,
+                        item.start,
+                        item.duration,
+                        item.clip,
+                        item.left_offset,
+                        item.right_offset,
+                    )
+                    for item in track
+                ]
+                for track in tracks
+            ]
+            copy.track_names[track_type] = list(self.track_names[track_type])
+        copy._markers = {k: dict(v) for k, v in self._markers.items()}
+        return copy
+
+    def _replace_items(self, items: List[_TimelineItem], name: str) -> Optional[_TimelineItem]:
+        if not items:
+            return None
+        start = min(item.start for item in items)
+        end = max(item.start + item.duration for item in items)
+        track = next(t for t in self.tracks["video"] if items[0] in t)
+        for item in items:
+            for tracks in self.tracks.values():
+                for t in tracks:
+                    if item in t:
+                        t.remove(item)
+        new = _TimelineItem(self._server, self, name, start, end - start)
+        track.append(new)
+        return new
+
+    def CreateCompoundClip(
+        self, items: List[_TimelineItem], clipinfo: Optional[Dict[str, Any]] = None
+    ) -> Optional[_TimelineItem]:
+        name = (clipinfo or {}).get("name", "Compound Clip 1")
+        return self._replace_items(items, name)
+
+    def CreateFusionClip(self, items: List[_TimelineItem]) -> Optional[_TimelineItem]:
+        return self._replace_items(items, "Fusion Clip 1")
+
+    def ImportIntoTimeline(
+        self, filePath: str, importOptions: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        return os.path.exists(filePath)
+
+    def Export(
+        self, fileName: str, exportType: float, exportSubtype: Optional[float] = None
+    ) -> bool:
+        with open(fileName, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["Track", "Name", "Start", "End"])
+            for track_type, tracks in self.tracks.items():
+                for index, track in enumerate(tracks, 1):
+                    for item in track:
+                        writer.writerow(
+                            [
+                                f"{track_type}{index}",
+                                item.name,
+                                item.start,
+                                item.start + item.duration,
+                            ]
+                        )
+        return True
+
+    def GetSetting(self, settingName: Optional[str] = None) -> Any:
+        merged = dict(self.project.settings)
+        merged.update(self.settings)
+        if settingName:
+            return merged.get(settingName, "")
+        return merged
+
+    def SetSetting(self, settingName: str, settingValue: Any) -> bool:
+        if settingName != "useCustomSettings" and self.settings["useCustomSettings"] != "1":
+            return False
+        self.settings[settingName] = str(settingValue)
+        return True
+
+    def _insert(self, name: str) -> _TimelineItem:
+        track = self._track("video", 1)
+        position = max((i.start + i.duration for i in track), default=self.start_frame)
+        item = _TimelineItem(self._server, self, name, max(position, self.playhead), 120)
+        track.append(item)
+        return item
+
+    def InsertGeneratorIntoTimeline(self, generatorName: str) -> _TimelineItem:
+        return self._insert(generatorName)
+
+    def InsertFusionGeneratorIntoTimeline(self, generatorName: str) -> _TimelineItem:
+        return self._insert(generatorName)
+
+    def InsertOFXGeneratorIntoTimeline(self, generatorName: str) -> _TimelineItem:
+        return self._insert(generatorName)
+
+    def InsertTitleIntoTimeline(self, titleName: str) -> _TimelineItem:
+        return self._insert(titleName)
+
+    def InsertFusionTitleIntoTimeline(self, titleName: str) -> _TimelineItem:
+        return self._insert(titleName)
+
+    def GrabStill(self) -> "_GalleryStill":
+        return self.project.gallery.current.grab()
+
+    def GrabAllStills(self, stillFrameSource: int) -> List["_GalleryStill"]:
+        return [
+            self.project.gallery.current.grab() for track in self.tracks["video"] for _ in track
+        ]
+
+
+class _MediaPool(_Remote):
+    kind = "MediaPool"
+
+    def __init__(self, server: "FakeResolveServer", project: "_Project") -> None:
+        super().__init__(server)
+        self.project = project
+        self.root = _Folder(server, "Master")
+        self.current = self.root
+
+    def clips(self) -> Iterable[_MediaPoolItem]:
+        for folder in self.root.walk():
+            yield from folder.clips
+
+    def import_path(
+        self, item: Union[str, Dict[str, Any]], folder: _Folder
+    ) -> List[_MediaPoolItem]:
+        server = self._server
+        if isinstance(item, dict):
+            path = item["FilePath"]
+            start, end = int(item.get("StartIndex", 0)), int(item.get("EndIndex", 0))
+            if end < start:
+                return []
+            head, tail = path.split("%", 1)
+            padding = int(tail[: tail.index("d")] or 1)
+            ext = tail[tail.index("d") + 1 :]
+            display = f"{head}[{start:0{padding}d}-{end:0{padding}d}]{ext}"
+            clip = _MediaPoolItem(server, display, end - start + 1)
+            clip._properties["Type"] = "Still"
+            folder.add_clip(clip)
+            return [clip]
+
+        if os.path.isdir(item):
+            clips = []
+            for entry in sorted(os.scandir(item), key=lambda e: e.name):
+                if entry.is_file():
+                    clips += self.import_path(entry.path, folder)
+            return clips
+
+        if server.require_existing_files and not os.path.isfile(item):
+            return []
+        clip = _MediaPoolItem(server, item, server.clip_frames(item))
+        folder.add_clip(clip)
+        return [clip]
+
+    def GetRootFolder(self) -> _Folder:
+        return self.root
+
+    def AddSubFolder(self, folder: _Folder, name: str) -> Optional[_Folder]:
+        if any(sub.name == name for sub in folder.subfolders):
+            return None
+        sub = _Folder(self._server, name, folder)
+        folder.subfolders.append(sub)
+        return sub
+
+    def CreateEmptyTimeline(self, name: str) -> Optional["_Timeline"]:
+        if any(t.name == name for t in self.project.timelines):
+            return None
+        return self.project.add_timeline(name)
+
+    def AppendToTimeline(self, clips: List[Any]) -> List[_TimelineItem]:
+        timeline = self.project.current_timeline
+        if timeline is None:
+            return []
+        appended = []
+        for clip in clips:
+            if isinstance(clip, dict):
+                appended.append(
+                    timeline.append(
+                        clip["mediaPoolItem"],
+                        int(clip.get("startFrame", 0)),
+                        clip.get("endFrame"),
+                        int(clip.get("trackIndex", 1)),
+                        (
+                            ("video",)
+                            if clip.get("mediaType") == 1
+                            else ("audio",) if clip.get("mediaType") == 2 else ("video", "audio")
+                        ),
+                    )
+                )
+            else:
+                appended.append(timeline.append(clip))
+        return appended
+
+    def CreateTimelineFromClips(
+        self, name: str, clips: List[_MediaPoolItem]
+    ) -> Optional[_Timeline]:
+        timeline = self.CreateEmptyTimeline(name)
+        if timeline is not None:
+            for clip in clips:
+                timeline.append(clip)
+        return timeline
+
+    def ImportTimelineFromFile(
+        self, filePath: str, options: Optional[Dict[str, Any]] = None
+    ) -> Optional[_Timeline]:
+        if not os.path.exists(filePath):
+            return None
+        name = (options or {}).get("timelineName") or os.path.splitext(os.path.basename(filePath))[
+            0
+        ]
+        return self.CreateEmptyTimeline(name)
+
+    def DeleteTimelines(self, timelines: List[_Timeline]) -> bool:
+        for timeline in timelines:
+            if timeline not in self.project.timelines:
+                return False
+            self.project.timelines.remove(timeline)
+            if self.project.current_timeline is timeline:
+                self.project.current_timeline = (
+                    self.project.timelines[0] if self.project.timelines else None
+                )
+        return True
+
+    def GetCurrentFolder(self) -> _Folder:
+        return self.current
+
+    def SetCurrentFolder(self, folder: _Folder) -> bool:
+        self.current = folder
+        return True
+
+    def DeleteClips(self, clips: List[_MediaPoolItem]) -> bool:
+        for clip in clips:
+            if clip.folder is None:
+                return False
+            clip.folder.clips.remove(clip)
+            clip.folder = None
+        return True
+
+    def DeleteFolders(self, subfolder: List[_Folder]) -> bool:
+        for folder in subfolder:
+            if folder.parent is None:
+                return False
+            folder.parent.subfolders.remove(folder)
+            for sub in folder.walk():
+                if sub is self.current:
+                    self.current = self.root
+        return True
+
+    def MoveClips(self, clips: List[_MediaPoolItem], targetFolder: _Folder) -> bool:
+        for clip in clips:
+            targetFolder.add_clip(clip)
+        return True
+
+    def MoveFolders(self, folder: List[_Folder], targetFolder: _Folder) -> bool:
+        for sub in folder:
+            if sub.parent is None or targetFolder in list(sub.walk()):
+                return False
+            sub.parent.subfolders.remove(sub)
+            sub.parent = targetFolder
+            targetFolder.subfolders.append(sub)
+        return True
+
+    def GetClipMatteList(self, MediaPoolItem: _MediaPoolItem) -> List[str]:
+        return list(MediaPoolItem._mattes)
+
+    def GetTimelineMatteList(self, folder: _Folder) -> List[_MediaPoolItem]:
+        return [clip for clip in folder.clips if clip._properties["Type"] == "Matte"]
+
+    def DeleteClipMattes(self, MediaPoolItem: _MediaPoolItem, paths: List[str]) -> bool:
+        MediaPoolItem._mattes = [p for p in MediaPoolItem._mattes if p not in paths]
+        return True
+
+    def RelinkClips(self, clips: List[_MediaPoolItem], folderPath: str) -> bool:
+        for clip in clips:
+            name = os.path.basename(clip._properties["File Path"])
+            path = os.path.join(folderPath, name)
+            if self._server.require_existing_files and not os.path.exists(path):
+                return False
+            clip._properties["File Path"] = path
+            clip._properties["Online Status"] = "Online"
+        return True
+
+    def UnlinkClips(self, clips: List[_MediaPoolItem]) -> bool:
+        for clip in clips:
+            clip._properties["Online Status"] = "Offline"
+        return True
+
+    def ImportMedia(self, path: List[Union[str, Dict[str, Any]]]) -> List[_MediaPoolItem]:
+        imported = []
+        for item in path:
+            imported += self.import_path(item, self.current)
+        return imported
+
+    def ExportMetadata(self, fileName: str, clips: Optional[List[_MediaPoolItem]] = None) -> bool:
+        clips = list(self.clips()) if clips is None else clips
+        keys = sorted(
+            {k for c in clips for k in c._properties} | {k for c in clips for k in c._metadata}
+        )
+        with open(fileName, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=keys)
+            writer.writeheader()
+            for clip in clips:
+                writer.writerow({**clip._properties, **clip._metadata})
+        return True
+
+
+class _GalleryStill(_Remote):
+    kind = "GalleryStill"
+
+
+class _GalleryStillAlbum(_Remote):
+    kind = "GalleryStillAlbum"
+
+    def __init__(self, server: "FakeResolveServer", name: str) -> None:
+        super().__init__(server)
+        self.name = name
+        self.stills: List[_GalleryStill] = []
+        self.labels: Dict[_GalleryStill, str] = {}
+
+    def grab(self) -> _GalleryStill:
+        still = _GalleryStill(self._server)
+        self.stills.append(still)
+        self.labels[still] = f"{len(self.stills)}.1.1"
+        return still
+
+    def GetStills(self) -> List[_GalleryStill]:
+        return list(self.stills)
+
+    def GetLabel(self, galleryStill: _GalleryStill) -> str:
+        return self.labels.get(galleryStill, "")
+
+    def SetLabel(self, galleryStill: _GalleryStill, label: str) -> bool:
+        if galleryStill not in self.labels:
+            return False
+        self.labels[galleryStill] = label
+        return True
+
+    def ExportStills(
+        self, galleryStills: List[_GalleryStill], folderPath: str, filePrefix: str, format: str
+    ) -> bool:
+        return os.path.isdir(folderPath)
+
+    def DeleteStills(self, galleryStills: List[_GalleryStill]) -> bool:
+        for still in galleryStills:
+            self.stills.remove(still)
+            del self.labels[still]
+        return True
+
+
+class _Gallery(_Remote):
+    kind = "Gallery"
+
+    def __init__(self, server: "FakeResolveServer") -> None:
+        super().__init__(server)
+        self.albums = [_GalleryStillAlbum(server, "Stills 1")]
+        self.current = self.albums[0]
+
+    def GetAlbumName(self, galleryStillAlbum: _GalleryStillAlbum) -> str:
+        return galleryStillAlbum.name
+
+    def SetAlbumName(self, galleryStillAlbum: _GalleryStillAlbum, albumName: str) -> bool:
+        galleryStillAlbum.name = albumName
+        return True
+
+    def GetCurrentStillAlbum(self) -> _GalleryStillAlbum:
+        return self.current
+
+    def SetCurrentStillAlbum(self, galleryStillAlbum: _GalleryStillAlbum) -> bool:
+        if galleryStillAlbum not in self.albums:
+            return False
+        self.current = galleryStillAlbum
+        return True
+
+    def GetGalleryStillAlbums(self) -> List[_GalleryStillAlbum]:
+        return list(self.albums)
+
+
+class _RenderJob:
+    def __init__(self, project: "_Project", settings: Dict[str, Any]) -> None:
+        timeline = project.current_timeline
+        self.id = _new_id()
+        self.settings = settings
+        self.timeline_name = timeline.name if timeline else ""
+        self.preset = project.render_preset
+        self.render_format = dict(project.render_format)
+        if settings.get("SelectAllFrames", True) or "MarkIn" not in settings:
+            mark_in = timeline.start_frame if timeline else 0
+            mark_out = (timeline.end_frame - 1) if timeline else 0
+        else:
+            mark_in, mark_out = int(settings["MarkIn"]), int(settings["MarkOut"])
+        self.mark_in = mark_in
+        self.mark_out = mark_out
+        self.frames = max(mark_out - mark_in + 1, 1)
+        self.queued_at: Optional[float] = None
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.status = "Ready"
+        self.fail = False
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "JobId": self.id,
+            "RenderJobName": f"Job {self.id[:8]}",
+            "TimelineName": self.timeline_name,
+            "TargetDir": self.settings.get("TargetDir", ""),
+            "OutputFilename": self.settings.get("CustomName", self.timeline_name),
+            "IsExportVideo": self.settings.get("ExportVideo", True),
+            "IsExportAudio": self.settings.get("ExportAudio", True),
+            "FormatWidth": self.settings.get("FormatWidth", 1920),
+            "FormatHeight": self.settings.get("FormatHeight", 1080),
+            "FrameRate": self.settings.get("FrameRate", "24"),
+            "MarkIn": self.mark_in,
+            "MarkOut": self.mark_out,
+            "RenderMode": "Single clip",
+            "PresetName": self.preset,
+            "VideoFormat": self.render_format["format"],
+            "VideoCodec": self.render_format["codec"],
+        }
+
+
+class _Project(_Remote):
+    kind = "Project"
+
+    def __init__(self, server: "FakeResolveServer", name: str) -> None:
+        super().__init__(server)
+        self.name = name
+        self.timelines: List[_Timeline] = []
+        self.current_timeline: Optional[_Timeline] = None
+        self.mediapool = _MediaPool(server, self)
+        self.gallery = _Gallery(server)
+        self.settings: Dict[str, str] = dict(server.default_project_settings)
+        self.render_settings: Dict[str, Any] = {}
+        self.render_presets = ["H.264 Master", "YouTube - 1080p", "ProRes 422 HQ"]
+        self.render_format = {"format": "mov", "codec": "H264"}
+        # "Custom" once settings are changed by hand, like Davinci Resolve reports it
+        self.render_preset = "Custom"
+        self.render_mode = 1
+        self.jobs: Dict[str, _RenderJob] = {}
+
+    def add_timeline(self, name: str) -> _Timeline:
+        timeline = _Timeline(self._server, self, name)
+        self.timelines.append(timeline)
+        if self.current_timeline is None:
+            self.current_timeline = timeline
+        return timeline
+
+    def _render_tick(self) -> None:
+        # jobs render one after the other, as Resolve does
+        now = self._server.clock()
+        cursor: Optional[float] = None
+        for job in self.jobs.values():
+            if job.status not in ("Queued", "Rendering"):
+                continue
+            start = now if job.queued_at is None else job.queued_at
+            if cursor is not None:
+                start = max(start, cursor)
+            if job.started_at is None and start > now:
+                cursor = start + job.frames / self._server.render_fps
+                continue
+            if job.started_at is None:
+                job.started_at = start
+            done_at = job.started_at + job.frames / self._server.render_fps
+            if job.fail and now >= job.started_at + (done_at - job.started_at) / 2:
+                job.status = "Failed"
+                job.finished_at = job.started_at + (done_at - job.started_at) / 2
+                cursor = job.finished_at
+            elif now >= done_at:
+                job.status = "Complete"
+                job.finished_at = done_at
+                cursor = done_at
+            else:
+                job.status = "Rendering"
+                cursor = done_at
+
+    def GetMediaPool(self) -> _MediaPool:
+        return self.mediapool
+
+    def GetTimelineCount(self) -> int:
+        return len(self.timelines)
+
+    def GetTimelineByIndex(self, idx: int) -> Optional[_Timeline]:
+        if not 1 <= idx <= len(self.timelines):
+            return None
+        return self.timelines[idx - 1]
+
+    def GetCurrentTimeline(self) -> Optional[_Timeline]:
+        return self.current_timeline
+
+    def SetCurrentTimeline(self, timeline: _Timeline) -> bool:
+        if timeline not in self.timelines:
+            return False
+        self.current_timeline = timeline
+        return True
+
+    def GetGallery(self) -> _Gallery:
+        return self.gallery
+
+    def GetName(self) -> str:
+        return self.name
+
+    def SetName(self, projectName: str) -> bool:
+        return self._server.project_manager.rename(self, projectName)
+
+    def GetPresetList(self) -> List[Dict[str, Any]]:
+        return [{"Name": "Current Project"}, {"Name": "System Config"}]
+
+    def SetPreset(self, presetName: str) -> bool:
+        return presetName in ("Current Project", "System Config")
+
+    def AddRenderJob(self) -> str:
+        if self.current_timeline is None:
+            return ""
+        job = _RenderJob(self, dict(self.render_settings))
+        self.jobs[job.id] = job
+        return job.id
+
+    def DeleteRenderJob(self, jobId: str) -> bool:
+        self._render_tick()
+        job = self.jobs.get(jobId)
+        if job is None or job.status == "Rendering":
+            return False
+        del self.jobs[jobId]
+        return True
+
+    def DeleteAllRenderJobs(self) -> bool:
+        if self.IsRenderingInProgress():
+            return False
+        self.jobs.clear()
+        return True
+
+    def GetRenderJobList(self) -> List[Dict[str, Any]]:
+        return [job.as_dict() for job in self.jobs.values()]
+
+    def GetRenderPresetList(self) -> List[str]:
+        return list(self.render_presets)
+
+    def StartRendering(self, *jobids: Any, isInteractiveMode: bool = False) -> bool:
+        self._render_tick()
+        ids: List[str] = []
+        for job_id in jobids:
+            ids += list(job_id) if isinstance(job_id, (list, tuple)) else [job_id]
+        jobs = [self.jobs[i] for i in ids if i in self.jobs] if ids else list(self.jobs.values())
+        jobs = [job for job in jobs if job.status not in ("Queued", "Rendering")]
+        if not jobs:
+            return False
+        now = self._server.clock()
+        for job in jobs:
+            job.status = "Queued"
+            job.queued_at = now
+            job.started_at = None
+            job.finished_at = None
+        self._render_tick()
+        return True
+
+    def StopRendering(self) -> None:
+        self._render_tick()
+        for job in self.jobs.values():
+            if job.status in ("Queued", "Rendering"):
+                job.status = "Cancelled"
+                job.finished_at = self._server.clock()
+
+    def IsRenderingInProgress(self) -> bool:
+        self._render_tick()
+        return any(job.status in ("Queued", "Rendering") for job in self.jobs.values())
+
+    def LoadRenderPreset(self, presetName: str) -> bool:
+        if presetName not in self.render_presets:
+            return False
+        self.render_preset = presetName
+        return True
+
+    def SaveAsNewRenderPreset(self, presetName: str) -> bool:
+        if presetName in self.render_presets:
+            return False
+        self.render_presets.append(presetName)
+        self.render_preset = presetName
+        return True
+
+    def SetRenderSettings(self, settings: Dict[str, Any]) -> bool:
+        self.render_settings.update(settings)
+        self.render_preset = "Custom"
+        return True
+
+    def GetRenderJobStatus(self, jobId: str) -> Dict[str, Any]:
+        self._render_tick()
+        job = self.jobs.get(jobId)
+        if job is None:
+            return {}
+        now = self._server.clock()
+        if job.status == "Rendering" and job.started_at is not None:
+            total = job.frames / self._server.render_fps
+            elapsed = now - job.started_at
+            return {
+                "JobStatus": "Rendering",
+                "CompletionPercentage": min(int(elapsed / total * 100), 99),
+                "EstimatedTimeRemainingInMs": int(max(total - elapsed, 0) * 1000),
+            }
+        if job.status in ("Complete", "Failed", "Cancelled") and job.started_at is not None:
+            return {
+                "JobStatus": job.status,
+                "CompletionPercentage": 100 if job.status == "Complete" else 0,
+                "TimeTakenToRenderInMs": int(((job.finished_at or now) - job.started_at) * 1000),
+            }
+        return {"JobStatus": job.status, "CompletionPercentage": 0}
+
+    def GetSetting(self, settingName: Optional[str] = None) -> Any:
+        if settingName:
+            return self.settings.get(settingName, "")
+        return dict(self.settings)
+
+    def SetSetting(self, settingName: str, settingValue: Any) -> bool:
+        if settingName not in self.settings:
+            return False
+        self.settings[settingName] = str(settingValue)
+        return True
+
+    def GetRenderFormats(self) -> Dict[str, str]:
+        return {"QuickTime": "mov", "MP4": "mp4", "MXF OP1A": "mxf", "DPX": "dpx", "EXR": "exr"}
+
+    def GetRenderCodecs(self, renderFormat: str) -> Dict[str, str]:
+        codecs = {
+            "mov": {"H.264": "H264", "H.265": "H265", "Apple ProRes 422 HQ": "ProRes422HQ"},
+            "mp4": {"H.264": "H264", "H.265": "H265"},
+            "mxf": {"DNxHR HQX": "DNxHRHQX"},
+            "dpx": {"RGB 10 bit": "RGB16LogLin"},
+            "exr": {"RGB half (ZIP)": "RGBHalfZIP"},
+        }
+        return dict(codecs.get(renderFormat, {}))
+
+    def GetCurrentRenderFormatAndCodec(self) -> Dict[str, str]:
+        return dict(self.render_format)
+
+    def SetCurrentRenderFormatAndCodec(self, format: str, codec: str) -> bool:
+        if codec not in self.GetRenderCodecs(format).values():
+            return False
+        self.render_format = {"format": format, "codec": codec}
+        self.render_preset = "Custom"
+        return True
+
+    def GetCurrentRenderMode(self) -> int:
+        return self.render_mode
+
+    def SetCurrentRenderMode(self, renderMode: int) -> bool:
+        if renderMode not in (0, 1):
+            return False
+        self.render_mode = renderMode
+        return True
+
+    def GetRenderResolutions(
+        self, format: Optional[str] = None, codec: Optional[str] = None
+    ) -> List[Dict[str, int]]:
+        return [
+            {"Width": 1280, "Height": 720},
+            {"Width": 1920, "Height": 1080},
+            {"Width": 3840, "Height": 2160},
+        ]
+
+    def RefreshLUTList(self) -> bool:
+        return True
+
+
+class _ProjectManager(_Remote):
+    kind = "ProjectManager"
+
+    def __init__(self, server: "FakeResolveServer") -> None:
+        super().__init__(server)
+        # folders are dicts of {"projects": {name: _Project}, "folders": {name: folder}}
+        self.root: Dict[str, Any] = {"projects": {}, "folders": {}, "parent": None, "name": ""}
+        self.folder = self.root
+        self.current: Optional[_Project] = None
+        self.databases = [{"DbType": "Disk", "DbName": "Local Database"}]
+        self.database = self.databases[0]
+
+    def rename(self, project: _Project, name: str) -> bool:
+        projects = self.folder["projects"]
+        if name in projects or projects.get(project.name) is not project:
+            return False
+        del projects[project.name]
+        projects[name] = project
+        project.name = name
+        return True
+
+    def CreateProject(self, projectName: str) -> Optional[_Project]:
+        if projectName in self.folder["projects"]:
+            return None
+        project = _Project(self._server, projectName)
+        self.folder["projects"][projectName] = project
+        self.current = project
+        return project
+
+    def DeleteProject(self, projectName: str) -> bool:
+        project = self.folder["projects"].get(projectName)
+        if project is None or project is self.current:
+            return False
+        del self.folder["projects"][projectName]
+        return True
+
+    def LoadProject(self, projectName: str) -> Optional[_Project]:
+        project = self.folder["projects"].get(projectName)
+        if project is not None:
+            self.current = project
+        return project
+
+    def GetCurrentProject(self) -> _Project:
+        if self.current is None:
+            self.current = self.CreateProject("Untitled Project")
+        return self.current  # type: ignore
+
+    def SaveProject(self) -> bool:
+        return self.current is not None
+
+    def CloseProject(self, project: _Project) -> bool:
+        if project is not self.current:
+            return False
+        self.current = None
+        return True
+
+    def CreateFolder(self, folderName: str) -> bool:
+        if folderName in self.folder["folders"]:
+            return False
+        self.folder["folders"][folderName] = {
+            "projects": {},
+            "folders": {},
+            "parent": self.folder,
+            "name": folderName,
+        }
+        return True
+
+    def DeleteFolder(self, folderName: str) -> bool:
+        return self.folder["folders"].pop(folderName, None) is not None
+
+    def GetProjectListInCurrentFolder(self) -> List[str]:
+        return list(self.folder["projects"])
+
+    def GetFolderListInCurrentFolder(self) -> List[str]:
+        return list(self.folder["folders"])
+
+    def GotoRootFolder(self) -> bool:
+        self.folder = self.root
+        return True
+
+    def GotoParentFolder(self) -> bool:
+        if self.folder["parent"] is None:
+            return False
+        self.folder = self.folder["parent"]
+        return True
+
+    def GetCurrentFolder(self) -> str:
+        return self.folder["name"]
+
+    def OpenFolder(self, folderName: str) -> bool:
+        if folderName not in self.folder["folders"]:
+            return False
+        self.folder = self.folder["folders"][folderName]
+        return True
+
+    def ImportProject(self, filePath: str) -> bool:
+        name = os.path.splitext(os.path.basename(filePath))[0]
+        if not os.path.exists(filePath) or name in self.folder["projects"]:
+            return False
+        self.folder["projects"][name] = _Project(self._server, name)
+        return True
+
+    def ExportProject(
+        self, projectName: str, filePath: str, withStillsAndLUTs: bool = True
+    ) -> bool:
+        if projectName not in self.folder["projects"]:
+            return False
+        with open(filePath, "w") as f:
+            f.write(projectName)
+        return True
+
+    def RestoreProject(self, filePath: str) -> bool:
+        return self.ImportProject(filePath)
+
+    def GetCurrentDatabase(self) -> Dict[str, str]:
+        return dict(self.database)
+
+    def GetDatabaseList(self) -> List[Dict[str, str]]:
+        return [dict(db) for db in self.databases]
+
+    def SetCurrentDatabase(self, dbInfo: Dict[str, str]) -> bool:
+        for db in self.databases:
+            if db["DbType"] == dbInfo.get("DbType") and db["DbName"] == dbInfo.get("DbName"):
+                self.database = db
+                return True
+        return False
+
+
+class _MediaStorage(_Remote):
+    kind = "MediaStorage"
+
+    def GetMountedVolumeList(self) -> List[str]:
+        return list(self._server.volumes)
+
+    def GetSubFolderList(self, folderPath: str) -> List[str]:
+        if not os.path.isdir(folderPath):
+            return []
+        return sorted(e.path for e in os.scandir(folderPath) if e.is_dir())
+
+    def GetFileList(self, folderPath: str) -> List[str]:
+        if not os.path.isdir(folderPath):
+            return []
+        return sorted(e.path for e in os.scandir(folderPath) if e.is_file())
+
+    def RevealInStorage(self, path: str) -> bool:
+        return os.path.exists(path)
+
+    def AddItemListToMediaPool(self, items: Any) -> List[_MediaPoolItem]:
+        items = items if isinstance(items, list) else [items]
+        return self._server.project_manager.GetCurrentProject().mediapool.ImportMedia(items)
+
+    def AddClipMattesToMediaPool(
+        self, MediaPoolItem: _MediaPoolItem, paths: Any, stereoEye: str = ""
+    ) -> bool:
+        MediaPoolItem._mattes += paths if isinstance(paths, list) else [paths]
+        return True
+
+    def AddTimelineMattesToMediaPool(self, paths: Any) -> List[_MediaPoolItem]:
+        mediapool = self._server.project_manager.GetCurrentProject().mediapool
+        mattes = []
+        for path in paths if isinstance(paths, list) else [paths]:
+            matte = _MediaPoolItem(self._server, path, 1)
+            matte._properties["Type"] = "Matte"
+            mediapool.current.add_clip(matte)
+            mattes.append(matte)
+        return mattes
+
+
+class _Resolve(_Remote):
+    kind = "Resolve"
+
+    def __init__(self, server: "FakeResolveServer") -> None:
+        super().__init__(server)
+        self.page = "edit"
+        self.layouts: List[str] = []
+
+    def Fusion(self) -> Any:
+        return None
+
+    def GetMediaStorage(self) -> _MediaStorage:
+        return self._server.media_storage
+
+    def GetProjectManager(self) -> _ProjectManager:
+        return self._server.project_manager
+
+    def OpenPage(self, pageName: str) -> bool:
+        if pageName not in PAGES:
+            return False
+        self.page = pageName
+        return True
+
+    def GetCurrentPage(self) -> str:
+        return self.page
+
+    def GetProductName(self) -> str:
+        return "DaVinci Resolve Studio"
+
+    def GetVersion(self) -> List[Any]:
+        return [18, 6, 0, 0, ""]
+
+    def GetVersionString(self) -> str:
+        return "18.6.0"
+
+    def LoadLayoutPreset(self, presetName: str) -> bool:
+        return presetName in self.layouts
+
+    def UpdateLayoutPreset(self, presetName: str) -> bool:
+        return presetName in self.layouts
+
+    def ExportLayoutPreset(self, presetName: str, presetFilePath: str) -> bool:
+        return presetName in self.layouts
+
+    def DeleteLayoutPreset(self, presetName: str) -> bool:
+        if presetName not in self.layouts:
+            return False
+        self.layouts.remove(presetName)
+        return True
+
+    def SaveLayoutPreset(self, presetName: str) -> bool:
+        if presetName in self.layouts:
+            return False
+        self.layouts.append(presetName)
+        return True
+
+    def ImportLayoutPreset(self, presetFilePath: str, presetName: str) -> bool:
+        return self.SaveLayoutPreset(presetName)
+
+    def Quit(self) -> None:
+        return None
+
+
+class FakeResolveServer:
+    """In-process fake of a running Davinci Resolve.
+
+    Args:
+        latency (float, optional): seconds added to every remote call. Defaults to ``0``.
+        method_latency (dict, optional): per method latency overrides, keyed by method name
+            (``"GetMarkers"``) or by ``"Kind.Method"`` (``"Timeline.GetMarkers"``).
+        require_existing_files (bool, optional): only import media that exists on disk.
+            Defaults to ``False`` so benchmarks can import made up paths.
+        clip_frames (int, optional): length in frames of imported clips. Defaults to ``240``.
+        render_fps (float, optional): simulated render speed. Defaults to ``240``.
+        clock (Callable, optional): time source used by the render queue.
+            Defaults to ``time.monotonic``.
+
+    Info:
+        Only the remote API is counted in [``calls``][pydavinci.fakeresolve.FakeResolveServer.calls].
+        Seeding helpers like [``populate``][pydavinci.fakeresolve.FakeResolveServer.populate]
+        work on the server state directly and don't count as round trips.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        method_latency: Optional[Dict[str, float]] = None,
+        require_existing_files: bool = False,
+        clip_frames: int = 240,
+        render_fps: float = 240.0,
+        clock: Optional[Callable[[], float]] = None,
+    ) -> None:
+        self.latency = latency
+        self.method_latency: Dict[str, float] = dict(method_latency or {})
+        self.require_existing_files = require_existing_files
+        self.default_clip_frames = clip_frames
+        self.render_fps = render_fps
+        self.clock: Callable[[], float] = clock or time.monotonic
+        self.volumes: List[str] = [os.path.abspath(os.sep)]
+        self.default_project_settings: Dict[str, str] = {
+            "timelineFrameRate": "24",
+            "timelineResolutionWidth": "1920",
+            "timelineResolutionHeight": "1080",
+            "timelinePlaybackFrameRate": "24",
+            "videoMonitorFormat": "HD 1080p 24",
+            "colorScienceMode": "davinciYRGB",
+            "superScale": "0",
+        }
+        self.calls: "Counter[str]" = Counter()
+        """``Counter`` of remote calls keyed by ``"Kind.Method"``"""
+        self.busy_time = 0.0
+        """Total seconds spent inside remote calls, latency included"""
+
+        self._lock = threading.RLock()
+        self.project_manager = _ProjectManager(self)
+        self.media_storage = _MediaStorage(self)
+        self._resolve = _Resolve(self)
+        self.resolve: FakeRemoteObject = FakeRemoteObject(self, self._resolve)
+        """The remote Resolve object, what ``scriptapp("Resolve")`` returns"""
+
+    @property
+    def round_trips(self) -> int:
+        """Number of remote calls made so far."""
+        return sum(self.calls.values())
+
+    def reset_stats(self) -> None:
+        """Clears call counters."""
+        with self._lock:
+            self.calls.clear()
+            self.busy_time = 0.0
+
+    def clip_frames(self, path: str) -> int:
+        """Length of a clip imported from ``path``. Override for custom lengths."""
+        return self.default_clip_frames
+
+    def scriptapp(
+        self, app: str = "Resolve", host: Optional[str] = None
+    ) -> Optional[FakeRemoteObject]:
+        """Same entry point as ``fusionscript.scriptapp``."""
+        return self.resolve if app == "Resolve" else None
+
+    def install(self) -> "FakeResolveServer":
+        """Plugs this server in place of ``pydavinci.main.resolve_obj``."""
+        import pydavinci.main
+
+        pydavinci.main.connection.use(cast("PyRemoteResolve", self.resolve))
+        return self
+
+    def uninstall(self) -> None:
+        """Restores the default ``fusionscript`` connection."""
+        import pydavinci.main
+
+        pydavinci.main.connection.use()
+
+    def __enter__(self) -> "FakeResolveServer":
+        return self.install()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.uninstall()
+
+    def wrap(self, impl: Any) -> Any:
+        """Returns ``impl`` as seen from the client side: server objects become handles."""
+        if isinstance(impl, _Remote):
+            return FakeRemoteObject(self, impl)
+        if isinstance(impl, list):
+            return [self.wrap(x) for x in impl]
+        if isinstance(impl, dict):
+            return {k: self.wrap(v) for k, v in impl.items()}
+        return impl
+
+    def unwrap(self, obj: Any) -> Any:
+        """Returns the server object behind a handle."""
+        if isinstance(obj, FakeRemoteObject):
+            if obj._server is not self:
+                raise ValueError("Remote object belongs to another Resolve instance")
+            return obj._impl
+        if isinstance(obj, (list, tuple)):
+            return [self.unwrap(x) for x in obj]
+        if isinstance(obj, dict):
+            return {k: self.unwrap(v) for k, v in obj.items()}
+        return obj
+
+    def _call(
+        self, impl: _Remote, method: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]
+    ) -> Any:
+        key = f"{impl.kind}.{method}"
+        delay = self.method_latency.get(key, self.method_latency.get(method, self.latency))
+        # the latency is spent outside the lock, so calls from several threads overlap like
+        # round trips to Resolve do, and waiting for the lock isn't counted as busy time
+        if delay:
+            time.sleep(delay)
+        with self._lock:
+            started = time.perf_counter()
+            result = getattr(impl, method)(*self.unwrap(args), **self.unwrap(kwargs))
+            self.calls[key] += 1
+            self.busy_time += delay + time.perf_counter() - started
+            return self.wrap(result)
+
+    # Seeding helpers, these don't count as round trips
+
+    @property
+    def project(self) -> _Project:
+        """Current project on the server side, created if needed."""
+        return self.project_manager.GetCurrentProject()
+
+    def populate(
+        self,
+        clips: int = 0,
+        folders: int = 0,
+        timelines: int = 0,
+        video_tracks: int = 1,
+        audio_tracks: int = 0,
+        markers_per_clip: int = 0,
+        root: str = "/media",
+    ) -> "FakeResolveServer":
+        """
+        Fills the current project without going through the remote API.
+
+        ``clips`` are spread across ``folders`` bins under the media pool root. Each of the
+        ``timelines`` gets every clip on each of its ``video_tracks`` and ``audio_tracks``.
+
+        Returns:
+            (FakeResolveServer): this server
+        """
+        project = self.project
+        mediapool = project.mediapool
+        bins = [mediapool.root]
+        for i in range(folders):
+            sub = _Folder(self, f"Bin {i + 1:04d}", mediapool.root)
+            mediapool.root.subfolders.append(sub)
+            bins.append(sub)
+
+        created = []
+        for i in range(clips):
+            path = f"{root}/A{i // 1000 + 1:03d}/A{i // 1000 + 1:03d}C{i % 1000 + 1:03d}.mov"
+            clip = _MediaPoolItem(self, path, self.clip_frames(path))
+            clip._properties["Reel Name"] = f"A{i // 1000 + 1:03d}C{i % 1000 + 1:03d}"
+            for m in range(markers_per_clip):
+                clip.AddMarker(m * 2, "Blue", f"Marker {m + 1}", "", 1, f"clip{i}-{m}")
+            bins[i % len(bins)].add_clip(clip)
+            created.append(clip)
+
+        for _ in range(timelines):
+            timeline = project.add_timeline(f"Timeline {len(project.timelines) + 1}")
+            for track in range(1, video_tracks + 1):
+                for clip in created:
+                    timeline.append(clip, track_index=track, media_types=("video",))
+            for track in range(1, audio_tracks + 1):
+                for clip in created:
+                    timeline.append(clip, track_index=track, media_types=("audio",))
+        return self
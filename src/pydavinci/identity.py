@@ -0,0 +1,84 @@
+import threading
+from typing import Any, List, Optional, Tuple
+from weakref import WeakValueDictionary
+
+import pydavinci.main
+from pydavinci.utils import is_resolve_obj
+
+
+class IdentityMap:
+    """Per-session map of ``GetUniqueId()`` to the wrapper already built for that object.
+
+    Entries are weak references, so a wrapper is dropped from the map as soon as nothing
+    else holds it. The map is cleared whenever ``pydavinci.main.connection`` is reset,
+    reconnected or pointed somewhere else.
+    """
+
+    def __init__(self) -> None:
+        self._wrappers: "WeakValueDictionary[Tuple[type, str], Any]" = WeakValueDictionary()
+        self._session = pydavinci.main.connection.session
+        self._lock = threading.Lock()
+        self.enabled = True
+        """Set to ``False`` to always build new wrappers"""
+
+    def _check_session(self) -> None:
+        session = pydavinci.main.connection.session
+        if session != self._session:
+            self._wrappers.clear()
+            self._session = session
+
+    def get(self, cls: type, uid: str) -> Optional[Any]:
+        with self._lock:
+            self._check_session()
+            return self._wrappers.get((cls, uid))
+
+    def add(self, wrapper: Any, uid: str) -> Any:
+        """Registers ``wrapper`` unless another one is already there. Returns the registered one."""
+        with self._lock:
+            self._check_session()
+            return self._wrappers.setdefault((type(wrapper), uid), wrapper)
+
+    def discard(self, wrapper: Any, uid: str) -> None:
+        with self._lock:
+            if self._wrappers.get((type(wrapper), uid)) is wrapper:
+                del self._wrappers[(type(wrapper), uid)]
+
+    def alive(self, cls: type) -> List[Any]:
+        """Returns the live wrappers of class ``cls``, without any round trip."""
+        with self._lock:
+            self._check_session()
+            return [wrapper for (kind, _), wrapper in self._wrappers.items() if kind is cls]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._wrappers.clear()
+
+    def __len__(self) -> int:
+        return len(self._wrappers)
+
+
+identity_map = IdentityMap()
+
+
+class IdentityMeta(type):
+    """Metaclass for wrappers built from a single remote object.
+
+    ``Wrapper(remote_obj)`` returns the existing wrapper for that Resolve object if there's
+    one alive, instead of building a new one with empty caches.
+
+    Looking the wrapper up costs a ``GetUniqueId()`` round trip, so only ``Timeline`` and
+    ``Project`` use it: they're built rarely and hold caches worth sharing (item index,
+    markers, settings). ``TimelineItem``, ``MediaPoolItem`` and ``Folder`` are built in bulk
+    and load their state lazily, the lookup would cost more than it saves.
+    """
+
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+        if not identity_map.enabled or len(args) != 1 or kwargs or not is_resolve_obj(args[0]):
+            return super().__call__(*args, **kwargs)
+
+        uid = args[0].GetUniqueId()
+        wrapper = identity_map.get(cls, uid)
+        if wrapper is not None:
+            return wrapper
+
+        return identity_map.add(super().__call__(*args), uid)
@@ -0,0 +1,311 @@
+"""
+Opt-in instrumentation of the remote calls made to Davinci Resolve.
+
+While a [``RemoteCallRecorder``][pydavinci.instrument.RemoteCallRecorder] is active, every remote
+object handed out by ``pydavinci.main.resolve_obj`` (and every remote object returned by those)
+is wrapped in an [``InstrumentedRemote``][pydavinci.instrument.InstrumentedRemote] that counts and
+times each call. Calls are grouped by remote method and by the wrapper class that made them
+(``Timeline``, ``TimelineItem``, ``MarkerCollection`` ...).
+
+```python
+from pydavinci import instrument
+
+with instrument.record() as stats:
+    for item in timeline.items("video", 1):
+        item.name
+
+stats.dump(top=10)
+```
+
+Info:
+    Only remote objects fetched while recording are instrumented. Wrappers created before
+    ``record()`` keep their plain remote objects.
+"""
+
+import csv
+import json
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple, cast
+
+import pydavinci.main
+
+_recorder: Optional["RemoteCallRecorder"] = None
+
+
+class CallStats:
+    """Count and latencies of one group of remote calls. Latencies are in seconds."""
+
+    __slots__ = ("count", "total", "samples")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.samples: List[float] = []
+
+    def add(self, elapsed: float) -> None:
+        self.count += 1
+        self.total += elapsed
+        self.samples.append(elapsed)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, pct: float) -> float:
+        """Nearest-rank percentile, ``pct`` between ``0`` and ``100``."""
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        rank = max(int(round(pct / 100 * len(ordered))) - 1, 0)
+        return ordered[min(rank, len(ordered) - 1)]
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.mean,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "max": max(self.samples, default=0.0),
+        }
+
+
+class RemoteCallRecorder:
+    """Collects remote call statistics.
+
+    Attributes:
+        by_method (Dict[str, CallStats]): stats keyed by remote method, ``"GetMarkers"``
+        by_wrapper (Dict[str, CallStats]): stats keyed by calling wrapper class, ``"Timeline"``
+        by_call (Dict[Tuple[str, str], CallStats]): stats keyed by ``(wrapper, method)``
+    """
+
+    def __init__(self) -> None:
+        self.by_method: Dict[str, CallStats] = {}
+        self.by_wrapper: Dict[str, CallStats] = {}
+        self.by_call: Dict[Tuple[str, str], CallStats] = {}
+        self._lock = threading.Lock()
+
+    def add(self, wrapper: str, method: str, elapsed: float) -> None:
+        with self._lock:
+            for table, key in (
+                (self.by_method, method),
+                (self.by_wrapper, wrapper),
+                (self.by_call, (wrapper, method)),
+            ):
+                stats = table.get(key)  # type: ignore
+                if stats is None:
+                    stats = table[key] = CallStats()  # type: ignore
+                stats.add(elapsed)
+
+    @property
+    def calls(self) -> int:
+        """Total number of remote calls recorded."""
+        return sum(stats.count for stats in self.by_method.values())
+
+    @property
+    def total_time(self) -> float:
+        """Total seconds spent in remote calls."""
+        return sum(stats.total for stats in self.by_method.values())
+
+    def clear(self) -> None:
+        with self._lock:
+            self.by_method.clear()
+            self.by_wrapper.clear()
+            self.by_call.clear()
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """
+        Returns one row per ``(wrapper, method)`` pair, sorted by cumulative time.
+
+        Returns:
+            (List[Dict[str, Any]]): rows with ``wrapper``, ``method``, ``count``, ``total``,
+                ``mean``, ``p50``, ``p90``, ``p99`` and ``max``
+        """
+        rows = [
+            {"wrapper": wrapper, "method": method, **stats.as_dict()}
+            for (wrapper, method), stats in self.by_call.items()
+        ]
+        rows.sort(key=lambda row: cast("float", row["total"]), reverse=True)
+        return rows
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns all stats as plain ``dict``s, ready for ``json.dump``."""
+        return {
+            "calls": self.calls,
+            "total": self.total_time,
+            "by_method": {k: v.as_dict() for k, v in self.by_method.items()},
+            "by_wrapper": {k: v.as_dict() for k, v in self.by_wrapper.items()},
+            "by_call": self.rows(),
+        }
+
+    def export(self, path: str) -> None:
+        """
+        Writes stats to ``path``. ``.json`` files get [``to_dict``][pydavinci.instrument.RemoteCallRecorder.to_dict],
+        anything else gets a CSV of [``rows``][pydavinci.instrument.RemoteCallRecorder.rows].
+
+        Args:
+            path (str): output file path
+        """
+        if path.endswith(".json"):
+            with open(path, "w") as f:
+                json.dump(self.to_dict(), f, indent=2)
+            return
+
+        with open(path, "w", newline="") as f:
+            fields = ["wrapper", "method", "count", "total", "mean", "p50", "p90", "p99", "max"]
+            writer = csv.DictWriter(f, fieldnames=fields)
+            writer.writeheader()
+            writer.writerows(self.rows())
+
+    def dump(self, top: int = 20, file: Optional[IO[str]] = None) -> None:
+        """
+        Prints the ``top`` most expensive ``(wrapper, method)`` pairs.
+
+        Args:
+            top (int, optional): number of rows. Defaults to ``20``.
+            file (IO, optional): where to print. Defaults to ``sys.stdout``.
+        """
+        file = file or sys.stdout
+        print(
+            f"{self.calls} remote calls, {self.total_time * 1000:.2f} ms total",
+            file=file,
+        )
+        print(
+            f"{'wrapper.method':<48}{'count':>8}{'total ms':>12}{'p50 ms':>10}{'p99 ms':>10}",
+            file=file,
+        )
+        for row in self.rows()[:top]:
+            name = f"{row['wrapper']}.{row['method']}"
+            print(
+                f"{name:<48}{row['count']:>8}{row['total'] * 1000:>12.3f}"
+                f"{row['p50'] * 1000:>10.3f}{row['p99'] * 1000:>10.3f}",
+                file=file,
+            )
+
+
+def _caller() -> str:
+    # Two frames up is whoever called the remote method.
+    frame = sys._getframe(2)
+    owner = frame.f_locals.get("self")
+    if owner is not None and type(owner).__module__.startswith("pydavinci."):
+        return type(owner).__name__
+    return "-"
+
+
+def _unwrap(value: Any) -> Any:
+    if type(value) is InstrumentedRemote:
+        return value._remote
+    if type(value) is list:
+        return [_unwrap(x) for x in value]
+    if type(value) is tuple:
+        return tuple(_unwrap(x) for x in value)
+    if type(value) is dict:
+        # ClipInfo dicts, {"mediaPoolItem": clip, "startFrame": 0, ...}
+        return {k: _unwrap(v) for k, v in value.items()}
+    return value
+
+
+class InstrumentedRemote:
+    """Proxy around a remote object that times every call while a recorder is active."""
+
+    __slots__ = ("_remote", "_remote_type")
+
+    def __init__(self, remote: Any, remote_type: Optional[type] = None) -> None:
+        self._remote = remote
+        self._remote_type = remote_type or type(remote)
+
+    def _wrap(self, value: Any) -> Any:
+        if type(value) is self._remote_type:
+            return InstrumentedRemote(value, self._remote_type)
+        if type(value) is list:
+            return [self._wrap(x) for x in value]
+        if type(value) is dict:
+            # GetItemsInTrack, {1: item, 2: item, ...}
+            return {k: self._wrap(v) for k, v in value.items()}
+        return value
+
+    def __getattr__(self, name: str) -> Any:
+        method = getattr(self._remote, name)
+        if not callable(method):
+            return method
+
+        def call(*args: Any, **kwargs: Any) -> Any:
+            args = tuple(_unwrap(x) for x in args)
+            kwargs = {k: _unwrap(v) for k, v in kwargs.items()}
+            recorder = _recorder
+            if recorder is None:
+                return self._wrap(method(*args, **kwargs))
+
+            wrapper = _caller()
+            start = time.perf_counter()
+            try:
+                result = method(*args, **kwargs)
+            finally:
+                recorder.add(wrapper, name, time.perf_counter() - start)
+            return self._wrap(result)
+
+        return call
+
+    def __eq__(self, other: object) -> bool:
+        return _unwrap(other) == self._remote
+
+    def __hash__(self) -> int:
+        return hash(self._remote)
+
+    def __repr__(self) -> str:
+        return f"InstrumentedRemote({self._remote!r})"
+
+
+def unwrap(obj: Any) -> Any:
+    """Returns the plain remote object behind ``obj``, or ``obj`` itself."""
+    return _unwrap(obj)
+
+
+def enable(recorder: Optional[RemoteCallRecorder] = None) -> RemoteCallRecorder:
+    """
+    Starts recording remote calls into ``recorder`` until [``disable``][pydavinci.instrument.disable] is called.
+
+    Args:
+        recorder (RemoteCallRecorder, optional): recorder to use. A new one is created if not provided.
+
+    Returns:
+        (RemoteCallRecorder): active recorder
+    """
+    global _recorder
+    _recorder = recorder or RemoteCallRecorder()
+    pydavinci.main.connection.proxy = InstrumentedRemote
+    return _recorder
+
+
+def disable() -> None:
+    """Stops recording. Remote objects fetched from now on aren't instrumented."""
+    global _recorder
+    _recorder = None
+    pydavinci.main.connection.proxy = None
+
+
+@contextmanager
+def record(recorder: Optional[RemoteCallRecorder] = None) -> Iterator[RemoteCallRecorder]:
+    """
+    Records remote calls made inside the ``with`` block.
+
+    Args:
+        recorder (RemoteCallRecorder, optional): recorder to use. A new one is created if not provided.
+
+    Yields:
+        (RemoteCallRecorder): recorder with the collected stats
+    """
+    global _recorder
+    previous = _recorder
+    active = enable(recorder)
+    try:
+        yield active
+    finally:
+        if previous is None:
+            disable()
+        else:
+            _recorder = previous
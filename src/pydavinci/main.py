@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from pydavinci.connect import load_fusionscript
 
@@ -6,11 +7,116 @@ if TYPE_CHECKING:
     from pydavinci.wrappers._resolve_stubs import PyRemoteResolve
 
 
-def get_resolve() -> "PyRemoteResolve":
+def get_resolve(host: Optional[str] = None) -> "PyRemoteResolve":
     load_fusionscript()  # type: ignore
     import fusionscript as dvr_script  # type: ignore
 
+    if host is not None:
+        return dvr_script.scriptapp("Resolve", host)  # type: ignore
     return dvr_script.scriptapp("Resolve")  # type: ignore
 
 
-resolve_obj: "PyRemoteResolve" = get_resolve()
+class ResolveConnection:
+    """Lazy handle to the Davinci Resolve scripting object.
+
+    Importing ``pydavinci`` doesn't load ``fusionscript`` nor open a scripting connection.
+    The connection is made on the first real call (``resolve_obj.GetProjectManager()``, etc.)
+    and reused afterwards. Every wrapper goes through the same module level instance, so calling
+    [``reset``][pydavinci.main.ResolveConnection.reset] or
+    [``reconnect``][pydavinci.main.ResolveConnection.reconnect] affects all of them.
+
+    Args:
+        factory (Callable, optional): callable returning the remote Resolve object.
+            Defaults to [``get_resolve``][pydavinci.main.get_resolve].
+    """
+
+    def __init__(self, factory: Optional[Callable[[], "PyRemoteResolve"]] = None) -> None:
+        self._factory: Callable[[], "PyRemoteResolve"] = factory or get_resolve
+        self._remote: Optional["PyRemoteResolve"] = None
+        self._lock = threading.Lock()
+        self.session = 0
+        """Incremented every time the connection is dropped or replaced"""
+        self.proxy: Optional[Callable[[Any], Any]] = None
+        """Optional wrapper applied to the remote object on access, see ``pydavinci.instrument``"""
+
+    @property
+    def connected(self) -> bool:
+        """``True`` if the remote object has already been fetched."""
+        return self._remote is not None
+
+    @property
+    def remote_type(self) -> type:
+        """Type of the objects handed out by the scripting API. Connects if needed."""
+        return type(self.connect())
+
+    def connect(self) -> "PyRemoteResolve":
+        """
+        Connects to Davinci Resolve if not connected yet.
+
+        Returns:
+            (PyRemoteResolve): remote Resolve object
+        """
+        remote = self._remote
+        if remote is not None:
+            return remote
+
+        with self._lock:
+            if self._remote is None:
+                remote = self._factory()
+                if remote is None:
+                    raise ConnectionError(
+                        "Couldn't connect to Davinci Resolve. Make sure it's running and external scripting is enabled."
+                    )
+                self._remote = remote
+            return self._remote
+
+    def reset(self) -> None:
+        """Drops the current connection. The next call will connect again."""
+        with self._lock:
+            self._remote = None
+            self.session += 1
+
+    def reconnect(self) -> "PyRemoteResolve":
+        """
+        Drops the current connection and connects again right away.
+
+        Returns:
+            (PyRemoteResolve): remote Resolve object
+        """
+        self.reset()
+        return self.connect()
+
+    def use(
+        self,
+        remote: Optional["PyRemoteResolve"] = None,
+        factory: Optional[Callable[[], "PyRemoteResolve"]] = None,
+    ) -> None:
+        """
+        Points this connection to ``remote`` or to objects created by ``factory``.
+        Passing neither restores the default ``fusionscript`` connection.
+
+        Args:
+            remote (PyRemoteResolve, optional): already connected remote Resolve object
+            factory (Callable, optional): callable returning a remote Resolve object
+        """
+        with self._lock:
+            self._factory = factory or get_resolve
+            self._remote = remote
+            self.session += 1
+
+    def __getattr__(self, name: str) -> Any:
+        remote = self.connect()
+        if self.proxy is not None:
+            return getattr(self.proxy(remote), name)
+        return getattr(remote, name)
+
+    def __bool__(self) -> bool:
+        return True
+
+    def __repr__(self) -> str:
+        state = "connected" if self.connected else "not connected"
+        return f"ResolveConnection({state})"
+
+
+connection = ResolveConnection()
+resolve_obj: "PyRemoteResolve" = connection  # type: ignore
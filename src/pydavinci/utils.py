@@ -1,6 +1,7 @@
 from typing import Any, List
 
 import pydavinci.main
+from pydavinci.instrument import InstrumentedRemote
 
 # import psutil
 
@@ -21,7 +22,9 @@ default_resolve_install = {
 
 
 def is_resolve_obj(obj: Any) -> bool:
-    if type(obj) == type(pydavinci.main.resolve_obj):  # noqa: E721
+    if type(obj) is InstrumentedRemote:
+        obj = obj._remote
+    if type(obj) == pydavinci.main.connection.remote_type:  # noqa: E721
         return True
     else:
         return False
@@ -120,3 +123,16 @@ def is_resolve_obj(obj: Any) -> bool:
 #         #     print("Davinci Resolve executable not found. Please double check the path")
 
 #     print("Davinci Resolve already running... Continuing")
+
+
+def frames_to_timecode(frames: int, fps: int = 24) -> str:
+    """Converts a frame count to a non drop-frame ``HH:MM:SS:FF`` timecode."""
+    ff = frames % fps
+    seconds = frames // fps
+    return f"{seconds // 3600:02d}:{(seconds // 60) % 60:02d}:{seconds % 60:02d}:{ff:02d}"
+
+
+def timecode_to_frames(timecode: str, fps: int = 24) -> int:
+    """Converts a non drop-frame ``HH:MM:SS:FF`` timecode to a frame count."""
+    hh, mm, ss, ff = (int(x) for x in timecode.replace(";", ":").split(":"))
+    return ((hh * 60 + mm) * 60 + ss) * fps + ff
@@ -121,7 +121,9 @@ class PyRemoteMediaPool(object):
     ) -> bool: ...
     def RelinkClips(self, clips: List["PyRemoteMediaPoolItem"], folderPath: str) -> bool: ...
     def UnlinkClips(self, clips: List["PyRemoteMediaPoolItem"]) -> bool: ...
-    def ImportMedia(self, path: List[str]) -> List["PyRemoteMediaPoolItem"]: ...
+    def ImportMedia(
+        self, path: Union[List[str], List[Dict[str, Any]]]
+    ) -> List["PyRemoteMediaPoolItem"]: ...
     def ExportMetadata(
         self, fileName: str, clips: Optional[List["PyRemoteMediaPoolItem"]] = ...
     ) -> bool: ...
@@ -169,6 +171,7 @@ class PyRemoteTimeline(object):
     def GetEndFrame(self) -> int: ...
     def GetTrackCount(self, trackType: str) -> int: ...
     def GetItemListInTrack(self, trackType: str, index: int) -> List["PyRemoteTimelineItem"]: ...
+    def GetItemsInTrack(self, trackType: str, index: int) -> Dict[int, "PyRemoteTimelineItem"]: ...
     def AddMarker(
         self, frameid: int, color: str, name: str, note: str, duration: int, customData: str
     ) -> bool: ...
@@ -8,6 +8,8 @@ from pydavinci.wrappers.mediapoolitem import MediaPoolItem
 
 
 class Folder:
+    __slots__ = ("_obj",)
+
     def __init__(self, obj: "PyRemoteFolder") -> None:
         if is_resolve_obj(obj):
             self._obj: "PyRemoteFolder" = obj
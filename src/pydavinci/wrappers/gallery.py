@@ -10,6 +10,8 @@ if TYPE_CHECKING:
 
 
 class Gallery:
+    __slots__ = ("_obj",)
+
     def __init__(self, obj: "PyRemoteGallery") -> None:
 
         if is_resolve_obj(obj):
@@ -7,6 +7,8 @@ if TYPE_CHECKING:
 
 
 class GalleryStill:
+    __slots__ = ("_obj", "parent_obj")
+
     def __init__(
         self, parent_obj: "PyRemoteGalleryStillAlbum", obj: "PyRemoteGalleryStill"
     ) -> None:
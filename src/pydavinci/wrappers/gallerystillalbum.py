@@ -9,6 +9,8 @@ if TYPE_CHECKING:
 
 
 class GalleryStillAlbum:
+    __slots__ = ("_obj", "parent_obj")
+
     def __init__(
         self,
         parent_obj: "PyRemoteGallery",
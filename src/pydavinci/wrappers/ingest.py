@@ -0,0 +1,151 @@
+"""
+Chunked media import for [``MediaPool.ingest``][pydavinci.wrappers.mediapool.MediaPool.ingest].
+
+The resume journal is a JSON lines file with one line per imported chunk:
+``{"imported": [...], "failed": [...]}``. Paths imported by a previous run are skipped,
+failed ones are tried again.
+"""
+
+import json
+import os
+from typing import TYPE_CHECKING, Callable, Iterable, List, Optional, Sequence, Set
+
+from pydavinci.wrappers.storagewalk import scan_tree
+
+if TYPE_CHECKING:
+    from pydavinci.wrappers.mediapool import MediaPool
+
+
+class IngestReport:
+    """Outcome of a [``MediaPool.ingest``][pydavinci.wrappers.mediapool.MediaPool.ingest] run.
+
+    Attributes:
+        imported (List[str]): paths imported by this run
+        skipped (List[str]): paths already in the media pool or imported by a previous run
+        failed (List[str]): paths Davinci Resolve didn't import
+        chunks (int): ``ImportMedia`` calls made
+    """
+
+    __slots__ = ("imported", "skipped", "failed", "chunks")
+
+    def __init__(self) -> None:
+        self.imported: List[str] = []
+        self.skipped: List[str] = []
+        self.failed: List[str] = []
+        self.chunks = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"IngestReport(imported: {len(self.imported)}, skipped: {len(self.skipped)}, "
+            f"failed: {len(self.failed)}, chunks: {self.chunks})"
+        )
+
+
+def expand_paths(
+    paths: Iterable[str], extensions: Optional[Sequence[str]] = None, workers: int = 8
+) -> List[str]:
+    """
+    Expands directories in ``paths`` to the files they hold, recursively. Directories of the
+    same depth are listed in parallel.
+
+    Args:
+        paths (Iterable[str]): files and directories
+        extensions (Sequence[str], optional): only keep files with these extensions, like ``[".mov", ".mxf"]``. Case insensitive.
+        workers (int, optional): directories listed at once. Defaults to ``8``.
+
+    Returns:
+        (List[str]): files, in the order of ``paths`` and sorted within each directory given
+    """
+    wanted = {ext.lower() for ext in extensions} if extensions else None
+
+    def keep(path: str) -> bool:
+        return wanted is None or os.path.splitext(path)[1].lower() in wanted
+
+    result: List[str] = []
+    for path in paths:
+        if not os.path.isdir(path):
+            if keep(path):
+                result.append(path)
+            continue
+        files = [f for found in scan_tree([path], workers) for f in found if keep(f)]
+        result.extend(sorted(files))
+    return result
+
+
+def read_journal(path: str) -> Set[str]:
+    """
+    Returns paths recorded as imported in the resume journal ``path``
+
+    Args:
+        path (str): journal file, missing files are read as empty
+
+    Returns:
+        (Set[str]): imported paths
+    """
+    done: Set[str] = set()
+    if not os.path.exists(path):
+        return done
+    with open(path) as f:
+        for line in f:
+            try:
+                done.update(json.loads(line).get("imported", []))
+            except json.JSONDecodeError:
+                # last line of an interrupted run
+                continue
+    return done
+
+
+def ingest(
+    pool: "MediaPool",
+    paths: Iterable[str],
+    chunk_size: int = 500,
+    journal: Optional[str] = None,
+    progress: Optional[Callable[[int, int], None]] = None,
+    extensions: Optional[Sequence[str]] = None,
+    workers: int = 8,
+) -> IngestReport:
+    """Imports ``paths`` in chunks, see [``MediaPool.ingest``][pydavinci.wrappers.mediapool.MediaPool.ingest]."""
+    from pydavinci.wrappers.metadatatable import read_table
+
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+
+    report = IngestReport()
+    index = pool.index()
+    index._build_clips()
+    done = read_journal(journal) if journal else set()
+
+    pending: List[str] = []
+    seen: Set[str] = set()
+    for path in expand_paths(paths, extensions, workers):
+        if path in seen:
+            continue
+        seen.add(path)
+        if path in done or index.has_file_path(path):
+            report.skipped.append(path)
+        else:
+            pending.append(path)
+
+    total = len(pending)
+    if progress is not None:
+        progress(0, total)
+    for start in range(0, total, chunk_size):
+        chunk = pending[start : start + chunk_size]
+        clips = pool.import_media(chunk)
+        report.chunks += 1
+        if len(clips) == len(chunk):
+            # one clip per file, everything was imported
+            imported, failed = chunk, []
+        else:
+            table = read_table([clip._obj for clip in clips], ["File Path"], ["properties"])
+            found = set(table["File Path"])
+            imported = [path for path in chunk if path in found]
+            failed = [path for path in chunk if path not in found]
+        report.imported.extend(imported)
+        report.failed.extend(failed)
+        if journal:
+            with open(journal, "a") as f:
+                f.write(json.dumps({"imported": imported, "failed": failed}) + "\n")
+        if progress is not None:
+            progress(start + len(chunk), total)
+    return report
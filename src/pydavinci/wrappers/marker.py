@@ -1,8 +1,26 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
-
-from typing_extensions import Literal, TypeAlias, TypedDict
+import re
+import time
+from bisect import bisect_left, bisect_right, insort
+from contextlib import contextmanager
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from typing_extensions import Literal, TypeAlias, TypedDict, get_args
 
 import pydavinci.logger as log
+from pydavinci.utils import timecode_to_frames
 
 if TYPE_CHECKING:
     from pydavinci.wrappers._resolve_stubs import (
@@ -10,6 +28,7 @@ if TYPE_CHECKING:
         PyRemoteTimeline,
         PyRemoteTimelineItem,
     )
+    from pydavinci.wrappers.markerio import MarkerImportReport
     from pydavinci.wrappers.mediapoolitem import MediaPoolItem
     from pydavinci.wrappers.timeline import Timeline
     from pydavinci.wrappers.timelineitem import TimelineItem
@@ -43,6 +62,14 @@ class MarkerData(TypedDict):
 
 ATTRS = Literal["frameid", "customdata", "color", "name", "duration", "note"]
 
+REFRESH = Literal["never", "ttl", "always"]
+
+SEARCH_FIELDS = ("color", "name", "customdata", "note")
+
+MATCH = Literal["exact", "prefix", "substring", "token"]
+
+_TOKEN = re.compile(r"\w+")
+
 COLORS = Literal[
     "Blue",
     "Cyan",
@@ -64,11 +91,171 @@ COLORS = Literal[
 
 
 class MarkerCollection:
-    def __init__(self, obj: "PydavinciParent") -> None:
+    """Markers of a `Timeline`, `TimelineItem` or `MediaPoolItem`.
+
+    Markers are only fetched from Davinci Resolve the first time they're needed. After that,
+    ``refresh`` decides when reads (``all``, iterating, ``find`` ...) fetch them again:
+
+    - ``"never"``: trust the local cache. A `MarkerCollection` knows about every marker it added,
+    deleted or updated, so this is only stale if markers are changed elsewhere, like in the GUI.
+    Call [``fetch()``][pydavinci.wrappers.marker.MarkerCollection.fetch] to pick those up.
+    - ``"ttl"``: fetch again if the cache is older than ``ttl`` seconds.
+    - ``"always"``: fetch again on every read.
+
+    Args:
+        obj: parent `Timeline`, `TimelineItem` or `MediaPoolItem`
+        refresh (str, optional): refresh policy. Defaults to
+            [``MarkerCollection.default_refresh``][pydavinci.wrappers.marker.MarkerCollection.default_refresh].
+        ttl (float, optional): seconds before the cache goes stale with the ``"ttl"`` policy.
+    """
+
+    __slots__ = (
+        "_obj",
+        "_parent_obj",
+        "_cache",
+        "_index",
+        "_tokens",
+        "_indexed",
+        "_sorted",
+        "_frames",
+        "_max_duration",
+        "_fetched_at",
+        "_batch",
+        "_callbacks",
+        "refresh",
+        "ttl",
+    )
+
+    default_refresh: REFRESH = "never"
+    """Refresh policy for new `MarkerCollection`s"""
+    default_ttl: float = 5.0
+    """Time to live in seconds for new `MarkerCollection`s using the ``"ttl"`` policy"""
+
+    def __init__(
+        self,
+        obj: "PydavinciParent",
+        refresh: Optional[REFRESH] = None,
+        ttl: Optional[float] = None,
+    ) -> None:
         self._obj: "PydavinciParent" = obj
         self._parent_obj: "RemoteMarkerParent" = obj._obj
         self._cache: Dict[int, Marker] = {}
-        self.fetch()
+        # field -> value -> frames, kept in sync by ``_cache_add`` and ``_cache_del``
+        self._index: Dict[str, Dict[str, Set[int]]] = {field: {} for field in SEARCH_FIELDS}
+        self._tokens: Dict[str, Set[int]] = {}
+        self._indexed: Dict[int, Tuple[str, str, str, str]] = {}
+        self._sorted: Optional[List[Tuple[str, str]]] = None
+        # sorted frames of ``_cache`` and an upper bound of marker durations, for range queries
+        self._frames: List[int] = []
+        self._max_duration = 1
+        self._fetched_at: Optional[float] = None
+        # frame -> marker data in Davinci Resolve before the batch, ``None`` if there was none
+        self._batch: Optional[Dict[int, Optional[MarkerData]]] = None
+        self._callbacks: List[Callable[["MarkerChanges"], None]] = []
+        self.refresh: REFRESH = refresh or self.default_refresh
+        self.ttl: float = self.default_ttl if ttl is None else ttl
+
+    @property
+    def loaded(self) -> bool:
+        """``True`` once markers have been fetched from Davinci Resolve."""
+        return self._fetched_at is not None
+
+    @property
+    def stale(self) -> bool:
+        """``True`` if the next read will fetch markers from Davinci Resolve."""
+        if self._fetched_at is None or self.refresh == "always":
+            return True
+        if self.refresh == "ttl":
+            return time.monotonic() - self._fetched_at >= self.ttl
+        return False
+
+    def _load(self) -> None:
+        # before changing markers we only need to know what's there once
+        if self._fetched_at is None:
+            self.fetch()
+
+    def _ensure_fresh(self) -> None:
+        # a fetch in the middle of a batch would bring back markers not yet sent
+        if self.stale and self._batch is None:
+            self.fetch()
+
+    @contextmanager
+    def batch(self) -> Iterator["MarkerCollection"]:
+        """
+        Groups marker changes and sends them to Davinci Resolve when the ``with`` block ends.
+
+        Inside the block, adding, deleting and editing markers only changes the local cache.
+        On exit, each touched frame is compared with what Davinci Resolve had before the
+        block and only the needed ``DeleteMarkerAtFrame``, ``AddMarker`` and
+        ``UpdateMarkerCustomData`` calls are made. Markers that end up unchanged cost nothing.
+        If the block raises, the local cache is rolled back and nothing is sent.
+
+        ```python
+        with timeline.markers.batch():
+            for marker in timeline.markers:
+                marker.color = "Green"
+                marker.note = "approved"
+        ```
+
+        Yields:
+            (MarkerCollection): this collection
+        """
+        if self._batch is not None:
+            yield self
+            return
+
+        self._load()
+        self._batch = {}
+        try:
+            yield self
+        except BaseException:
+            before, self._batch = self._batch, None
+            self._rollback(before)
+            raise
+        before, self._batch = self._batch, None
+        self._commit(before)
+
+    def _touch(self, frameid: int) -> None:
+        if self._batch is not None and frameid not in self._batch:
+            marker = self._cache.get(frameid)
+            self._batch[frameid] = marker._data if marker else None
+
+    def _rollback(self, before: Dict[int, Optional[MarkerData]]) -> None:
+        for frameid, data in before.items():
+            if frameid in self._cache:
+                self._cache_del(self._cache[frameid])
+            if data is not None:
+                self._cache_add(Marker(self, self._parent_obj, data, frameid))
+
+    def _commit(self, before: Dict[int, Optional[MarkerData]]) -> None:
+        adds: List[Marker] = []
+        for frameid in sorted(before):
+            old = before[frameid]
+            marker = self._cache.get(frameid)
+            new = marker._data if marker else None
+            if old == new:
+                continue
+            if old is not None and new is not None and _only_customdata_changed(old, new):
+                self._parent_obj.UpdateMarkerCustomData(frameid, new["customdata"])
+                continue
+            if old is not None:
+                self._parent_obj.DeleteMarkerAtFrame(frameid)
+            if marker is not None:
+                adds.append(marker)
+
+        # deletes first, a marker may have moved to a frame that was freed in the same batch
+        for marker in adds:
+            data = marker._data
+            if not self._parent_obj.AddMarker(
+                marker._frameid,
+                data["color"],
+                data["name"],
+                data["note"],
+                data["duration"],
+                data["customdata"],
+            ):
+                log.error(f"Couldn't add marker at frame {marker._frameid} when ending batch.")
+                self._cache_del(marker)
 
     def add(
         self,
@@ -101,6 +288,7 @@ class MarkerCollection:
         """
         # return self._parent_obj.AddMarker(frameid, color, name, note, duration, customdata)
 
+        self._load()
         if frameid in self._cache:
             if not overwrite:
                 log.info(
@@ -112,7 +300,10 @@ class MarkerCollection:
                 f = frameid
                 self.delete(frameid=f)
 
-        if self._parent_obj.AddMarker(frameid, color, name, note, duration, customdata):
+        self._touch(frameid)
+        if self._batch is not None or self._parent_obj.AddMarker(
+            frameid, color, name, note, duration, customdata
+        ):
 
             data: "MarkerData" = {
                 "frameid": frameid,
@@ -133,42 +324,179 @@ class MarkerCollection:
             )
             return None  # type: ignore
 
+    def _matches(self, needle: str) -> Set[int]:
+        frames: Set[int] = set()
+        for field in SEARCH_FIELDS:
+            frames.update(self._index[field].get(needle, ()))
+        return frames
+
     def find(self, needle: str) -> Optional["Marker"]:
         """Finds the first marker that matches `needle` for the `Marker's` `note`, `name`, `customdata` or `color`.
 
         Returns:
-            (Marker): first marker found with matching query
+            (Marker): marker with the lowest frame with matching query
         """
-
-        for marker in self._cache.values():
-            if (
-                needle == marker.note
-                or needle == marker.name
-                or needle == marker.customdata
-                or needle == marker.color
-            ):
-                return marker
-
-        return None
+        self._ensure_fresh()
+        frames = self._matches(needle)
+        return self._cache[min(frames)] if frames else None
 
     def find_all(self, needle: str) -> Optional[List["Marker"]]:
         """Finds all markers that match `needle` for the `Marker's` `note`, `name`, `customdata` or `color`.
 
         Returns:
-            (Optional[List[Marker]]): all markers found or if none found, returns `None`
+            (Optional[List[Marker]]): all markers found sorted by frame, or if none found, returns `None`
         """
-        _ret: List[Marker] = []
-
-        for marker in self._cache.values():
-            if (
-                needle == marker.note
-                or needle == marker.name
-                or needle == marker.customdata
-                or needle == marker.color
-            ):
-                _ret.append(marker)
+        self._ensure_fresh()
+        frames = self._matches(needle)
+        return [self._cache[frame] for frame in sorted(frames)] if frames else None
+
+    def search(
+        self,
+        text: str,
+        *,
+        match: MATCH = "prefix",
+        fields: Sequence[str] = SEARCH_FIELDS,
+    ) -> List["Marker"]:
+        """
+        Searches markers by ``color``, ``name``, ``customdata`` or ``note``.
+
+        Match modes:
+            ``"exact"``: value equals ``text``, like [``find_all``][pydavinci.wrappers.marker.MarkerCollection.find_all]
+
+            ``"prefix"``: value starts with ``text``
+
+            ``"substring"``: value contains ``text``
+
+            ``"token"``: ``note`` contains the word ``text``, case insensitive. ``fields`` is ignored.
+
+        Args:
+            text (str): text to look for
+            match (str, optional): match mode. Defaults to ``"prefix"``.
+            fields (Sequence[str], optional): fields to search. Defaults to all of them.
+
+        Raises:
+            ValueError: not a valid match mode or field
+
+        Returns:
+            (List[Marker]): matching markers sorted by frame
+        """
+        for field in fields:
+            if field not in SEARCH_FIELDS:
+                raise ValueError(f"Can't search markers by {field!r}. Use one of {SEARCH_FIELDS}")
+
+        self._ensure_fresh()
+        frames: Set[int] = set()
+        if match == "token":
+            frames.update(self._tokens.get(text.lower(), ()))
+        elif match == "exact":
+            for field in fields:
+                frames.update(self._index[field].get(text, ()))
+        elif match in ("prefix", "substring"):
+            for value, field in self._search_values(text, match == "prefix"):
+                if field in fields:
+                    frames.update(self._index[field][value])
+        else:
+            raise ValueError(f"Not a valid match mode: {match!r}")
+
+        return [self._cache[frame] for frame in sorted(frames)]
+
+    def _search_values(self, text: str, prefix: bool) -> Iterable[Tuple[str, str]]:
+        # distinct (value, field) pairs, sorted so prefixes are a contiguous run
+        if self._sorted is None:
+            self._sorted = sorted(
+                (value, field) for field, values in self._index.items() for value in values
+            )
+        values = self._sorted
+        if not prefix:
+            return [pair for pair in values if text in pair[0]]
+
+        found = []
+        for i in range(bisect_left(values, (text, "")), len(values)):
+            if not values[i][0].startswith(text):
+                break
+            found.append(values[i])
+        return found
+
+    def in_range(self, start: int, end: int) -> List["Marker"]:
+        """
+        Returns markers placed from ``start`` up to, but not including, ``end``
+
+        Args:
+            start (int): first frame
+            end (int): frame after the last one
+
+        Returns:
+            (List[Marker]): markers sorted by frame
+        """
+        self._ensure_fresh()
+        frames = self._frames
+        return [
+            self._cache[f] for f in frames[bisect_left(frames, start) : bisect_left(frames, end)]
+        ]
+
+    def overlapping(self, start: int, end: int) -> List["Marker"]:
+        """
+        Returns markers whose span, ``frameid`` to ``frameid + duration``, overlaps ``[start, end)``
+
+        Args:
+            start (int): first frame of the window
+            end (int): frame after the last one of the window
+
+        Returns:
+            (List[Marker]): markers sorted by frame
+        """
+        # no marker starting before ``start - max duration`` can reach the window
+        return [
+            marker
+            for marker in self.in_range(start - self._max_duration + 1, end)
+            if marker.frameid + marker.duration > start
+        ]
+
+    def before(self, frame: int) -> Optional["Marker"]:
+        """
+        Returns the last marker before ``frame``
+
+        Args:
+            frame (int): frame
+
+        Returns:
+            (Optional[Marker]): marker, or ``None`` if there's none before ``frame``
+        """
+        self._ensure_fresh()
+        i = bisect_left(self._frames, frame)
+        return self._cache[self._frames[i - 1]] if i else None
+
+    def after(self, frame: int) -> Optional["Marker"]:
+        """
+        Returns the first marker after ``frame``
+
+        Args:
+            frame (int): frame
+
+        Returns:
+            (Optional[Marker]): marker, or ``None`` if there's none after ``frame``
+        """
+        self._ensure_fresh()
+        i = bisect_right(self._frames, frame)
+        return self._cache[self._frames[i]] if i < len(self._frames) else None
+
+    def nearest(self, frame: int) -> Optional["Marker"]:
+        """
+        Returns the marker closest to ``frame``. On a tie, the earlier one.
+
+        Args:
+            frame (int): frame
 
-        return _ret if _ret else None
+        Returns:
+            (Optional[Marker]): marker, or ``None`` if there are no markers
+        """
+        self._ensure_fresh()
+        frames = self._frames
+        i = bisect_left(frames, frame)
+        candidates = frames[max(i - 1, 0) : i + 1]
+        if not candidates:
+            return None
+        return self._cache[min(candidates, key=lambda f: (abs(f - frame), f))]
 
     def get_custom(self, customdata: str) -> Dict[Any, Any]:
         """
@@ -211,30 +539,192 @@ class MarkerCollection:
             When selecting by ``customdata``, will delete first marker with matching custom data
         """
 
+        self._load()
+        if self._batch is not None:
+            return self._delete_batched(frameid, color, customdata)
+
         if frameid:
-            del self._cache[frameid]
+            if frameid in self._cache:
+                self._cache_del(self._cache[frameid])
             return self._parent_obj.DeleteMarkerAtFrame(frameid)
         elif color:
-            # Delete all entries in the cache that are not the specified color
             # DeleteMarkersByColor() deletes all with that specified color
-            self._cache = {
-                frame: marker for frame, marker in self._cache.items() if marker.color != color
-            }
+            for frame in list(self._index["color"].get(color, ())):
+                self._cache_del(self._cache[frame])
             return self._parent_obj.DeleteMarkersByColor(color)
 
         elif customdata:
-            # DeleteMarkerByCustomData deletes the first frame entry with the specified customdata,
-            # so we're grabbing the keys and sorting them to ensure we delete the right entry in our
-            # cache
-
-            sorted = list(self._cache.keys())
-            sorted.sort()
-            self._parent_obj.DeleteMarkerByCustomData(customdata)
-            del self._cache[sorted[0]]
-            return True
+            # DeleteMarkerByCustomData deletes the first frame entry with the specified customdata
+            frames = self._index["customdata"].get(customdata)
+            if frames:
+                self._cache_del(self._cache[min(frames)])
+            return self._parent_obj.DeleteMarkerByCustomData(customdata)
 
         raise ValueError("You need to provide either 'frameid', 'color' or 'customdata'")
 
+    def _delete_batched(self, frameid: int, color: str, customdata: str) -> bool:
+        if frameid:
+            frames = [frameid] if frameid in self._cache else []
+        elif color:
+            frames = list(self._index["color"].get(color, ()))
+        elif customdata:
+            frames = sorted(self._index["customdata"].get(customdata, ()))[:1]
+        else:
+            raise ValueError("You need to provide either 'frameid', 'color' or 'customdata'")
+
+        for frame in frames:
+            self._touch(frame)
+            self._cache_del(self._cache[frame])
+        return bool(frames)
+
+    def _update_customdata(self, marker: "Marker", customdata: str) -> None:
+        self._touch(marker._frameid)
+        if self._batch is not None or self._parent_obj.UpdateMarkerCustomData(
+            marker._frameid, customdata
+        ):
+            marker._customdata = customdata
+            self._cache_add(marker)
+
+    def _frame_limit(self) -> Optional[int]:
+        # markers must be placed before the end of their parent
+        from pydavinci.wrappers.timeline import Timeline
+        from pydavinci.wrappers.timelineitem import TimelineItem
+
+        parent = self._parent_obj
+        if isinstance(self._obj, Timeline):
+            return parent.GetEndFrame() - parent.GetStartFrame() or None  # type: ignore
+        if isinstance(self._obj, TimelineItem):
+            return parent.GetDuration() or None  # type: ignore
+        frames = str(parent.GetClipProperty("Frames"))  # type: ignore
+        return int(frames) if frames.isdigit() else None
+
+    def _timecode_base(self) -> Tuple[int, int]:
+        # frame rate and first frame of timecodes for markers of this parent
+        import pydavinci.main
+        from pydavinci.wrappers.timeline import Timeline
+        from pydavinci.wrappers.timelineitem import TimelineItem
+
+        parent = self._parent_obj
+        if isinstance(self._obj, Timeline):
+            return round(float(parent.GetSetting("timelineFrameRate"))), parent.GetStartFrame()  # type: ignore
+        if isinstance(self._obj, TimelineItem):
+            project = pydavinci.main.resolve_obj.GetProjectManager().GetCurrentProject()
+            return round(float(project.GetSetting("timelineFrameRate"))), parent.GetStart()  # type: ignore
+        fps = round(float(parent.GetClipProperty("FPS")))  # type: ignore
+        return fps, timecode_to_frames(parent.GetClipProperty("Start TC"), fps)  # type: ignore
+
+    def import_markers(
+        self,
+        source: Union[str, Iterable[Dict[str, Any]]],
+        format: Optional[str] = None,
+        *,
+        overwrite: bool = False,
+        fps: Optional[int] = None,
+        start_frame: Optional[int] = None,
+    ) -> "MarkerImportReport":
+        """
+        Adds markers in bulk from a file or from an iterable of ``dict``s with
+        [``MarkerData``][pydavinci.wrappers.marker.MarkerData] keys.
+
+        Rows are streamed, so files of any size can be imported. The parent's frame range is
+        read once for the whole run, markers already in the collection are skipped (or replaced
+        with ``overwrite``) and rows that fail are reported instead of stopping the import.
+        See [``pydavinci.wrappers.markerio``][pydavinci.wrappers.markerio] for the formats.
+
+        Args:
+            source (Union[str, Iterable[dict]]): file path or marker rows
+            format (str, optional): ``"csv"``, ``"jsonl"`` or ``"edl"``. Guessed from the file extension if not provided.
+            overwrite (bool, optional): replace markers already at the same frame. Defaults to ``False``.
+            fps (int, optional): frame rate of EDL timecodes. Defaults to the parent's frame rate.
+            start_frame (int, optional): frame of the EDL timecode of marker frame ``0``. Defaults to the parent's start.
+
+        Returns:
+            (MarkerImportReport): frames added and skipped, and rows that failed
+        """
+        from pydavinci.wrappers.markerio import (
+            MarkerImportReport,
+            guess_format,
+            parse_rows,
+            read_markers,
+        )
+
+        self._ensure_fresh()
+        if isinstance(source, str):
+            fmt = format or guess_format(source)
+            if fmt == "edl" and (fps is None or start_frame is None):
+                base_fps, base_start = self._timecode_base()
+                fps = base_fps if fps is None else fps
+                start_frame = base_start if start_frame is None else start_frame
+            rows = read_markers(source, fmt, fps or 24, start_frame or 0)
+        else:
+            rows = parse_rows(source)
+
+        limit = self._frame_limit()
+        report = MarkerImportReport()
+        for number, data in rows:
+            if isinstance(data, Exception):
+                report.failed.append((number, str(data)))
+                continue
+
+            frameid = data["frameid"]
+            if frameid < 0 or (limit is not None and frameid >= limit):
+                report.failed.append((number, f"frame {frameid} is outside 0-{limit}"))
+                continue
+            if frameid in self._cache:
+                if not overwrite:
+                    report.skipped.append(frameid)
+                    continue
+                self._parent_obj.DeleteMarkerAtFrame(frameid)
+                self._cache_del(self._cache[frameid])
+
+            if self._parent_obj.AddMarker(
+                frameid,
+                data["color"],
+                data["name"],
+                data["note"],
+                data["duration"],
+                data["customdata"],
+            ):
+                self._cache_add(Marker(self, self._parent_obj, data, frameid))
+                report.added.append(frameid)
+            else:
+                report.failed.append((number, f"Davinci Resolve refused marker at frame {frameid}"))
+
+        return report
+
+    def export_markers(
+        self,
+        path: str,
+        format: Optional[str] = None,
+        *,
+        fps: Optional[int] = None,
+        start_frame: Optional[int] = None,
+    ) -> int:
+        """
+        Writes all markers, sorted by frame, to ``path``.
+        See [``pydavinci.wrappers.markerio``][pydavinci.wrappers.markerio] for the formats.
+
+        Args:
+            path (str): output file
+            format (str, optional): ``"csv"``, ``"jsonl"`` or ``"edl"``. Guessed from the file extension if not provided.
+            fps (int, optional): frame rate of EDL timecodes. Defaults to the parent's frame rate.
+            start_frame (int, optional): frame of the EDL timecode of marker frame ``0``. Defaults to the parent's start.
+
+        Returns:
+            int: number of markers written
+        """
+        from pydavinci.wrappers.markerio import guess_format, write_markers
+
+        fmt = format or guess_format(path)
+        if fmt == "edl" and (fps is None or start_frame is None):
+            base_fps, base_start = self._timecode_base()
+            fps = base_fps if fps is None else fps
+            start_frame = base_start if start_frame is None else start_frame
+
+        self._ensure_fresh()
+        markers = (self._cache[frame] for frame in self._frames)
+        return write_markers(markers, path, fmt, fps or 24, start_frame or 0)
+
     def delete_all(self) -> None:
         """Deletes all markers"""
         for marker in self.all:
@@ -247,17 +737,43 @@ class MarkerCollection:
         Returns:
             (List[Marker])
         """
-        self.fetch()
+        self._ensure_fresh()
         return list(self._cache.values())
 
     def _cache_add(self, marker: "Marker") -> None:
-        self._cache.update({marker._frameid: marker})
+        frameid = marker._frameid
+        if frameid not in self._cache:
+            insort(self._frames, frameid)
+        self._unindex(frameid)
+        self._cache[frameid] = marker
+        self._max_duration = max(self._max_duration, marker.duration)
+
+        keys = (marker.color, marker.name, marker.customdata, marker.note)
+        self._indexed[frameid] = keys
+        for field, value in zip(SEARCH_FIELDS, keys, strict=True):
+            self._index[field].setdefault(value, set()).add(frameid)
+        for token in _TOKEN.findall(marker.note.lower()):
+            self._tokens.setdefault(token, set()).add(frameid)
+        self._sorted = None
 
     def _cache_del(self, marker: "Marker") -> None:
-        del self._cache[marker.frameid]
+        self._unindex(marker._frameid)
+        del self._cache[marker._frameid]
+        del self._frames[bisect_left(self._frames, marker._frameid)]
+
+    def _unindex(self, frameid: int) -> None:
+        # uses the values the marker had when indexed, it may have changed since
+        keys = self._indexed.pop(frameid, None)
+        if keys is None:
+            return
+        for field, value in zip(SEARCH_FIELDS, keys, strict=True):
+            _discard(self._index[field], value, frameid)
+        for token in _TOKEN.findall(keys[3].lower()):
+            _discard(self._tokens, token, frameid)
+        self._sorted = None
 
     def __iter__(self):  # type: ignore
-        self.fetch()
+        self._ensure_fresh()
         cache = self._cache.copy()
         yield from cache.values()
 
@@ -272,32 +788,108 @@ class MarkerCollection:
             displaystr = ", ".join(display)
             return f"Markers(Frames: {displaystr})"
 
-    def fetch(self) -> None:
+    def on_change(self, callback: Callable[["MarkerChanges"], None]) -> None:
+        """
+        Registers ``callback`` to be called with the [``MarkerChanges``][pydavinci.wrappers.marker.MarkerChanges]
+        every time a [``fetch()``][pydavinci.wrappers.marker.MarkerCollection.fetch] finds markers
+        changed in Davinci Resolve.
+
+        Args:
+            callback (Callable[[MarkerChanges], None]): function to call
+        """
+        self._callbacks.append(callback)
+
+    def fetch(self) -> "MarkerChanges":
         """
         Fetch all markers from Davinci Resolve and updates `MarkerCollection`s internal cache. You probably won't need to use this.
 
+        The cache is diffed against what Davinci Resolve returns: existing `Marker`s are kept and
+        updated in place, new ones are added and the ones gone are dropped.
+
         Why not:
             You would only use this if during the middle of the script execution a user manually added a marker. Otherwise, a `MarkerCollection` knows about all the markers
-            it has deleted, added or updated, and `.fetch() ` is run on the class initialization.
+            it has deleted, added or updated, and `.fetch() ` is run the first time markers are needed.
 
+        Returns:
+            (MarkerChanges): frames added, removed and changed since the last time
         """
-        markers: RemoteMarkerData = self._parent_obj.GetMarkers()
-        if markers:
-            for frameid in markers:
-                marker: MarkerData = {
-                    "frameid": frameid,
-                    "color": markers[frameid]["color"],
-                    "duration": markers[frameid]["duration"],
-                    "name": markers[frameid]["name"],
-                    "customdata": markers[frameid]["customData"],
-                    "note": markers[frameid]["note"],
-                }
-                self._cache_add(Marker(self, self._parent_obj, marker, frameid))
+        markers: RemoteMarkerData = self._parent_obj.GetMarkers() or {}
+        first = self._fetched_at is None
+        self._fetched_at = time.monotonic()
+        changes = MarkerChanges()
 
-        return
+        for frameid in [f for f in self._cache if f not in markers]:
+            self._cache_del(self._cache[frameid])
+            changes.removed.add(frameid)
+
+        for frameid, remote in markers.items():
+            data: MarkerData = {
+                "frameid": frameid,
+                "color": remote["color"],
+                "duration": remote["duration"],
+                "name": remote["name"],
+                "customdata": remote["customData"],
+                "note": remote["note"],
+            }
+            marker = self._cache.get(frameid)
+            if marker is None:
+                self._cache_add(Marker(self, self._parent_obj, data, frameid))
+                changes.added.add(frameid)
+            elif marker._data != data:
+                marker._set_data(data)
+                self._cache_add(marker)
+                changes.changed.add(frameid)
+
+        # the first fetch only loads what's there, nothing changed
+        if changes and not first:
+            for callback in self._callbacks:
+                callback(changes)
+        return changes
+
+
+class MarkerChanges:
+    """Frames whose markers changed in Davinci Resolve, as found by
+    [``MarkerCollection.fetch``][pydavinci.wrappers.marker.MarkerCollection.fetch].
+    """
+
+    __slots__ = ("added", "removed", "changed")
+
+    def __init__(self) -> None:
+        self.added: Set[int] = set()
+        self.removed: Set[int] = set()
+        self.changed: Set[int] = set()
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    def __repr__(self) -> str:
+        return f"MarkerChanges(added: {sorted(self.added)}, removed: {sorted(self.removed)}, changed: {sorted(self.changed)})"
+
+
+def _only_customdata_changed(old: "MarkerData", new: "MarkerData") -> bool:
+    return all(old[k] == new[k] for k in old if k != "customdata")  # type: ignore
+
+
+def _discard(index: Dict[str, Set[int]], key: str, frameid: int) -> None:
+    frames = index.get(key)
+    if frames is not None:
+        frames.discard(frameid)
+        if not frames:
+            del index[key]
 
 
 class Marker:
+    __slots__ = (
+        "_interface",
+        "_parent_obj",
+        "_frameid",
+        "_color",
+        "_name",
+        "_note",
+        "_duration",
+        "_customdata",
+    )
+
     def __init__(
         self,
         interface: "MarkerCollection",
@@ -305,11 +897,30 @@ class Marker:
         data: "MarkerData",
         frameid: int,
     ) -> None:
-        pass
-        self._frameid = frameid
-        self._data = data
         self._parent_obj = parent
         self._interface = interface
+        self._set_data(data)
+        self._frameid = frameid
+
+    @property
+    def _data(self) -> "MarkerData":
+        # fields are kept in slots, this builds a fresh ``MarkerData`` every time
+        return {
+            "frameid": self._frameid,
+            "color": self._color,
+            "name": self._name,
+            "note": self._note,
+            "duration": self._duration,
+            "customdata": self._customdata,
+        }
+
+    def _set_data(self, data: "MarkerData") -> None:
+        self._frameid = data["frameid"]
+        self._color = data["color"]
+        self._name = data["name"]
+        self._note = data["note"]
+        self._duration = data["duration"]
+        self._customdata = data["customdata"]
 
     def delete(self) -> None:
         """Deletes this `Marker`"""
@@ -319,7 +930,7 @@ class Marker:
     @property
     def frameid(self) -> int:
         """Gets or changes this `Marker`'s `frameid`"""
-        return self._data["frameid"]
+        return self._frameid
 
     @frameid.setter
     def frameid(self, frameid: int) -> None:
@@ -330,18 +941,16 @@ class Marker:
     @property
     def customdata(self) -> str:
         """Gets or changes this `Marker`'s `customdata`"""
-        return self._data["customdata"]
+        return self._customdata
 
     @customdata.setter
     def customdata(self, customdata: str) -> None:
-        if self._parent_obj.UpdateMarkerCustomData(self._frameid, customdata):
-            self._data["customdata"] = customdata
-            self._interface._cache_add(self)
+        self._interface._update_customdata(self, customdata)
 
     @property
     def name(self) -> str:
         """Gets or changes this `Marker`'s `name`"""
-        return self._data["name"]
+        return self._name
 
     @name.setter
     def name(self, name: str) -> None:
@@ -351,13 +960,11 @@ class Marker:
     @property
     def color(self) -> str:
         """Gets or changes this `Marker`'s `color`"""
-        return self._data["color"]
+        return self._color
 
     @color.setter
     def color(self, color: Literal[COLORS]) -> None:
-        # we don't have get_items on 3.6,
-        # TODO update when support Davinci v18 and Python > 3.7
-        if color not in COLORS.__values__:  # type: ignore
+        if color not in get_args(COLORS):
             return
         self.delete()
         self._update("color", color)
@@ -365,7 +972,7 @@ class Marker:
     @property
     def duration(self) -> int:
         """Gets or changes this `Marker`'s `duration`"""
-        return self._data["duration"]
+        return self._duration
 
     @duration.setter
     def duration(self, duration: int) -> None:
@@ -375,7 +982,7 @@ class Marker:
     @property
     def note(self) -> str:
         """Gets or changes this `Marker`'s `note`"""
-        return self._data["note"]
+        return self._note
 
     @note.setter
     def note(self, note: str) -> None:
@@ -383,14 +990,14 @@ class Marker:
         self._update("note", note)
 
     def _update(self, key: ATTRS, value: Union[str, int]) -> None:
-        self._data[key] = value  # type: ignore
+        setattr(self, f"_{key}", value)
         self._interface.add(
-            frameid=self._data["frameid"],
-            color=self._data["color"],  # type: ignore
-            name=self._data["name"],
-            note=self._data["note"],
-            duration=self._data["duration"],
-            customdata=self._data["customdata"],
+            frameid=self._frameid,
+            color=self._color,  # type: ignore
+            name=self._name,
+            note=self._note,
+            duration=self._duration,
+            customdata=self._customdata,
         )
         return
 
@@ -0,0 +1,234 @@
+"""
+Streaming readers and writers for [``MarkerCollection.import_markers``][pydavinci.wrappers.marker.MarkerCollection.import_markers]
+and [``MarkerCollection.export_markers``][pydavinci.wrappers.marker.MarkerCollection.export_markers].
+
+Supported formats:
+    ``"csv"``: header with ``frameid``, ``color``, ``name``, ``note``, ``duration`` and ``customdata``
+
+    ``"jsonl"``: one JSON object per line with the same keys
+
+    ``"edl"``: locator comments, ``* LOC: 01:00:10:12 BLUE name``. Locators only carry a
+    timecode, a color and a name, so ``note`` and ``customdata`` are lost and ``duration`` is ``1``.
+"""
+
+import csv
+import json
+import os
+import re
+from typing import IO, TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Tuple, Union
+
+from typing_extensions import get_args
+
+from pydavinci.utils import frames_to_timecode, timecode_to_frames
+
+if TYPE_CHECKING:
+    from pydavinci.wrappers.marker import Marker, MarkerData
+
+FORMATS = ("csv", "jsonl", "edl")
+FIELDS = ("frameid", "color", "name", "note", "duration", "customdata")
+
+_LOCATOR = re.compile(r"^\*\s*LOC:\s*(\d\d[:;]\d\d[:;]\d\d[:;]\d\d)\s+(\w+)\s*(.*)$")
+# EDL locator colors without a Resolve marker color of the same name
+_LOCATOR_COLORS = {"MAGENTA": "Pink", "WHITE": "Cream", "BLACK": "Cocoa"}
+
+Row = Tuple[int, Union["MarkerData", Exception]]
+
+
+class MarkerImportReport:
+    """Outcome of a [``MarkerCollection.import_markers``][pydavinci.wrappers.marker.MarkerCollection.import_markers] run.
+
+    Attributes:
+        added (List[int]): frames of the markers added
+        skipped (List[int]): frames skipped because a marker was already there
+        failed (List[Tuple[int, str]]): ``(row number, reason)`` of every row that couldn't be added
+    """
+
+    __slots__ = ("added", "skipped", "failed")
+
+    def __init__(self) -> None:
+        self.added: List[int] = []
+        self.skipped: List[int] = []
+        self.failed: List[Tuple[int, str]] = []
+
+    def __repr__(self) -> str:
+        return f"MarkerImportReport(added: {len(self.added)}, skipped: {len(self.skipped)}, failed: {len(self.failed)})"
+
+
+def guess_format(path: str) -> str:
+    """
+    Returns the format of ``path`` from its extension
+
+    Args:
+        path (str): file path
+
+    Raises:
+        ValueError: unknown extension
+
+    Returns:
+        str: ``"csv"``, ``"jsonl"`` or ``"edl"``
+    """
+    ext = os.path.splitext(path)[1].lower().lstrip(".")
+    fmt = {"ndjson": "jsonl", "json": "jsonl"}.get(ext, ext)
+    if fmt not in FORMATS:
+        raise ValueError(f"Can't guess marker format of {path!r}. Use one of {FORMATS}")
+    return fmt
+
+
+def to_marker_data(raw: Dict[str, Any]) -> "MarkerData":
+    """
+    Validates and normalizes one marker row
+
+    Args:
+        raw (dict): row with at least ``frameid``, ``color`` and ``name``
+
+    Raises:
+        ValueError: missing or invalid values
+
+    Returns:
+        (MarkerData): marker data
+    """
+    from pydavinci.wrappers.marker import COLORS
+
+    try:
+        frameid = int(raw["frameid"])
+        color = str(raw["color"])
+        name = str(raw["name"])
+    except KeyError as e:
+        raise ValueError(f"missing {e.args[0]!r}") from None
+    except (TypeError, ValueError):
+        raise ValueError(f"frameid must be an integer, got {raw.get('frameid')!r}") from None
+
+    duration = int(raw.get("duration") or 1)
+    if color not in get_args(COLORS):
+        raise ValueError(f"{color!r} is not a marker color")
+    if duration < 1:
+        raise ValueError(f"duration must be at least 1, got {duration}")
+
+    return {
+        "frameid": frameid,
+        "color": color,
+        "name": name,
+        "note": str(raw.get("note") or ""),
+        "duration": duration,
+        "customdata": str(raw.get("customdata") or raw.get("customData") or ""),
+    }
+
+
+def parse_rows(raws: Iterable[Union[Dict[str, Any], Exception]]) -> Iterator[Row]:
+    """
+    Validates ``raws`` one by one with [``to_marker_data``][pydavinci.wrappers.markerio.to_marker_data]
+
+    Args:
+        raws (Iterable[dict]): marker rows
+
+    Yields:
+        (Tuple[int, Union[MarkerData, Exception]]): row number, starting at ``1``, and data or why it's invalid
+    """
+    for number, raw in enumerate(raws, start=1):
+        if isinstance(raw, Exception):
+            yield number, raw
+            continue
+        try:
+            yield number, to_marker_data(raw)
+        except ValueError as e:
+            yield number, e
+
+
+def _read_jsonl(f: IO[str]) -> Iterator[Union[Dict[str, Any], Exception]]:
+    for line in f:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            yield ValueError(f"invalid JSON: {e}")
+
+
+def _read_edl(f: IO[str], fps: int, start_frame: int) -> Iterator[Dict[str, Any]]:
+    for line in f:
+        match = _LOCATOR.match(line.strip())
+        if match is None:
+            continue
+        timecode, color, text = match.groups()
+        color = _LOCATOR_COLORS.get(color.upper(), color.capitalize())
+        yield {
+            "frameid": timecode_to_frames(timecode, fps) - start_frame,
+            "color": color,
+            "name": text.strip(),
+        }
+
+
+def read_markers(path: str, fmt: str, fps: int = 24, start_frame: int = 0) -> Iterator[Row]:
+    """
+    Streams ``(row number, MarkerData or error)`` pairs from ``path``.
+
+    Args:
+        path (str): file to read
+        fmt (str): ``"csv"``, ``"jsonl"`` or ``"edl"``
+        fps (int, optional): frame rate for EDL timecodes. Defaults to ``24``.
+        start_frame (int, optional): frame of the first EDL timecode marker frame ``0``. Defaults to ``0``.
+
+    Yields:
+        (Tuple[int, Union[MarkerData, Exception]]): row number and data, or why it's invalid
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Not a valid marker format: {fmt!r}. Use one of {FORMATS}")
+
+    with open(path, newline="") as f:
+        if fmt == "csv":
+            yield from parse_rows(csv.DictReader(f))
+        elif fmt == "jsonl":
+            yield from parse_rows(_read_jsonl(f))
+        else:
+            yield from parse_rows(_read_edl(f, fps, start_frame))
+
+
+def write_markers(
+    markers: Iterable["Marker"],
+    path: str,
+    fmt: str,
+    fps: int = 24,
+    start_frame: int = 0,
+    title: str = "Markers",
+) -> int:
+    """
+    Writes ``markers`` to ``path``.
+
+    Args:
+        markers (Iterable[Marker]): markers to write
+        path (str): output file
+        fmt (str): ``"csv"``, ``"jsonl"`` or ``"edl"``
+        fps (int, optional): frame rate for EDL timecodes. Defaults to ``24``.
+        start_frame (int, optional): frame of the first EDL timecode marker frame ``0``. Defaults to ``0``.
+        title (str, optional): EDL title. Defaults to ``"Markers"``.
+
+    Returns:
+        int: number of markers written
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Not a valid marker format: {fmt!r}. Use one of {FORMATS}")
+
+    count = 0
+    with open(path, "w", newline="") as f:
+        if fmt == "csv":
+            writer = csv.DictWriter(f, fieldnames=list(FIELDS))
+            writer.writeheader()
+        elif fmt == "edl":
+            f.write(f"TITLE: {title}\nFCM: NON-DROP FRAME\n\n")
+
+        for marker in markers:
+            count += 1
+            data = {field: getattr(marker, field) for field in FIELDS}
+            if fmt == "csv":
+                writer.writerow(data)
+            elif fmt == "jsonl":
+                f.write(json.dumps(data) + "\n")
+            else:
+                src_in = frames_to_timecode(start_frame + marker.frameid, fps)
+                src_out = frames_to_timecode(start_frame + marker.frameid + 1, fps)
+                f.write(
+                    f"{count:03d}  BL       V     C        {src_in} {src_out} {src_in} {src_out}\n"
+                    f"* LOC: {src_in} {marker.color.upper()} {marker.name}\n\n"
+                )
+    return count
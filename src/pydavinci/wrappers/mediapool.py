@@ -1,17 +1,38 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from pydavinci.main import resolve_obj
 from pydavinci.utils import get_resolveobjs
 from pydavinci.wrappers.folder import Folder
+from pydavinci.wrappers.mediapoolindex import MediaPoolIndex, cached_index, index_for
 from pydavinci.wrappers.mediapoolitem import MediaPoolItem
-from pydavinci.wrappers.timeline import Timeline
+from pydavinci.wrappers.metadatatable import SOURCES
+from pydavinci.wrappers.sequences import DEFAULT_EXTENSIONS, ImageSequence, scan_sequences
+from pydavinci.wrappers.timeline import Timeline, _current_items_changed
 from pydavinci.wrappers.timelineitem import TimelineItem
 
 if TYPE_CHECKING:
     from pydavinci.wrappers._resolve_stubs import PyRemoteMediaPool
+    from pydavinci.wrappers.ingest import IngestReport
+    from pydavinci.wrappers.metadatatable import MetadataTable, MetadataWriteReport
+    from pydavinci.wrappers.proxies import MatchRule, ProxyIndex, ProxyMatchReport
+    from pydavinci.wrappers.relink import FileIndex, RelinkPlan
 
 
 class MediaPool:
+    __slots__ = ("_obj",)
+
     def __init__(self) -> None:
 
         self._obj: PyRemoteMediaPool = (
@@ -29,6 +50,59 @@ class MediaPool:
 
         return Folder(self._obj.GetRootFolder())
 
+    def index(self, refresh: bool = False) -> "MediaPoolIndex":
+        """
+        Returns the cached [``MediaPoolIndex``][pydavinci.wrappers.mediapoolindex.MediaPoolIndex] of the folder tree.
+        The tree is crawled once, the first time it's used, and shared by every ``MediaPool`` of the same project.
+
+        Args:
+            refresh (bool, optional): crawl the whole tree again. Defaults to ``False``.
+
+        Returns:
+            (MediaPoolIndex): folder tree index
+        """
+        index = index_for(self)
+        if refresh:
+            index.refresh()
+        return index
+
+    def walk(
+        self, top: Optional[Union[str, "Folder"]] = None
+    ) -> Iterator[Tuple[str, "Folder", List["Folder"], List["MediaPoolItem"]]]:
+        """
+        Walks the media pool breadth first using the cached
+        [``MediaPoolIndex``][pydavinci.wrappers.mediapoolindex.MediaPoolIndex], like ``os.walk``.
+
+        ```python
+        for path, folder, subfolders, clips in resolve.media_pool.walk():
+            print(path, len(clips))
+        ```
+
+        Args:
+            top (Union[str, Folder], optional): folder path or ``Folder`` to start at. Defaults to the root folder.
+
+        Yields:
+            (Tuple[str, Folder, List[Folder], List[MediaPoolItem]]): path, folder, subfolders and clips
+        """
+        return self.index().walk(top)
+
+    def find_clips(self, **keys: str) -> List["MediaPoolItem"]:
+        """
+        Returns clips by ``file_path``, ``name``, ``reel``, ``media_id`` or ``id`` from the cached
+        [``MediaPoolIndex``][pydavinci.wrappers.mediapoolindex.MediaPoolIndex.find_clips].
+
+        ```python
+        clips = resolve.media_pool.find_clips(reel="A001", name="A001C003")
+        ```
+
+        Args:
+            **keys (str): clip keys to match, all of them have to match
+
+        Returns:
+            (List[MediaPoolItem]): matching clips
+        """
+        return self.index().find_clips(**keys)
+
     def add_subfolder(self, folder_name: str, parent_folder: "Folder") -> "Folder":
         """
         Adds subfolder ``folder_name`` into ``parent_folder``
@@ -40,7 +114,11 @@ class MediaPool:
         Returns:
             (Folder): created subfolder
         """
-        return Folder(self._obj.AddSubFolder(parent_folder._obj, folder_name))
+        folder = self._obj.AddSubFolder(parent_folder._obj, folder_name)
+        index = cached_index(self._obj)
+        if index is not None and folder:
+            index._folder_added(parent_folder._obj, folder)
+        return Folder(folder)
 
     def create_empty_timeline(self, timeline_name: str) -> "Timeline":
         """
@@ -66,6 +144,7 @@ class MediaPool:
         """
         # / TODO All types: MediaPoolItem, List[Dict], Dict
         appended = self._obj.AppendToTimeline(get_resolveobjs(clips))
+        _current_items_changed()
         return [TimelineItem(x) for x in appended]
 
     def create_timeline_from_clips(self, name: str, clips: List["MediaPoolItem"]) -> "Timeline":
@@ -79,7 +158,10 @@ class MediaPool:
         Returns:
             (Timeline): created timeline
         """
-        return Timeline(self._obj.CreateTimelineFromClips(name, get_resolveobjs(clips)))
+        timeline = Timeline(self._obj.CreateTimelineFromClips(name, get_resolveobjs(clips)))
+        _current_items_changed()
+        timeline._items_changed()
+        return timeline
 
     def import_timeline_fromfile(
         self, path: str, options: Optional[Dict[Any, Any]] = None
@@ -166,7 +248,11 @@ class MediaPool:
         Returns:
             bool: ``True`` if successful, ``False`` otherwise
         """
-        return self._obj.DeleteClips(get_resolveobjs(clips))
+        result = self._obj.DeleteClips(get_resolveobjs(clips))
+        index = cached_index(self._obj)
+        if index is not None and result:
+            index._clips_removed(get_resolveobjs(clips))
+        return result
 
     def delete_folders(self, folders: List["Folder"]) -> bool:
         """
@@ -178,7 +264,11 @@ class MediaPool:
         Returns:
             bool: ``True`` if successful, ``False`` otherwise
         """
-        return self._obj.DeleteFolders(get_resolveobjs(folders))
+        result = self._obj.DeleteFolders(get_resolveobjs(folders))
+        index = cached_index(self._obj)
+        if index is not None and result:
+            index._folders_removed(get_resolveobjs(folders))
+        return result
 
     def move_clips(self, clips: List["MediaPoolItem"], folder: "Folder") -> bool:
         """
@@ -191,7 +281,11 @@ class MediaPool:
         Returns:
             bool: ``True`` if successful, ``False`` otherwise
         """
-        return self._obj.MoveClips(get_resolveobjs(clips), folder._obj)
+        result = self._obj.MoveClips(get_resolveobjs(clips), folder._obj)
+        index = cached_index(self._obj)
+        if index is not None and result:
+            index._clips_removed(get_resolveobjs(clips), folder._obj)
+        return result
 
     def move_folders(self, folders: List["Folder"], target_folder: "Folder") -> bool:
         """
@@ -204,7 +298,12 @@ class MediaPool:
         Returns:
             bool: ``True`` if successful, ``False`` otherwise
         """
-        return self._obj.MoveFolders(get_resolveobjs(folders), target_folder._obj)
+        result = self._obj.MoveFolders(get_resolveobjs(folders), target_folder._obj)
+        index = cached_index(self._obj)
+        if index is not None and result:
+            index._folders_removed(get_resolveobjs(folders))
+            index.refresh(target_folder)
+        return result
 
     def clip_mattes(self, clip: "MediaPoolItem") -> List[str]:
         """
@@ -256,6 +355,46 @@ class MediaPool:
         """
         return self._obj.RelinkClips(get_resolveobjs(clips), parent_folder)
 
+    def relink(
+        self,
+        roots: Union[List[str], "FileIndex"],
+        clips: Optional[List["MediaPoolItem"]] = None,
+        dry_run: bool = False,
+        only_offline: bool = True,
+    ) -> "RelinkPlan":
+        """
+        Finds where clips moved under ``roots`` and relinks them, one ``RelinkClips`` call per
+        target directory.
+
+        ``roots`` are indexed locally, listing directories in parallel, see
+        [``FileIndex``][pydavinci.wrappers.relink.FileIndex]. Each clip's ``File Path`` is resolved
+        to its new location by basename, trailing directories and size, then clips are grouped by
+        the directory they're now in.
+
+        ```python
+        plan = resolve.media_pool.relink(["/Volumes/RAID_A", "/Volumes/RAID_B"], dry_run=True)
+        print(plan.calls, plan.missing, plan.ambiguous)
+        plan.apply()
+        ```
+
+        Args:
+            roots (Union[List[str], FileIndex]): directories to look in, or an index of them
+            clips (List[MediaPoolItem], optional): clips to relink. Defaults to every clip in the media pool.
+            dry_run (bool, optional): only plan, call ``RelinkPlan.apply`` to relink later. Defaults to ``False``.
+            only_offline (bool, optional): skip clips that are online. Defaults to ``True``.
+
+        Returns:
+            (RelinkPlan): planned groups, missing and ambiguous file paths, and results unless ``dry_run``
+        """
+        from pydavinci.wrappers.relink import FileIndex, plan_relink
+
+        files = roots if isinstance(roots, FileIndex) else FileIndex(roots)
+        objs = self.index()._clips_in(None, True) if clips is None else get_resolveobjs(clips)
+        plan = plan_relink(self._obj, objs, files, only_offline)
+        if not dry_run:
+            plan.apply()
+        return plan
+
     def unlink_clips(self, clips: List["MediaPoolItem"]) -> bool:
         """
         Unlink ``clips``
@@ -268,23 +407,132 @@ class MediaPool:
         """
         return self._obj.UnlinkClips(get_resolveobjs(clips))
 
-    def import_media(self, paths: List[str]) -> List["MediaPoolItem"]:
+    def import_media(
+        self,
+        paths: Sequence[Union[str, "ImageSequence", Dict[str, Any]]],
+        sequences: bool = False,
+        extensions: Optional[Sequence[str]] = DEFAULT_EXTENSIONS,
+    ) -> List["MediaPoolItem"]:
         """
         Import media from ``paths``
 
+        Image sequences can be given as [``ImageSequence``][pydavinci.wrappers.sequences.ImageSequence]s
+        or ``ClipInfo`` dicts (``FilePath``, ``StartIndex``, ``EndIndex``). With ``sequences``,
+        directories and files in ``paths`` are scanned locally and frames of the same sequence
+        are imported as one clip:
+
+        ```python
+        resolve.media_pool.import_media(["/mnt/vfx/sh010/plates"], sequences=True)
+        ```
+
         Args:
-            paths (List[str]): list of paths containing the media
+            paths (Sequence[Union[str, ImageSequence, Dict[str, Any]]]): files, directories, sequences or ``ClipInfo`` dicts
+            sequences (bool, optional): group frames into image sequences. Defaults to ``False``.
+            extensions (Sequence[str], optional): extensions of sequence frames when ``sequences`` is set.
 
         Returns:
             (List[MediaPoolItem]): list of imported ``MediaPoolItem``s
+        """
+        files = [p for p in paths if isinstance(p, str)]
+        infos = [
+            p.clip_info() if isinstance(p, ImageSequence) else p
+            for p in paths
+            if not isinstance(p, str)
+        ]
+        if sequences and files:
+            found, files = scan_sequences(files, extensions)
+            infos += [seq.clip_info() for seq in found]
+
+        # ``ImportMedia`` takes either file paths or ``ClipInfo``s
+        imported = []
+        for items in (files, infos):
+            if items:
+                imported += self._obj.ImportMedia(items) or []
+        index = cached_index(self._obj)
+        if index is not None and imported:
+            # Davinci imports into the current folder
+            index._clips_imported(self._obj.GetCurrentFolder(), imported)
+        return [MediaPoolItem(x) for x in imported]
 
-        Image Sequences:
-            Doesn't support image sequences yet.
+    def ingest(
+        self,
+        paths: List[str],
+        chunk_size: int = 500,
+        journal: Optional[str] = None,
+        progress: Optional[Callable[[int, int], None]] = None,
+        extensions: Optional[Sequence[str]] = None,
+        workers: int = 8,
+    ) -> "IngestReport":
         """
-        # / TODO: Implement image sequence using ImportMedia({ClipInfo})
+        Imports many files into the current folder, ``chunk_size`` files per ``ImportMedia`` call.
 
-        imported = self._obj.ImportMedia(paths)
-        return [MediaPoolItem(x) for x in imported]
+        Directories are expanded locally, listing several at once. Files already in the media
+        pool, found by ``File Path`` in the [``MediaPoolIndex``][pydavinci.wrappers.mediapoolindex.MediaPoolIndex],
+        are skipped. With ``journal``, every chunk imported is recorded, and running the same
+        ingest again after an interruption carries on where it stopped.
+
+        ```python
+        report = resolve.media_pool.ingest(
+            ["/mnt/shoot/day1"],
+            extensions=[".mov", ".mxf"],
+            journal="/tmp/day1.jsonl",
+            progress=lambda done, total: print(f"{done}/{total}"),
+        )
+        ```
+
+        Args:
+            paths (List[str]): files and directories to import
+            chunk_size (int, optional): files per ``ImportMedia`` call. Defaults to ``500``.
+            journal (str, optional): resume journal file, created if missing
+            progress (Callable[[int, int], None], optional): called with files processed and files to import after each chunk
+            extensions (Sequence[str], optional): only import files with these extensions
+            workers (int, optional): directories listed at once. Defaults to ``8``.
+
+        Raises:
+            ValueError: ``chunk_size`` below ``1``
+
+        Returns:
+            (IngestReport): imported, skipped and failed paths
+        """
+        from pydavinci.wrappers.ingest import ingest
+
+        return ingest(self, paths, chunk_size, journal, progress, extensions, workers)
+
+    def link_proxies(
+        self,
+        proxies: Union[List[str], "ProxyIndex"],
+        clips: Optional[List["MediaPoolItem"]] = None,
+        rules: Optional[Sequence["MatchRule"]] = None,
+        dry_run: bool = False,
+    ) -> "ProxyMatchReport":
+        """
+        Finds the proxy of every clip and links them.
+
+        Proxy directories are indexed locally, see [``ProxyIndex``][pydavinci.wrappers.proxies.ProxyIndex],
+        and clip properties are read with one call per clip, so matching is a dictionary lookup
+        per clip and rule. Clips with several candidate proxies are reported as ambiguous and
+        left alone.
+
+        ```python
+        report = resolve.media_pool.link_proxies(["/mnt/proxies"])
+        for match in report.ambiguous:
+            print(match.clip_name, match.candidates)
+        ```
+
+        Args:
+            proxies (Union[List[str], ProxyIndex]): proxy files and directories, or an index of them
+            clips (List[MediaPoolItem], optional): clips to match. Defaults to every clip in the media pool.
+            rules (Sequence[MatchRule], optional): match rules. Defaults to basename, reel and timecode.
+            dry_run (bool, optional): only match, don't link. Defaults to ``False``.
+
+        Returns:
+            (ProxyMatchReport): matched, ambiguous, missing and failed clips
+        """
+        from pydavinci.wrappers.proxies import DEFAULT_RULES, ProxyIndex, match_proxies
+
+        index = proxies if isinstance(proxies, ProxyIndex) else ProxyIndex(proxies)
+        objs = self.index()._clips_in(None, True) if clips is None else get_resolveobjs(clips)
+        return match_proxies(objs, index, DEFAULT_RULES if rules is None else rules, not dry_run)
 
     def export_metadata(
         self, file_name: str, clips: Optional[List["MediaPoolItem"]] = None
@@ -305,6 +553,106 @@ class MediaPool:
         else:
             return self._obj.ExportMetadata(file_name)
 
+    def metadata_table(
+        self,
+        clips: Optional[List["MediaPoolItem"]] = None,
+        fields: Optional[List[str]] = None,
+        sources: Sequence[str] = SOURCES,
+        batch_size: int = 500,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> "MetadataTable":
+        """
+        Reads clip properties and metadata of many clips into a column oriented
+        [``MetadataTable``][pydavinci.wrappers.metadatatable.MetadataTable].
+
+        Each clip costs one remote call per source, whatever the number of fields. Unlike
+        ``export_metadata``, nothing is written through Davinci Resolve: the table can be
+        filtered first and written with ``to_csv`` or ``to_parquet``.
+
+        ```python
+        table = resolve.media_pool.metadata_table(fields=["File Path", "Reel Name", "Scene"])
+        table.where("Reel Name", "A001C003").to_parquet("A001C003.parquet")
+        ```
+
+        Args:
+            clips (List[MediaPoolItem], optional): clips to read. Defaults to every clip in the media pool.
+            fields (List[str], optional): fields to keep. Defaults to every field found.
+            sources (Sequence[str], optional): ``"properties"`` (``GetClipProperty``) and/or ``"metadata"`` (``GetMetadata``). Defaults to both.
+            batch_size (int, optional): clips read between ``progress`` calls. Defaults to ``500``.
+            progress (Callable[[int, int], None], optional): called with clips read and total after each batch.
+
+        Raises:
+            ValueError: invalid source or ``batch_size``
+
+        Returns:
+            (MetadataTable): one row per clip
+        """
+        from pydavinci.wrappers.metadatatable import read_table
+
+        objs = self.index()._clips_in(None, True) if clips is None else get_resolveobjs(clips)
+        return read_table(objs, fields, sources, batch_size, progress)
+
+    def set_metadata(
+        self,
+        changes: Mapping["MediaPoolItem", Dict[str, Any]],
+        current: Optional["MetadataTable"] = None,
+    ) -> "MetadataWriteReport":
+        """
+        Sets metadata of many clips, only sending the fields that differ from their current value.
+
+        Current values are read with one ``GetMetadata`` call per clip, or taken from ``current``
+        for the clips and fields it has. Changed fields of a clip are sent in a single ``SetMetadata`` call.
+
+        ```python
+        report = resolve.media_pool.set_metadata({clip: {"Scene": "12", "Take": "3"} for clip in clips})
+        print(report.saved, report.failed)
+        ```
+
+        Args:
+            changes (Mapping[MediaPoolItem, Dict[str, Any]]): clip to ``{field: value}``
+            current (MetadataTable, optional): table from [``metadata_table``][pydavinci.wrappers.mediapool.MediaPool.metadata_table] with the current values.
+                It's updated with the values written.
+
+        Returns:
+            (MetadataWriteReport): per clip results and remote calls saved
+        """
+        from pydavinci.wrappers.metadatatable import write_fields
+
+        return write_fields(
+            [(clip._obj, fields) for clip, fields in changes.items()], "metadata", current
+        )
+
+    def set_properties(
+        self,
+        changes: Mapping["MediaPoolItem", Dict[str, Any]],
+        current: Optional["MetadataTable"] = None,
+    ) -> "MetadataWriteReport":
+        """
+        Sets clip properties of many clips, only sending the properties that differ from their current value.
+
+        Current values are read with one ``GetClipProperty`` call per clip, or taken from ``current``
+        for the clips and properties it has. ``SetClipProperty`` takes one property per call.
+
+        Args:
+            changes (Mapping[MediaPoolItem, Dict[str, Any]]): clip to ``{property: value}``
+            current (MetadataTable, optional): table from [``metadata_table``][pydavinci.wrappers.mediapool.MediaPool.metadata_table] with the current values.
+                It's updated with the values written.
+
+        Returns:
+            (MetadataWriteReport): per clip results and remote calls saved
+        """
+        from pydavinci.wrappers.metadatatable import write_fields
+
+        pairs = [(clip._obj, fields) for clip, fields in changes.items()]
+        report = write_fields(pairs, "properties", current)
+        index = cached_index(self._obj)
+        if index is not None:
+            # names, paths and reels are lookup keys of the index
+            for (obj, fields), result in zip(pairs, report.clips, strict=True):
+                if result.written:
+                    index._properties_changed(obj, {prop: fields[prop] for prop in result.written})
+        return report
+
     @property
     def id(self) -> str:
         """
@@ -0,0 +1,557 @@
+from collections import deque
+from typing import TYPE_CHECKING, Any, Deque, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+import pydavinci.main
+
+if TYPE_CHECKING:
+    from pydavinci.wrappers._resolve_stubs import PyRemoteFolder, PyRemoteMediaPoolItem
+    from pydavinci.wrappers.folder import Folder
+    from pydavinci.wrappers.mediapool import MediaPool
+    from pydavinci.wrappers.mediapoolitem import MediaPoolItem
+
+FolderRef = Union[str, "Folder"]
+
+
+class FolderNode:
+    """One media pool folder in a [``MediaPoolIndex``][pydavinci.wrappers.mediapoolindex.MediaPoolIndex].
+
+    Attributes:
+        id (str): folder unique id
+        name (str): folder name
+        path (str): ``/`` separated path from the root folder, ``"Master/Day 1/A001"``
+        parent (Optional[str]): parent folder id, ``None`` for the root folder
+        children (List[str]): subfolder ids
+    """
+
+    __slots__ = ("id", "name", "path", "parent", "children", "_obj", "_clips")
+
+    def __init__(
+        self, obj: "PyRemoteFolder", uid: str, name: str, path: str, parent: Optional[str]
+    ) -> None:
+        self._obj = obj
+        self.id = uid
+        self.name = name
+        self.path = path
+        self.parent = parent
+        self.children: List[str] = []
+        self._clips: Optional[List["PyRemoteMediaPoolItem"]] = None
+
+    def __repr__(self) -> str:
+        return f"FolderNode(path: {self.path}, folders: {len(self.children)})"
+
+
+class ClipEntry:
+    """One media pool clip in a [``MediaPoolIndex``][pydavinci.wrappers.mediapoolindex.MediaPoolIndex].
+
+    Attributes:
+        id (str): clip unique id
+        media_id (str): media id, shared by clips of the same media
+        name (str): ``Clip Name`` property
+        file_path (str): ``File Path`` property
+        reel (str): ``Reel Name`` property
+        folder (str): id of the folder holding the clip
+    """
+
+    __slots__ = ("id", "media_id", "name", "file_path", "reel", "folder", "_obj")
+
+    def __init__(self, obj: "PyRemoteMediaPoolItem", folder: str) -> None:
+        props = obj.GetClipProperty()
+        if not isinstance(props, dict):
+            props = {}
+        self._obj = obj
+        self.id: str = obj.GetUniqueId()
+        self.media_id: str = obj.GetMediaId()
+        self.name: str = props.get("Clip Name", "")
+        self.file_path: str = props.get("File Path", "")
+        self.reel: str = props.get("Reel Name", "")
+        self.folder = folder
+
+    def __repr__(self) -> str:
+        return f"ClipEntry(name: {self.name}, file_path: {self.file_path})"
+
+
+# lookup key -> ``ClipEntry`` attribute
+CLIP_KEYS = {
+    "id": "id",
+    "media_id": "media_id",
+    "name": "name",
+    "file_path": "file_path",
+    "reel": "reel",
+}
+
+
+class MediaPoolIndex:
+    """Cached folder tree of the media pool.
+
+    The first use crawls the whole tree once, breadth first, and keeps every folder as a
+    [``FolderNode``][pydavinci.wrappers.mediapoolindex.FolderNode] with its path, parent
+    and children. Lookups by path or id, and walks, are answered from the cache afterwards.
+
+    Folder changes made through [``MediaPool``][pydavinci.wrappers.mediapool.MediaPool] are
+    applied to the index as they happen. For changes made elsewhere, like in the GUI, call
+    [``refresh``][pydavinci.wrappers.mediapoolindex.MediaPoolIndex.refresh] with the folder
+    that changed and only that subtree is crawled again.
+
+    Clip lookups by ``File Path``, ``Clip Name``, ``Reel Name``, media id and unique id are
+    built on first use, in one pass over the cached clip lists, and kept current as
+    ``MediaPool.import_media``, ``delete_clips`` and ``move_clips`` run.
+
+    ```python
+    index = resolve.media_pool.index()
+    a001 = index.folder("Master/Day 1/A001")
+    clip = index.find_clip(file_path="/media/A001/A001C003.mov")
+    for path, folder, subfolders, clips in resolve.media_pool.walk("Master/Day 1"):
+        ...
+    ```
+    """
+
+    def __init__(self, pool: "MediaPool") -> None:
+        self._pool_obj = pool._obj
+        self._nodes: Dict[str, FolderNode] = {}
+        self._by_path: Dict[str, str] = {}
+        self.root: Optional[str] = None
+        """Root folder id, ``None`` until the first crawl"""
+        # ``None`` until the first clip lookup, then key -> value -> clip ids
+        self._clips: Optional[Dict[str, ClipEntry]] = None
+        self._lookup: Dict[str, Dict[str, Set[str]]] = {key: {} for key in CLIP_KEYS}
+
+    @property
+    def loaded(self) -> bool:
+        """``True`` once the tree has been crawled."""
+        return self.root is not None
+
+    def _ensure_loaded(self) -> None:
+        if self.root is None:
+            self.refresh()
+
+    def _forget_clips(self) -> None:
+        # clip lookups are built again on next use
+        self._clips = None
+        self._lookup = {key: {} for key in CLIP_KEYS}
+
+    def _reset(self) -> None:
+        # the tree changed outside of the index, crawl everything again on next use
+        self.root = None
+        self._forget_clips()
+
+    def _crawl(self, obj: "PyRemoteFolder", parent: Optional[str], parent_path: str) -> str:
+        # breadth first, four remote calls per folder
+        top = obj.GetUniqueId()
+        # folder, its id, parent path, parent id ("" for the top folder without parent)
+        queue: Deque[Tuple["PyRemoteFolder", str, str, str]] = deque(
+            [(obj, top, parent_path, parent or "")]
+        )
+        while queue:
+            folder_obj, uid, base, parent_id = queue.popleft()
+            name = folder_obj.GetName()
+            path = f"{base}/{name}" if base else name
+            node = FolderNode(folder_obj, uid, name, path, parent_id or None)
+            node._clips = folder_obj.GetClipList() or []
+            self._nodes[uid] = node
+            if self._clips is not None:
+                for clip in node._clips:
+                    self._add_clip(ClipEntry(clip, uid))
+            self._by_path[path] = uid
+            if parent_id and parent_id in self._nodes:
+                self._nodes[parent_id].children.append(uid)
+
+            for sub in folder_obj.GetSubFolderList() or []:
+                queue.append((sub, sub.GetUniqueId(), path, uid))
+        return top
+
+    def _drop(self, uid: str) -> None:
+        # removes ``uid`` and its whole subtree
+        stack = [uid]
+        dropped = set()
+        while stack:
+            node = self._nodes.pop(stack.pop(), None)
+            if node is None:
+                continue
+            dropped.add(node.id)
+            if self._by_path.get(node.path) == node.id:
+                del self._by_path[node.path]
+            stack.extend(node.children)
+        if self._clips is not None:
+            for entry in [e for e in self._clips.values() if e.folder in dropped]:
+                self._remove_clip(entry)
+
+    def _unlink(self, uid: str) -> None:
+        node = self._nodes.get(uid)
+        if node is not None and node.parent in self._nodes:
+            children = self._nodes[node.parent].children  # type: ignore
+            if uid in children:
+                children.remove(uid)
+        self._drop(uid)
+
+    def _folder_added(self, parent_obj: "PyRemoteFolder", obj: "PyRemoteFolder") -> None:
+        parent = self._nodes.get(parent_obj.GetUniqueId())
+        if parent is None:
+            self._reset()
+            return
+        self._crawl(obj, parent.id, parent.path)
+
+    def _folders_removed(self, objs: List["PyRemoteFolder"]) -> None:
+        for obj in objs:
+            self._unlink(obj.GetUniqueId())
+
+    def refresh(self, folder: Optional[FolderRef] = None) -> None:
+        """
+        Crawls ``folder`` and its subfolders again. Crawls the whole tree if no folder is provided.
+
+        Args:
+            folder (Union[str, Folder], optional): folder path or ``Folder``. Defaults to the root folder.
+        """
+        if folder is None or self.root is None:
+            self._nodes.clear()
+            self._by_path.clear()
+            self._forget_clips()
+            self.root = self._crawl(self._pool_obj.GetRootFolder(), None, "")
+            return
+
+        node = self._node(folder)
+        parent = self._nodes.get(node.parent) if node.parent else None
+        position = parent.children.index(node.id) if parent else 0
+        self._drop(node.id)
+        if parent is not None:
+            parent.children.remove(node.id)
+
+        uid = self._crawl(node._obj, node.parent, parent.path if parent else "")
+        if parent is not None:
+            # keep the original order of subfolders
+            parent.children.remove(uid)
+            parent.children.insert(position, uid)
+        else:
+            self.root = uid
+
+    def _node(self, folder: FolderRef) -> FolderNode:
+        self._ensure_loaded()
+        if isinstance(folder, str):
+            uid = self._by_path.get(folder.strip("/"))
+            if uid is None:
+                raise KeyError(f"No media pool folder at {folder!r}")
+        else:
+            uid = folder._obj.GetUniqueId()
+            if uid not in self._nodes:
+                raise KeyError(f"{folder!r} is not in the media pool index. Try refresh() first.")
+        return self._nodes[uid]
+
+    def node(self, folder: FolderRef) -> FolderNode:
+        """
+        Returns the cached [``FolderNode``][pydavinci.wrappers.mediapoolindex.FolderNode] of ``folder``
+
+        Args:
+            folder (Union[str, Folder]): folder path or ``Folder``
+
+        Raises:
+            KeyError: folder not in the index
+
+        Returns:
+            (FolderNode): folder node
+        """
+        return self._node(folder)
+
+    def folder(self, path: str) -> "Folder":
+        """
+        Returns the [``Folder``][pydavinci.wrappers.folder.Folder] at ``path``
+
+        Args:
+            path (str): ``/`` separated path starting with the root folder name
+
+        Raises:
+            KeyError: no folder at ``path``
+
+        Returns:
+            (Folder): folder
+        """
+        from pydavinci.wrappers.folder import Folder
+
+        return Folder(self._node(path)._obj)
+
+    def path(self, folder: "Folder") -> str:
+        """
+        Returns the path of ``folder``
+
+        Args:
+            folder (Folder): folder
+
+        Raises:
+            KeyError: folder not in the index
+
+        Returns:
+            str: ``/`` separated path starting with the root folder name
+        """
+        return self._node(folder).path
+
+    @property
+    def paths(self) -> List[str]:
+        """
+        Returns the path of every folder, parents before children
+
+        Returns:
+            (List[str]): folder paths
+        """
+        self._ensure_loaded()
+        return [node.path for node in self._iter_nodes(self._nodes[self.root])]  # type: ignore
+
+    def _iter_nodes(self, top: FolderNode) -> Iterator[FolderNode]:
+        queue: Deque[FolderNode] = deque([top])
+        while queue:
+            node = queue.popleft()
+            yield node
+            queue.extend(self._nodes[uid] for uid in node.children)
+
+    def _clip_objs(self, node: FolderNode) -> List["PyRemoteMediaPoolItem"]:
+        if node._clips is None:
+            node._clips = node._obj.GetClipList() or []
+        return node._clips
+
+    def _build_clips(self) -> Dict[str, ClipEntry]:
+        if self._clips is None:
+            self._ensure_loaded()
+            self._clips = {}
+            for node in self._nodes.values():
+                for clip in self._clip_objs(node):
+                    self._add_clip(ClipEntry(clip, node.id))
+        return self._clips
+
+    def _add_clip(self, entry: ClipEntry) -> None:
+        self._clips[entry.id] = entry  # type: ignore
+        for key, attr in CLIP_KEYS.items():
+            self._lookup[key].setdefault(getattr(entry, attr), set()).add(entry.id)
+
+    def _remove_clip(self, entry: ClipEntry) -> None:
+        del self._clips[entry.id]  # type: ignore
+        for key, attr in CLIP_KEYS.items():
+            ids = self._lookup[key].get(getattr(entry, attr))
+            if ids is not None:
+                ids.discard(entry.id)
+                if not ids:
+                    del self._lookup[key][getattr(entry, attr)]
+
+    def _clips_imported(self, folder_obj: "PyRemoteFolder", objs: List[Any]) -> None:
+        node = self._nodes.get(folder_obj.GetUniqueId())
+        if node is None:
+            # folder created elsewhere, in the GUI or by another script
+            self._reset()
+            return
+        # a folder not listed yet lists the new clips too once fetched
+        if node._clips is not None:
+            node._clips.extend(objs)
+        if self._clips is not None:
+            for obj in objs:
+                self._add_clip(ClipEntry(obj, node.id))
+
+    def _clips_removed(self, objs: List[Any], target: Optional["PyRemoteFolder"] = None) -> None:
+        # deleted, or moved to ``target``
+        target_node = self._nodes.get(target.GetUniqueId()) if target is not None else None
+        if self._clips is None or (target is not None and target_node is None):
+            # don't know where those clips were, fetch clip lists again on next use
+            for node in self._nodes.values():
+                node._clips = None
+            self._forget_clips()
+            return
+
+        for obj in objs:
+            entry = self._clips.get(obj.GetUniqueId())
+            if entry is None:
+                continue
+            source = self._nodes.get(entry.folder)
+            if source is not None and source._clips is not None:
+                source._clips = [x for x in source._clips if x is not entry._obj]
+            if target_node is None:
+                self._remove_clip(entry)
+            else:
+                entry.folder = target_node.id
+                if target_node._clips is not None:
+                    target_node._clips.append(entry._obj)
+
+    def _properties_changed(self, obj: Any, properties: Dict[str, Any]) -> None:
+        if self._clips is None:
+            return
+        entry = self._clips.get(obj.GetUniqueId())
+        if entry is None:
+            return
+        self._remove_clip(entry)
+        for prop, attr in (
+            ("Clip Name", "name"),
+            ("File Path", "file_path"),
+            ("Reel Name", "reel"),
+        ):
+            if prop in properties:
+                setattr(entry, attr, str(properties[prop]))
+        self._add_clip(entry)
+
+    def find_clips(
+        self,
+        *,
+        file_path: Optional[str] = None,
+        name: Optional[str] = None,
+        reel: Optional[str] = None,
+        media_id: Optional[str] = None,
+        id: Optional[str] = None,
+    ) -> List["MediaPoolItem"]:
+        """
+        Returns clips matching every key provided, without going through every clip.
+
+        Args:
+            file_path (str, optional): ``File Path`` clip property
+            name (str, optional): ``Clip Name`` clip property
+            reel (str, optional): ``Reel Name`` clip property
+            media_id (str, optional): media id
+            id (str, optional): clip unique id
+
+        Raises:
+            ValueError: no key provided
+
+        Returns:
+            (List[MediaPoolItem]): matching clips, sorted by folder path and clip name
+        """
+        from pydavinci.wrappers.mediapoolitem import MediaPoolItem
+
+        wanted = {
+            key: value
+            for key, value in zip(
+                ("file_path", "name", "reel", "media_id", "id"),
+                (file_path, name, reel, media_id, id),
+                strict=True,
+            )
+            if value is not None
+        }
+        if not wanted:
+            raise ValueError(
+                "Provide at least one of 'file_path', 'name', 'reel', 'media_id' or 'id'"
+            )
+
+        clips = self._build_clips()
+        found: Optional[Set[str]] = None
+        for key, value in wanted.items():
+            ids = self._lookup[key].get(value, set())
+            found = set(ids) if found is None else found & ids
+            if not found:
+                return []
+        entries = sorted(
+            (clips[uid] for uid in found),  # type: ignore
+            key=lambda entry: (self._nodes[entry.folder].path, entry.name),
+        )
+        return [MediaPoolItem(entry._obj) for entry in entries]
+
+    def has_file_path(self, path: str) -> bool:
+        """
+        Returns ``True`` if a clip of the media pool has ``File Path`` ``path``
+
+        Args:
+            path (str): file path
+
+        Returns:
+            bool: ``True`` if the file is in the media pool
+        """
+        self._build_clips()
+        return path in self._lookup["file_path"]
+
+    def find_clip(self, **keys: str) -> Optional["MediaPoolItem"]:
+        """
+        Returns the first clip matching ``keys``, see [``find_clips``][pydavinci.wrappers.mediapoolindex.MediaPoolIndex.find_clips].
+
+        Returns:
+            (Optional[MediaPoolItem]): clip, or ``None`` if none matches
+        """
+        found = self.find_clips(**keys)
+        return found[0] if found else None
+
+    def clip_entry(self, clip: "MediaPoolItem") -> ClipEntry:
+        """
+        Returns the cached [``ClipEntry``][pydavinci.wrappers.mediapoolindex.ClipEntry] of ``clip``
+
+        Args:
+            clip (MediaPoolItem): clip
+
+        Raises:
+            KeyError: clip not in the index
+
+        Returns:
+            (ClipEntry): clip entry
+        """
+        return self._build_clips()[clip._obj.GetUniqueId()]
+
+    def clips(
+        self, folder: Optional[FolderRef] = None, recursive: bool = True
+    ) -> List["MediaPoolItem"]:
+        """
+        Returns clips of ``folder``
+
+        Args:
+            folder (Union[str, Folder], optional): folder path or ``Folder``. Defaults to the root folder.
+            recursive (bool, optional): include clips of every subfolder. Defaults to ``True``.
+
+        Returns:
+            (List[MediaPoolItem]): clips
+        """
+        from pydavinci.wrappers.mediapoolitem import MediaPoolItem
+
+        return [MediaPoolItem(obj) for obj in self._clips_in(folder, recursive)]
+
+    def _clips_in(self, folder: Optional[FolderRef], recursive: bool) -> List[Any]:
+        self._ensure_loaded()
+        top = self._nodes[self.root] if folder is None else self._node(folder)  # type: ignore
+        nodes = self._iter_nodes(top) if recursive else iter([top])
+        return [obj for node in nodes for obj in self._clip_objs(node)]
+
+    def walk(
+        self, top: Optional[FolderRef] = None
+    ) -> Iterator[Tuple[str, "Folder", List["Folder"], List["MediaPoolItem"]]]:
+        """
+        Walks the cached tree breadth first, like ``os.walk``. Wrappers are only built for the
+        folders actually reached, so breaking out early is cheap.
+
+        Args:
+            top (Union[str, Folder], optional): folder path or ``Folder`` to start at. Defaults to the root folder.
+
+        Yields:
+            (Tuple[str, Folder, List[Folder], List[MediaPoolItem]]): path, folder, subfolders and clips
+        """
+        from pydavinci.wrappers.folder import Folder
+        from pydavinci.wrappers.mediapoolitem import MediaPoolItem
+
+        self._ensure_loaded()
+        start = self._nodes[self.root] if top is None else self._node(top)  # type: ignore
+        for node in self._iter_nodes(start):
+            subfolders = [Folder(self._nodes[uid]._obj) for uid in node.children]
+            clips = [MediaPoolItem(obj) for obj in self._clip_objs(node)]
+            yield node.path, Folder(node._obj), subfolders, clips
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        return len(self._nodes)
+
+    def __contains__(self, path: str) -> bool:
+        self._ensure_loaded()
+        return path.strip("/") in self._by_path
+
+    def __repr__(self) -> str:
+        return f"MediaPoolIndex(folders: {len(self._nodes)})"
+
+
+_indexes: Dict[str, MediaPoolIndex] = {}
+_session = pydavinci.main.connection.session
+
+
+def index_for(pool: "MediaPool") -> MediaPoolIndex:
+    """Returns the shared index of ``pool``, one per media pool and connection session."""
+    global _session
+    if _session != pydavinci.main.connection.session:
+        _indexes.clear()
+        _session = pydavinci.main.connection.session
+
+    uid = pool._obj.GetUniqueId()
+    index = _indexes.get(uid)
+    if index is None:
+        index = _indexes[uid] = MediaPoolIndex(pool)
+    return index
+
+
+def cached_index(pool_obj: Any) -> Optional[MediaPoolIndex]:
+    """Returns the index of ``pool_obj`` if one has been built already, without building one."""
+    if not _indexes or _session != pydavinci.main.connection.session:
+        return None
+    index = _indexes.get(pool_obj.GetUniqueId())
+    return index if index is not None and index.loaded else None
@@ -8,6 +8,8 @@ if TYPE_CHECKING:
 
 
 class MediaPoolItem:
+    __slots__ = ("_obj", "_markers")
+
     # TODO:
     # Implement a way to acess metadata such as mediapoolitem.metadata['Good Take'] = True
     # Meed to mess around with a private dict that uses
@@ -19,7 +21,20 @@ class MediaPoolItem:
         else:
             raise TypeError(f"{type(obj)} is not a valid {self.__class__.__name__} type")
 
-        self.markers = MarkerCollection(self)
+        self._markers: Optional[MarkerCollection] = None
+
+    @property
+    def markers(self) -> "MarkerCollection":
+        """
+        Returns the [``MarkerCollection``][pydavinci.wrappers.marker.MarkerCollection] for this ``MediaPoolItem``.
+        Markers are only fetched from Davinci Resolve the first time they're used.
+
+        Returns:
+            (MarkerCollection): markers
+        """
+        if self._markers is None:
+            self._markers = MarkerCollection(self)
+        return self._markers
 
     @property
     def name(self) -> str:
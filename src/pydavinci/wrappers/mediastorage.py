@@ -1,13 +1,16 @@
-from typing import TYPE_CHECKING, Any, List
+from typing import TYPE_CHECKING, Any, Iterator, List, Optional, Tuple
 
 from pydavinci.main import resolve_obj
 from pydavinci.wrappers.mediapoolitem import MediaPoolItem
+from pydavinci.wrappers.storagewalk import listing_cache, walk
 
 if TYPE_CHECKING:
     from pydavinci.wrappers._resolve_stubs import PyRemoteMediaStorage
 
 
 class MediaStorage:
+    __slots__ = ("_obj",)
+
     def __init__(self) -> None:
         self._obj: "PyRemoteMediaStorage" = resolve_obj.GetMediaStorage()
 
@@ -45,6 +48,35 @@ class MediaStorage:
         """
         return self._obj.GetFileList(folder_path)
 
+    def walk(
+        self, root: str, local: Optional[bool] = None, workers: int = 8, cache: bool = True
+    ) -> Iterator[Tuple[str, List[str], List[str]]]:
+        """
+        Walks ``root`` breadth first, like ``os.walk`` but with full paths.
+
+        When ``root`` is reachable from the script host, directories are listed locally with
+        ``os.scandir``, several at once. Otherwise each directory costs a ``GetSubFolderList``
+        and a ``GetFileList`` call. The most recent listings are cached, up to
+        [``ListingCache.max_paths``][pydavinci.wrappers.storagewalk.ListingCache] paths, and used
+        again while the directory is unchanged. Results are streamed: removing entries from
+        ``subfolders`` skips them.
+
+        ```python
+        for path, subfolders, files in resolve.media_storage.walk("/Volumes/RAID"):
+            subfolders[:] = [d for d in subfolders if not d.endswith(".cache")]
+        ```
+
+        Args:
+            root (str): folder to start at
+            local (bool, optional): force local or remote listing. Defaults to local if ``root`` is reachable.
+            workers (int, optional): local directories listed at once. Defaults to ``8``.
+            cache (bool, optional): use cached listings. Defaults to ``True``.
+
+        Yields:
+            (Tuple[str, List[str], List[str]]): folder, subfolders and files
+        """
+        return walk(self._obj, root, local, workers, listing_cache if cache else None)
+
     def reveal_in_storage(self, path: str) -> bool:
         """
         Opens ``path`` in media storage
@@ -0,0 +1,383 @@
+import csv
+import sys
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from pydavinci.wrappers._resolve_stubs import PyRemoteMediaPoolItem
+    from pydavinci.wrappers.mediapoolitem import MediaPoolItem
+
+SOURCES = ("properties", "metadata")
+
+# Raw read of every field of one source on a remote media pool item
+_READERS: Dict[str, Callable[[Any], Any]] = {
+    "properties": lambda obj: obj.GetClipProperty(),
+    "metadata": lambda obj: obj.GetMetadata(),
+}
+
+Mask = Union[Callable[[Dict[str, str]], bool], Sequence[bool], Sequence[int]]
+
+
+def _check_sources(sources: Sequence[str]) -> None:
+    for source in sources:
+        if source not in SOURCES:
+            raise ValueError(f"Not a valid metadata source: {source!r}. Use one of {SOURCES}")
+
+
+def _pyarrow() -> Any:
+    try:
+        import pyarrow
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        raise ImportError(
+            "Parquet output needs pyarrow. Install it with `pip install pydavinci[parquet]`"
+        ) from None
+    return pyarrow
+
+
+def _value(value: Any) -> str:
+    # Resolve returns strings for almost everything, keep one copy of repeated values
+    return sys.intern(value if isinstance(value, str) else str(value))
+
+
+class MetadataTable:
+    """Column oriented table with clip properties and metadata of many clips.
+
+    Every column is a ``list`` of interned strings, one per clip, with ``""`` where a clip
+    doesn't have the field. Rows keep the order of the clips given to
+    [``MediaPool.metadata_table``][pydavinci.wrappers.mediapool.MediaPool.metadata_table].
+
+    ```python
+    table = resolve.media_pool.metadata_table(fields=["File Path", "Reel Name", "Scene"])
+    scene_12 = table.filter(lambda row: row["Scene"] == "12")
+    scene_12.to_csv("scene_12.csv")
+    ```
+    """
+
+    def __init__(
+        self, columns: Dict[str, List[str]], objs: Sequence["PyRemoteMediaPoolItem"]
+    ) -> None:
+        self.columns = columns
+        """``Dict`` of field name to column"""
+        self._objs = list(objs)
+
+    def __len__(self) -> int:
+        return len(self._objs)
+
+    def __getitem__(self, field: str) -> List[str]:
+        return self.columns[field]
+
+    def __contains__(self, field: str) -> bool:
+        return field in self.columns
+
+    def __repr__(self) -> str:
+        return f"MetadataTable(clips: {len(self)}, fields: {len(self.columns)})"
+
+    @property
+    def fields(self) -> List[str]:
+        """
+        Returns field names, in column order
+
+        Returns:
+            (List[str]): field names
+        """
+        return list(self.columns)
+
+    def filter(self, mask: Mask) -> "MetadataTable":
+        """
+        Returns a new table with the rows selected by ``mask``
+
+        Args:
+            mask (Union[Callable, Sequence[bool], Sequence[int]]): function called with each row
+                ``dict``, boolean mask or row indexes
+
+        Returns:
+            (MetadataTable): filtered table
+        """
+        if callable(mask):
+            rows = [i for i, row in enumerate(self.rows()) if mask(row)]
+        else:
+            mask = list(mask)
+            if mask and (isinstance(mask[0], bool) or getattr(mask[0], "dtype", None) == bool):
+                rows = [i for i, keep in enumerate(mask) if keep]
+            else:
+                rows = [int(i) for i in mask]
+        return MetadataTable(
+            {field: [column[i] for i in rows] for field, column in self.columns.items()},
+            [self._objs[i] for i in rows],
+        )
+
+    def where(self, field: str, value: str) -> "MetadataTable":
+        """
+        Returns a new table with the clips where ``field`` equals ``value``
+
+        Args:
+            field (str): field name
+            value (str): value to match
+
+        Returns:
+            (MetadataTable): filtered table
+        """
+        return self.filter([v == value for v in self.columns[field]])
+
+    def item(self, row: int) -> "MediaPoolItem":
+        """
+        Returns the [``MediaPoolItem``][pydavinci.wrappers.mediapoolitem.MediaPoolItem] at ``row``
+
+        Args:
+            row (int): row index
+
+        Returns:
+            (MediaPoolItem): clip
+        """
+        from pydavinci.wrappers.mediapoolitem import MediaPoolItem
+
+        return MediaPoolItem(self._objs[row])
+
+    def rows(self) -> Iterator[Dict[str, str]]:
+        """
+        Iterates rows as ``dict``s
+
+        Yields:
+            (Dict[str, str]): one row
+        """
+        names = list(self.columns)
+        for values in zip(*self.columns.values(), strict=True):
+            yield dict(zip(names, values, strict=True))
+
+    def to_csv(self, path: str) -> None:
+        """
+        Writes the table to a CSV file, row by row
+
+        Args:
+            path (str): output file path
+        """
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(self.columns)
+            writer.writerows(zip(*self.columns.values(), strict=True))
+
+    def to_parquet(self, path: str, row_group_size: int = 10000) -> None:
+        """
+        Writes the table to a Parquet file, one row group at a time. Needs ``pyarrow``.
+
+        Args:
+            path (str): output file path
+            row_group_size (int, optional): rows per row group. Defaults to ``10000``.
+        """
+        pa = _pyarrow()
+        names = list(self.columns)
+        schema = pa.schema([(name, pa.string()) for name in names])
+        with pa.parquet.ParquetWriter(path, schema) as writer:
+            for start in range(0, max(len(self), 1), row_group_size):
+                chunk = [self.columns[name][start : start + row_group_size] for name in names]
+                # dictionary encoding keeps repeated values, like reel or camera names, small
+                writer.write_table(pa.table(chunk, schema=schema))
+
+
+def read_table(
+    objs: Sequence["PyRemoteMediaPoolItem"],
+    fields: Optional[Sequence[str]] = None,
+    sources: Sequence[str] = SOURCES,
+    batch_size: int = 500,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> MetadataTable:
+    """Builds a [``MetadataTable``][pydavinci.wrappers.metadatatable.MetadataTable], see [``MediaPool.metadata_table``][pydavinci.wrappers.mediapool.MediaPool.metadata_table]."""
+    _check_sources(sources)
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+    readers = [_READERS[source] for source in SOURCES if source in sources]
+
+    columns: Dict[str, List[str]] = {field: [] for field in fields or ()}
+    count = 0
+    for start in range(0, len(objs), batch_size):
+        batch = objs[start : start + batch_size]
+        # one call per clip and source, every field at once
+        fetched: List[Dict[str, Any]] = []
+        for obj in batch:
+            row: Dict[str, Any] = {}
+            for read in readers:
+                row.update(read(obj) or {})
+            fetched.append(row)
+
+        for row in fetched:
+            if fields is None:
+                for field in row:
+                    if field not in columns:
+                        # field first seen on this clip, earlier clips don't have it
+                        columns[field] = [""] * count
+            for field, column in columns.items():
+                value = row.get(field)
+                column.append("" if value is None else _value(value))
+            count += 1
+
+        if progress is not None:
+            progress(count, len(objs))
+
+    return MetadataTable(columns, objs)
+
+
+class ClipWriteResult:
+    """Outcome of a bulk write for one clip, see [``MetadataWriteReport``][pydavinci.wrappers.metadatatable.MetadataWriteReport].
+
+    Attributes:
+        written (List[str]): fields sent to Davinci Resolve
+        unchanged (List[str]): fields skipped because they already had the value
+        failed (List[str]): fields Davinci Resolve refused
+    """
+
+    __slots__ = ("written", "unchanged", "failed", "_obj")
+
+    def __init__(self, obj: "PyRemoteMediaPoolItem") -> None:
+        self._obj = obj
+        self.written: List[str] = []
+        self.unchanged: List[str] = []
+        self.failed: List[str] = []
+
+    def item(self) -> "MediaPoolItem":
+        """
+        Returns the [``MediaPoolItem``][pydavinci.wrappers.mediapoolitem.MediaPoolItem] written to
+
+        Returns:
+            (MediaPoolItem): clip
+        """
+        from pydavinci.wrappers.mediapoolitem import MediaPoolItem
+
+        return MediaPoolItem(self._obj)
+
+    def __repr__(self) -> str:
+        return f"ClipWriteResult(written: {self.written}, unchanged: {len(self.unchanged)}, failed: {self.failed})"
+
+
+class MetadataWriteReport:
+    """Outcome of [``MediaPool.set_metadata``][pydavinci.wrappers.mediapool.MediaPool.set_metadata]
+    and [``MediaPool.set_properties``][pydavinci.wrappers.mediapool.MediaPool.set_properties].
+
+    Attributes:
+        clips (List[ClipWriteResult]): one result per clip, in the order given
+        calls (int): remote calls made, reads and writes
+        baseline (int): remote calls a ``MediaPoolItem.set_metadata`` / ``set_property`` loop makes
+    """
+
+    __slots__ = ("clips", "calls", "baseline")
+
+    def __init__(self) -> None:
+        self.clips: List[ClipWriteResult] = []
+        self.calls = 0
+        self.baseline = 0
+
+    @property
+    def saved(self) -> int:
+        """
+        Returns remote calls saved against the ``set_metadata`` / ``set_property`` loop.
+        Can be negative when almost every value changed and nothing was read before.
+
+        Returns:
+            int: ``baseline - calls``
+        """
+        return self.baseline - self.calls
+
+    @property
+    def failed(self) -> List[ClipWriteResult]:
+        """
+        Returns results of the clips with at least one failed field
+
+        Returns:
+            (List[ClipWriteResult]): failed clips
+        """
+        return [result for result in self.clips if result.failed]
+
+    def __repr__(self) -> str:
+        written = sum(len(result.written) for result in self.clips)
+        return (
+            f"MetadataWriteReport(clips: {len(self.clips)}, written: {written}, "
+            f"failed: {len(self.failed)}, calls: {self.calls}, saved: {self.saved})"
+        )
+
+
+class _CurrentRows:
+    # Row of each clip in ``current``. The remote objects the table was read from are matched
+    # without any call, remote objects fetched again since then by ``GetUniqueId()``.
+
+    __slots__ = ("calls", "_objs", "_by_obj", "_by_uid")
+
+    def __init__(self, current: Optional[MetadataTable]) -> None:
+        self.calls = 0
+        self._objs = current._objs if current is not None else []
+        self._by_obj = {id(obj): row for row, obj in enumerate(self._objs)}
+        self._by_uid: Optional[Dict[str, int]] = None
+
+    def get(self, obj: "PyRemoteMediaPoolItem") -> Optional[int]:
+        row = self._by_obj.get(id(obj))
+        if row is not None or not self._objs:
+            return row
+        if self._by_uid is None:
+            self._by_uid = {other.GetUniqueId(): row for row, other in enumerate(self._objs)}
+            self.calls += len(self._objs)
+        self.calls += 1
+        return self._by_uid.get(obj.GetUniqueId())
+
+
+def write_fields(
+    changes: Sequence[Tuple["PyRemoteMediaPoolItem", Dict[str, Any]]],
+    source: str,
+    current: Optional[MetadataTable] = None,
+) -> MetadataWriteReport:
+    """Writes fields that differ, see [``MediaPool.set_metadata``][pydavinci.wrappers.mediapool.MediaPool.set_metadata]."""
+    _check_sources([source])
+    read = _READERS[source]
+    rows = _CurrentRows(current)
+    report = MetadataWriteReport()
+
+    for obj, fields in changes:
+        result = ClipWriteResult(obj)
+        report.clips.append(result)
+        if not fields:
+            continue
+        # ``SetMetadata`` takes every field at once, ``SetClipProperty`` one at a time
+        report.baseline += 1 if source == "metadata" else len(fields)
+
+        row = rows.get(obj)
+        if row is not None and all(field in current.columns for field in fields):  # type: ignore
+            values = {field: current.columns[field][row] for field in fields}  # type: ignore
+        else:
+            values = read(obj) or {}
+            report.calls += 1
+
+        diff = {}
+        for field, value in fields.items():
+            if str(values.get(field, "")) == str(value):
+                result.unchanged.append(field)
+            else:
+                diff[field] = value
+        if not diff:
+            continue
+
+        if source == "metadata":
+            report.calls += 1
+            ok = obj.SetMetadata({field: str(value) for field, value in diff.items()})
+            (result.written if ok else result.failed).extend(diff)
+        else:
+            for field, value in diff.items():
+                report.calls += 1
+                ok = obj.SetClipProperty(field, value)
+                (result.written if ok else result.failed).append(field)
+
+        if row is not None:
+            # keep ``current`` in step so it can be used for the next write
+            for field in result.written:
+                if field in current.columns:  # type: ignore
+                    current.columns[field][row] = _value(diff[field])  # type: ignore
+
+    report.calls += rows.calls
+    return report
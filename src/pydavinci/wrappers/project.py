@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 from pydavinci.exceptions import ObjectNotFound
+from pydavinci.identity import IdentityMeta
 from pydavinci.main import resolve_obj
 from pydavinci.utils import is_resolve_obj
 from pydavinci.wrappers.gallery import Gallery
@@ -9,11 +10,14 @@ from pydavinci.wrappers.settings.constructor import get_prj_settings
 if TYPE_CHECKING:
     from pydavinci.wrappers._resolve_stubs import PyRemoteProject
     from pydavinci.wrappers.mediapool import MediaPool
+    from pydavinci.wrappers.rendermonitor import RenderMonitor
     from pydavinci.wrappers.settings.constructor import ProjectSettings
     from pydavinci.wrappers.timeline import Timeline
 
 
-class Project:
+class Project(metaclass=IdentityMeta):
+    __slots__ = ("_obj", "_settings", "__weakref__")
+
     def __init__(self, *args: Any) -> None:
         if args:
             if is_resolve_obj(args[0]):
@@ -199,6 +203,37 @@ class Project:
         else:
             return self._obj.StartRendering(job_ids, isInteractiveMode=interactive)
 
+    def render_monitor(
+        self,
+        job_ids: Optional[List[str]] = None,
+        min_interval: float = 0.25,
+        max_interval: float = 5.0,
+    ) -> "RenderMonitor":
+        """
+        Returns a [``RenderMonitor``][pydavinci.wrappers.rendermonitor.RenderMonitor] watching
+        ``job_ids`` from one background thread, instead of polling ``render_status`` per job.
+
+        ```python
+        job_ids = [project.add_renderjob() for _ in range(3)]
+        monitor = project.render_monitor(job_ids)
+        monitor.on_complete(lambda event: print(event.job_id, "done"))
+        project.render(job_ids)
+        monitor.wait()
+        print(monitor.stats)
+        ```
+
+        Args:
+            job_ids (List[str], optional): jobs to watch. Defaults to every job in the render queue.
+            min_interval (float, optional): shortest time between polls, in seconds. Defaults to ``0.25``.
+            max_interval (float, optional): longest time between polls, in seconds. Defaults to ``5``.
+
+        Returns:
+            (RenderMonitor): monitor, not started yet
+        """
+        from pydavinci.wrappers.rendermonitor import RenderMonitor
+
+        return RenderMonitor(self, job_ids, min_interval, max_interval)
+
     def stop_render(self) -> None:
         """
         Stops all rendering.
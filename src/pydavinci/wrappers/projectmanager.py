@@ -11,6 +11,8 @@ if TYPE_CHECKING:
 
 
 class ProjectManager:
+    __slots__ = ("_obj",)
+
     # try:  ## this is for when we do auto-launch
     #     _obj = resolve_obj.GetProjectManager()  # if using this one here, everything fails
     # except AttributeError:
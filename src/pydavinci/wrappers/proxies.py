@@ -0,0 +1,233 @@
+"""
+Proxy matching for [``MediaPool.link_proxies``][pydavinci.wrappers.mediapool.MediaPool.link_proxies].
+
+A match rule is a function called with the clip properties (``Clip Name``, ``File Path``,
+``Reel Name``, ``Start TC``) and the [``ProxyIndex``][pydavinci.wrappers.proxies.ProxyIndex],
+returning candidate proxy paths. Rules run in order and each one narrows the candidates of the
+previous ones, until a single proxy is left.
+
+```python
+def by_scene(clip, proxies):
+    return proxies.by_stem.get(clip["Clip Name"].lower() + "_scene", [])
+
+resolve.media_pool.link_proxies(["/mnt/proxies"], rules=[match_basename, by_scene])
+```
+"""
+
+import os
+import re
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Pattern,
+    Sequence,
+    Set,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from pydavinci.wrappers._resolve_stubs import PyRemoteMediaPoolItem
+    from pydavinci.wrappers.mediapoolitem import MediaPoolItem
+
+PROXY_EXTENSIONS = (".mov", ".mp4", ".mxf")
+PROXY_SUFFIXES = ("_proxy", "_prx", ".proxy")
+# ARRI / RED / Sony style camera reels, A001C003, A001_C003
+REEL_PATTERN = re.compile(r"[A-Z]\d{3}_?C\d{3}", re.IGNORECASE)
+CLIP_FIELDS = ("Clip Name", "File Path", "Reel Name", "Start TC")
+
+MatchRule = Callable[[Dict[str, str], "ProxyIndex"], Iterable[str]]
+
+
+def _stem(path: str, suffixes: Sequence[str] = ()) -> str:
+    stem = os.path.splitext(os.path.basename(path))[0].lower()
+    for suffix in suffixes:
+        if stem.endswith(suffix):
+            return stem[: -len(suffix)]
+    return stem
+
+
+def _reel(text: str, pattern: Pattern[str]) -> Optional[str]:
+    found = pattern.search(text)
+    return found.group(0).upper().replace("_", "") if found else None
+
+
+class ProxyIndex:
+    """Proxy files of a directory tree, indexed by lowercase basename, camera reel and timecode.
+
+    Directories are listed locally. Start timecodes need a ``timecode_reader``, a function
+    returning the start timecode of a file, for example with ``ffprobe``.
+
+    Attributes:
+        by_stem (Dict[str, List[str]]): basename without extension and proxy suffix to paths
+        by_reel (Dict[str, List[str]]): camera reel found in the basename to paths
+        by_timecode (Dict[str, List[str]]): start timecode to paths
+    """
+
+    __slots__ = ("paths", "by_stem", "by_reel", "by_timecode", "reel_pattern")
+
+    def __init__(
+        self,
+        paths: Iterable[str],
+        extensions: Optional[Sequence[str]] = PROXY_EXTENSIONS,
+        suffixes: Sequence[str] = PROXY_SUFFIXES,
+        reel_pattern: Union[str, Pattern[str]] = REEL_PATTERN,
+        timecode_reader: Optional[Callable[[str], Optional[str]]] = None,
+        workers: int = 8,
+    ) -> None:
+        from pydavinci.wrappers.ingest import expand_paths
+
+        self.reel_pattern = (
+            re.compile(reel_pattern) if isinstance(reel_pattern, str) else reel_pattern
+        )
+        self.paths = expand_paths(paths, extensions, workers)
+        self.by_stem: Dict[str, List[str]] = {}
+        self.by_reel: Dict[str, List[str]] = {}
+        self.by_timecode: Dict[str, List[str]] = {}
+        for path in self.paths:
+            stem = _stem(path, suffixes)
+            self.by_stem.setdefault(stem, []).append(path)
+            reel = _reel(stem, self.reel_pattern)
+            if reel:
+                self.by_reel.setdefault(reel, []).append(path)
+            if timecode_reader is not None:
+                timecode = timecode_reader(path)
+                if timecode:
+                    self.by_timecode.setdefault(timecode, []).append(path)
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def __repr__(self) -> str:
+        return f"ProxyIndex(files: {len(self)}, reels: {len(self.by_reel)})"
+
+
+def match_basename(clip: Dict[str, str], proxies: ProxyIndex) -> List[str]:
+    """Proxies with the basename of the clip's ``File Path``, or of its ``Clip Name``."""
+    return proxies.by_stem.get(_stem(clip["File Path"] or clip["Clip Name"]), [])
+
+
+def match_reel(clip: Dict[str, str], proxies: ProxyIndex) -> List[str]:
+    """Proxies with the clip's camera reel, from ``Reel Name`` or its file name, in their basename."""
+    reel = _reel(clip["Reel Name"], proxies.reel_pattern) or _reel(
+        os.path.basename(clip["File Path"] or clip["Clip Name"]), proxies.reel_pattern
+    )
+    return proxies.by_reel.get(reel, []) if reel else []
+
+
+def match_timecode(clip: Dict[str, str], proxies: ProxyIndex) -> List[str]:
+    """Proxies starting at the clip's ``Start TC``. Needs a ``timecode_reader`` on the index."""
+    return proxies.by_timecode.get(clip["Start TC"], [])
+
+
+DEFAULT_RULES: Sequence[MatchRule] = (match_basename, match_reel, match_timecode)
+
+
+class ProxyMatch:
+    """Proxy match of one clip, see [``ProxyMatchReport``][pydavinci.wrappers.proxies.ProxyMatchReport].
+
+    Attributes:
+        clip_name (str): ``Clip Name`` of the clip
+        proxy (str, optional): proxy matched, ``None`` if missing or ambiguous
+        candidates (List[str]): proxies left after every rule
+        linked (bool): ``True`` if the proxy was linked
+    """
+
+    __slots__ = ("clip_name", "proxy", "candidates", "linked", "_obj")
+
+    def __init__(self, obj: "PyRemoteMediaPoolItem", clip_name: str, candidates: List[str]) -> None:
+        self._obj = obj
+        self.clip_name = clip_name
+        self.candidates = candidates
+        self.proxy = candidates[0] if len(candidates) == 1 else None
+        self.linked = False
+
+    def item(self) -> "MediaPoolItem":
+        """
+        Returns the [``MediaPoolItem``][pydavinci.wrappers.mediapoolitem.MediaPoolItem] matched
+
+        Returns:
+            (MediaPoolItem): clip
+        """
+        from pydavinci.wrappers.mediapoolitem import MediaPoolItem
+
+        return MediaPoolItem(self._obj)
+
+    def __repr__(self) -> str:
+        return f"ProxyMatch(clip: {self.clip_name}, proxy: {self.proxy}, candidates: {len(self.candidates)})"
+
+
+class ProxyMatchReport:
+    """Outcome of [``MediaPool.link_proxies``][pydavinci.wrappers.mediapool.MediaPool.link_proxies].
+
+    Attributes:
+        matched (List[ProxyMatch]): clips with exactly one proxy
+        ambiguous (List[ProxyMatch]): clips with several proxies left, nothing linked
+        missing (List[ProxyMatch]): clips without proxy
+        failed (List[ProxyMatch]): matched clips Davinci Resolve refused to link
+    """
+
+    __slots__ = ("matched", "ambiguous", "missing", "failed")
+
+    def __init__(self) -> None:
+        self.matched: List[ProxyMatch] = []
+        self.ambiguous: List[ProxyMatch] = []
+        self.missing: List[ProxyMatch] = []
+        self.failed: List[ProxyMatch] = []
+
+    def __repr__(self) -> str:
+        return (
+            f"ProxyMatchReport(matched: {len(self.matched)}, ambiguous: {len(self.ambiguous)}, "
+            f"missing: {len(self.missing)}, failed: {len(self.failed)})"
+        )
+
+
+def candidates(clip: Dict[str, str], proxies: ProxyIndex, rules: Sequence[MatchRule]) -> List[str]:
+    """
+    Runs ``rules`` for one clip
+
+    Args:
+        clip (Dict[str, str]): clip properties
+        proxies (ProxyIndex): proxy index
+        rules (Sequence[MatchRule]): match rules
+
+    Returns:
+        (List[str]): candidate proxies, sorted
+    """
+    found: Optional[Set[str]] = None
+    for rule in rules:
+        paths = set(rule(clip, proxies))
+        if not paths:
+            continue
+        # a rule narrowing down to nothing is ignored, it doesn't discard earlier matches
+        found = paths if found is None else (found & paths) or found
+        if len(found) == 1:
+            break
+    return sorted(found or ())
+
+
+def match_proxies(
+    objs: Sequence["PyRemoteMediaPoolItem"],
+    proxies: ProxyIndex,
+    rules: Sequence[MatchRule] = DEFAULT_RULES,
+    link: bool = True,
+) -> ProxyMatchReport:
+    """Matches and links proxies, see [``MediaPool.link_proxies``][pydavinci.wrappers.mediapool.MediaPool.link_proxies]."""
+    from pydavinci.wrappers.metadatatable import read_table
+
+    table = read_table(objs, CLIP_FIELDS, ["properties"])
+    report = ProxyMatchReport()
+    for obj, clip in zip(table._objs, table.rows(), strict=True):
+        match = ProxyMatch(obj, clip["Clip Name"], candidates(clip, proxies, rules))
+        if match.proxy is None:
+            (report.ambiguous if match.candidates else report.missing).append(match)
+            continue
+        report.matched.append(match)
+        if link:
+            match.linked = bool(obj.LinkProxyMedia(match.proxy))
+            if not match.linked:
+                report.failed.append(match)
+    return report
@@ -0,0 +1,173 @@
+"""
+Relink planning for [``MediaPool.relink``][pydavinci.wrappers.mediapool.MediaPool.relink].
+
+``RelinkClips`` takes a folder and lets Davinci Resolve look for the clips in it. When media
+moved to several places, the planner finds every clip's new file locally first and groups the
+clips by directory, so each directory is searched by a single ``RelinkClips`` call.
+"""
+
+import os
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from pydavinci.wrappers.storagewalk import scan_tree
+
+if TYPE_CHECKING:
+    from pydavinci.wrappers._resolve_stubs import PyRemoteMediaPool, PyRemoteMediaPoolItem
+    from pydavinci.wrappers.storagewalk import FileEntry
+
+
+def _common_suffix(a: str, b: str) -> int:
+    # number of trailing path components ``a`` and ``b`` share
+    a_parts = a.replace("\\", "/").split("/")
+    b_parts = b.replace("\\", "/").split("/")
+    count = 0
+    for x, y in zip(reversed(a_parts), reversed(b_parts), strict=False):
+        if x != y:
+            break
+        count += 1
+    return count
+
+
+class FileIndex:
+    """Files under candidate roots, indexed by basename, with their size and modification time.
+
+    Directories of the same depth are listed in parallel.
+
+    Attributes:
+        by_name (Dict[str, List[Tuple[str, int, float]]]): basename to ``(path, size, mtime)``
+    """
+
+    __slots__ = ("roots", "by_name", "_count")
+
+    def __init__(self, roots: Iterable[str], workers: int = 16) -> None:
+        self.roots = list(roots)
+        self.by_name: Dict[str, List[FileEntry]] = {}
+        self._count = 0
+        for files in scan_tree(self.roots, workers, stat=True):
+            for entry in files:
+                self.by_name.setdefault(os.path.basename(entry[0]), []).append(entry)
+            self._count += len(files)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __repr__(self) -> str:
+        return f"FileIndex(roots: {len(self.roots)}, files: {len(self)})"
+
+    def resolve(self, path: str) -> Tuple[Optional[str], List[str]]:
+        """
+        Finds the new location of ``path``.
+
+        Candidates share the basename of ``path``. The ones sharing the most trailing directories
+        with ``path`` are kept. If they all have the same size they're copies of the same file,
+        and the most recently modified one is picked.
+
+        Args:
+            path (str): original file path
+
+        Returns:
+            (Tuple[Optional[str], List[str]]): new path, or ``None`` if missing or ambiguous, and the candidates left
+        """
+        found = self.by_name.get(os.path.basename(path.replace("\\", "/")), [])
+        if not found:
+            return None, []
+        best = max(_common_suffix(path, entry[0]) for entry in found)
+        found = [entry for entry in found if _common_suffix(path, entry[0]) == best]
+        if len({entry[1] for entry in found}) > 1:
+            return None, sorted(entry[0] for entry in found)
+        return max(found, key=lambda entry: entry[2])[0], [entry[0] for entry in found]
+
+
+class RelinkPlan:
+    """Clips to relink, grouped by the directory holding their new file.
+
+    Attributes:
+        groups (Dict[str, List[str]]): target directory to original file paths
+        missing (List[str]): original file paths without candidate file
+        ambiguous (Dict[str, List[str]]): original file path to candidate files of different
+            sizes
+        results (Dict[str, bool]): target directory to ``RelinkClips`` result, after ``apply``
+    """
+
+    __slots__ = ("groups", "missing", "ambiguous", "results", "_paths", "_pool_obj")
+
+    def __init__(self, pool_obj: "PyRemoteMediaPool") -> None:
+        self._pool_obj = pool_obj
+        self.groups: Dict[str, List[str]] = {}
+        self.missing: List[str] = []
+        self.ambiguous: Dict[str, List[str]] = {}
+        self.results: Dict[str, bool] = {}
+        self._paths: Dict[str, List[Tuple[Any, str]]] = {}
+
+    def add(self, obj: "PyRemoteMediaPoolItem", path: str, new_path: str) -> None:
+        """
+        Plans relinking a clip to ``new_path``
+
+        Args:
+            obj (PyRemoteMediaPoolItem): clip
+            path (str): original file path, for the report
+            new_path (str): file to relink to
+        """
+        directory = os.path.dirname(new_path)
+        self.groups.setdefault(directory, []).append(path)
+        self._paths.setdefault(directory, []).append((obj, new_path))
+
+    @property
+    def calls(self) -> int:
+        """
+        Returns ``RelinkClips`` calls the plan needs
+
+        Returns:
+            int: one per target directory
+        """
+        return len(self.groups)
+
+    def apply(self) -> Dict[str, bool]:
+        """
+        Relinks every group with one ``RelinkClips`` call
+
+        Returns:
+            (Dict[str, bool]): target directory to result
+        """
+        from pydavinci.wrappers.mediapoolindex import cached_index
+
+        index = cached_index(self._pool_obj)
+        for directory, pairs in self._paths.items():
+            ok = bool(self._pool_obj.RelinkClips([obj for obj, _ in pairs], directory))
+            self.results[directory] = ok
+            if ok and index is not None:
+                for obj, new_path in pairs:
+                    index._properties_changed(obj, {"File Path": new_path})
+        return self.results
+
+    def __repr__(self) -> str:
+        clips = sum(len(paths) for paths in self.groups.values())
+        return (
+            f"RelinkPlan(clips: {clips}, directories: {len(self.groups)}, "
+            f"missing: {len(self.missing)}, ambiguous: {len(self.ambiguous)})"
+        )
+
+
+def plan_relink(
+    pool_obj: "PyRemoteMediaPool",
+    objs: Sequence["PyRemoteMediaPoolItem"],
+    files: FileIndex,
+    only_offline: bool = True,
+) -> RelinkPlan:
+    """Builds a [``RelinkPlan``][pydavinci.wrappers.relink.RelinkPlan], see [``MediaPool.relink``][pydavinci.wrappers.mediapool.MediaPool.relink]."""
+    from pydavinci.wrappers.metadatatable import read_table
+
+    table = read_table(objs, ["File Path", "Online Status"], ["properties"])
+    plan = RelinkPlan(pool_obj)
+    for obj, clip in zip(table._objs, table.rows(), strict=True):
+        if not clip["File Path"] or (only_offline and clip["Online Status"] != "Offline"):
+            continue
+        path = clip["File Path"]
+        new_path, candidates = files.resolve(path)
+        if new_path is not None:
+            plan.add(obj, path, new_path)
+        elif candidates:
+            plan.ambiguous[path] = candidates
+        else:
+            plan.missing.append(path)
+    return plan
@@ -0,0 +1,674 @@
+"""
+Render jobs spread across several Davinci Resolve instances.
+
+Each [``RenderNode``][pydavinci.wrappers.renderfarm.RenderNode] holds its own connection, apart
+from ``pydavinci.main.resolve_obj``. A [``RenderFarm``][pydavinci.wrappers.renderfarm.RenderFarm]
+keeps the jobs and hands them to the least loaded nodes, a few at a time, so a node going down
+only loses the jobs it was rendering. Those are queued again on the other nodes.
+
+```python
+farm = RenderFarm([RenderNode("render-01", host="10.0.0.11"), RenderNode("render-02", host="10.0.0.12")])
+farm.submit_queue(resolve.project)  # jobs added with Project.add_renderjob
+farm.submit({"TargetDir": "/mnt/renders", "CustomName": "reel_2"}, timeline="Reel 2")
+farm.run()
+print(farm)
+```
+"""
+
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from pydavinci.exceptions import ObjectNotFound, TimelineNotFound
+from pydavinci.main import ResolveConnection, get_resolve
+from pydavinci.wrappers.rendermonitor import DONE
+
+if TYPE_CHECKING:
+    from pydavinci.wrappers._resolve_stubs import (
+        PyRemoteProject,
+        PyRemoteResolve,
+        PyRemoteTimeline,
+    )
+    from pydavinci.wrappers.project import Project
+
+POLICIES = ("least_loaded", "shortest_job_first")
+
+# GetRenderJobList keys to the SetRenderSettings keys rebuilding the job
+JOB_SETTINGS = {
+    "TargetDir": "TargetDir",
+    "OutputFilename": "CustomName",
+    "IsExportVideo": "ExportVideo",
+    "IsExportAudio": "ExportAudio",
+    "FormatWidth": "FormatWidth",
+    "FormatHeight": "FormatHeight",
+    "FrameRate": "FrameRate",
+    "MarkIn": "MarkIn",
+    "MarkOut": "MarkOut",
+}
+
+# a node refusing a job, the job is tried elsewhere and the node kept
+_REJECTED = (ObjectNotFound, TimelineNotFound, ValueError)
+# a node unreachable, its jobs are queued again elsewhere. ConnectionError and TimeoutError
+# are OSErrors
+_UNREACHABLE = (OSError,)
+
+
+class FarmJob:
+    """One render handled by a [``RenderFarm``][pydavinci.wrappers.renderfarm.RenderFarm].
+
+    Attributes:
+        name (str): job name, for reports
+        settings (Dict[str, Any]): settings passed to ``SetRenderSettings``
+        timeline (str, optional): timeline to render, the node's current timeline if ``None``
+        preset (str, optional): render preset loaded before ``settings``
+        format (str, optional): render format, ``mov``, set with ``codec`` before ``settings``
+        codec (str, optional): render codec, ``H264``
+        frames (int, optional): frames to render, from ``MarkIn`` and ``MarkOut`` or read once
+            the job is queued on a node
+        status (str): ``"pending"``, ``"rendering"``, ``"complete"`` or ``"failed"``
+        node (RenderNode, optional): node rendering the job
+        job_id (str, optional): render job id on ``node``
+        percentage (int): completion percentage on ``node``
+        eta (float, optional): seconds left, as estimated by ``node``
+        attempts (int): renders that failed so far
+        errors (List[str]): why previous renders stopped
+    """
+
+    __slots__ = (
+        "name",
+        "settings",
+        "timeline",
+        "preset",
+        "format",
+        "codec",
+        "frames",
+        "status",
+        "node",
+        "job_id",
+        "percentage",
+        "eta",
+        "attempts",
+        "errors",
+        "_failed_on",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        settings: Dict[str, Any],
+        timeline: Optional[str] = None,
+        preset: Optional[str] = None,
+        frames: Optional[int] = None,
+        format: Optional[str] = None,
+        codec: Optional[str] = None,
+    ) -> None:
+        if (format is None) != (codec is None):
+            raise ValueError("Render format and codec must be provided together")
+        self.name = name
+        self.settings = settings
+        self.timeline = timeline
+        self.preset = preset
+        self.format = format
+        self.codec = codec
+        if "MarkIn" not in settings and "MarkOut" not in settings:
+            # nodes keep the marks of the previous job otherwise
+            settings.setdefault("SelectAllFrames", True)
+        if frames is None and settings.get("SelectAllFrames") is False:
+            if "MarkIn" in settings and "MarkOut" in settings:
+                frames = int(settings["MarkOut"]) - int(settings["MarkIn"]) + 1
+        self.frames = frames
+        self.status = "pending"
+        self.node: Optional["RenderNode"] = None
+        self.job_id: Optional[str] = None
+        self.percentage = 0
+        self.eta: Optional[float] = None
+        self.attempts = 0
+        self.errors: List[str] = []
+        self._failed_on: Set[str] = set()
+
+    def _requeue(self, reason: str) -> None:
+        self.errors.append(reason)
+        self.status = "pending"
+        self.node = None
+        self.job_id = None
+        self.percentage = 0
+        self.eta = None
+
+    def __repr__(self) -> str:
+        node = self.node.name if self.node is not None else None
+        return f"FarmJob(name: {self.name}, status: {self.status}, node: {node}, attempts: {self.attempts})"
+
+
+class RenderNode:
+    """One Davinci Resolve instance of a [``RenderFarm``][pydavinci.wrappers.renderfarm.RenderFarm].
+
+    Args:
+        name (str): node name, for reports
+        host (str, optional): address of the instance, passed to ``scriptapp("Resolve", host)``.
+            Defaults to the local instance.
+        remote (PyRemoteResolve, optional): already connected remote Resolve object, used
+            instead of ``host``
+        factory (Callable, optional): callable returning the remote Resolve object, used instead
+            of ``host``, also when reconnecting
+        project (str, optional): project to load on the node. Defaults to the current project.
+        capacity (int, optional): jobs queued on the node at once. Davinci Resolve renders them
+            one after the other, so the default of ``1`` keeps the others in the farm, free to
+            go to whichever node is done first.
+
+    Attributes:
+        connection (ResolveConnection): connection to the instance
+        alive (bool): ``False`` once the node stopped answering
+        error (BaseException, optional): what took the node down
+        jobs (List[FarmJob]): jobs queued or rendering on the node
+    """
+
+    def __init__(
+        self,
+        name: str,
+        host: Optional[str] = None,
+        remote: Optional["PyRemoteResolve"] = None,
+        factory: Optional[Callable[[], "PyRemoteResolve"]] = None,
+        project: Optional[str] = None,
+        capacity: int = 1,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("A render node needs a capacity of at least 1")
+        self.name = name
+        self.project_name = project
+        self.capacity = capacity
+        if factory is None:
+            # a node built from a remote object reuses it when reconnecting
+            factory = (
+                (lambda: remote) if remote is not None else functools.partial(get_resolve, host)
+            )
+        self.connection = ResolveConnection(factory)
+        self.alive = True
+        self.error: Optional[BaseException] = None
+        self.jobs: List[FarmJob] = []
+        self._project: Optional["PyRemoteProject"] = None
+        self._timelines: Optional[Dict[str, "PyRemoteTimeline"]] = None
+        # render job ids left on the node when it went down
+        self._orphans: List[str] = []
+        self._frames_done = 0
+        self._seconds = 0.0
+
+    @property
+    def fps(self) -> Optional[float]:
+        """
+        Returns frames per second measured on the jobs completed by the node
+
+        Returns:
+            (Optional[float]): frames per second, ``None`` until a job completes
+        """
+        return self._frames_done / self._seconds if self._seconds > 0 else None
+
+    def project_obj(self) -> "PyRemoteProject":
+        """
+        Returns the remote project jobs are rendered from, connecting if needed
+
+        Returns:
+            (PyRemoteProject): remote project
+        """
+        if self._project is None:
+            manager = self.connection.GetProjectManager()
+            project = manager.GetCurrentProject()
+            if self.project_name is not None and (
+                project is None or project.GetName() != self.project_name
+            ):
+                project = manager.LoadProject(self.project_name)
+            if project is None:
+                raise ConnectionError(f"No project to render from on node {self.name}")
+            self._project = project
+        return self._project
+
+    def _open_timeline(self, project: "PyRemoteProject", name: str) -> None:
+        if self._timelines is None or name not in self._timelines:
+            # listed once per connection, and again for timelines added since
+            self._timelines = {}
+            for i in range(project.GetTimelineCount()):
+                found = project.GetTimelineByIndex(i + 1)
+                if found is not None:
+                    self._timelines[found.GetName()] = found
+        timeline = self._timelines.get(name)
+        if timeline is None or not project.SetCurrentTimeline(timeline):
+            raise TimelineNotFound(extra=f"Timeline {name} not found on render node {self.name}")
+
+    def start(self, job: FarmJob) -> str:
+        """
+        Queues ``job`` on the node and starts rendering it
+
+        Args:
+            job (FarmJob): job to render
+
+        Raises:
+            ObjectNotFound: if the render preset doesn't exist on the node
+            TimelineNotFound: if the timeline doesn't exist on the node
+            ValueError: if the node refused the format, the settings or the job
+
+        Returns:
+            str: render job id on the node
+        """
+        project = self.project_obj()
+        if job.timeline is not None:
+            self._open_timeline(project, job.timeline)
+        if job.preset is not None and not project.LoadRenderPreset(job.preset):
+            raise ObjectNotFound(f"Render preset {job.preset} not found on node {self.name}")
+        if job.format is not None and job.codec is not None:
+            if not project.SetCurrentRenderFormatAndCodec(job.format, job.codec):
+                raise ValueError(
+                    f"Render node {self.name} has no {job.format} {job.codec} codec for {job.name}"
+                )
+        if job.settings and not project.SetRenderSettings(job.settings):
+            raise ValueError(f"Render node {self.name} refused the settings of {job.name}")
+        job_id = project.AddRenderJob()
+        if not job_id:
+            raise ValueError(f"Render node {self.name} couldn't add {job.name}")
+        if job.frames is None:
+            for queued in project.GetRenderJobList() or []:
+                if queued["JobId"] == job_id:
+                    job.frames = int(queued.get("MarkOut", 0)) - int(queued.get("MarkIn", 0)) + 1
+        if not project.StartRendering([job_id]):
+            project.DeleteRenderJob(job_id)
+            raise ValueError(f"Render node {self.name} couldn't start {job.name}")
+
+        job.status = "rendering"
+        job.node = self
+        job.job_id = job_id
+        job.percentage = 0
+        job.eta = None
+        self.jobs.append(job)
+        return job_id
+
+    def poll(self) -> List[Tuple[FarmJob, Dict[str, Any]]]:
+        """
+        Reads the status of the jobs on the node, one ``GetRenderJobStatus`` call each
+
+        Returns:
+            (List[Tuple[FarmJob, Dict[str, Any]]]): jobs and their status
+        """
+        project = self.project_obj()
+        statuses = []
+        for job in self.jobs:
+            # set by ``start`` for every job on the node
+            status = project.GetRenderJobStatus(job.job_id) if job.job_id else None
+            statuses.append((job, status or {}))
+        return statuses
+
+    def _measure(self, job: FarmJob, status: Dict[str, Any]) -> None:
+        taken = int(status.get("TimeTakenToRenderInMs", 0)) / 1000
+        if job.frames and taken > 0:
+            self._frames_done += job.frames
+            self._seconds += taken
+
+    def _down(self, error: BaseException) -> List[FarmJob]:
+        self.alive = False
+        self.error = error
+        self._orphans += [job.job_id for job in self.jobs if job.job_id]
+        self._project = None
+        self._timelines = None
+        self.connection.reset()
+        lost, self.jobs = self.jobs, []
+        return lost
+
+    def reconnect(self) -> bool:
+        """
+        Connects again to a node that went down, and stops the renders left on it
+
+        Returns:
+            bool: ``True`` if the node is back
+        """
+        try:
+            self.connection.reconnect()
+            project = self.project_obj()
+            if self._orphans:
+                # these jobs were queued again elsewhere
+                project.StopRendering()
+                for job_id in self._orphans:
+                    project.DeleteRenderJob(job_id)
+                self._orphans = []
+        except Exception as e:
+            self.error = e
+            self._project = None
+            return False
+        self.alive = True
+        self.error = None
+        return True
+
+    def __repr__(self) -> str:
+        state = "alive" if self.alive else "down"
+        return f"RenderNode(name: {self.name}, {state}, jobs: {len(self.jobs)})"
+
+
+def _poll(node: RenderNode) -> Tuple[List[Tuple[FarmJob, Dict[str, Any]]], Optional[Exception]]:
+    try:
+        return node.poll(), None
+    except _UNREACHABLE as e:
+        return [], e
+
+
+class RenderFarm:
+    """Spreads render jobs across several [``RenderNode``][pydavinci.wrappers.renderfarm.RenderNode].
+
+    Jobs wait in the farm until a node has room for them. With the ``"least_loaded"`` policy
+    they're handed out in submission order, with ``"shortest_job_first"`` the ones with the
+    fewest frames go first, unknown lengths last. Either way each job goes to the node with the
+    least work queued, in seconds at the speed measured on that node.
+
+    A node raising on a call is marked down and its jobs go back to the queue. It's tried again
+    every ``retry_interval`` seconds. A job failing or cancelled on a node is retried on another
+    node, up to ``max_attempts`` renders.
+
+    Args:
+        nodes (Sequence[RenderNode]): render nodes
+        policy (str, optional): ``"least_loaded"`` or ``"shortest_job_first"``
+        max_attempts (int, optional): renders of a job before it's marked failed
+        min_interval (float, optional): shortest time between polls, in seconds
+        max_interval (float, optional): longest time between polls, in seconds
+        retry_interval (float, optional): seconds between reconnection attempts to a node down
+        clock (Callable[[], float], optional): time source
+        sleep (Callable[[float], None], optional): waits between polls in ``run``
+
+    Attributes:
+        jobs (List[FarmJob]): every job submitted, in submission order
+        requeues (int): times a job was queued again after a node or a render failed
+    """
+
+    def __init__(
+        self,
+        nodes: Sequence[RenderNode],
+        policy: str = "least_loaded",
+        max_attempts: int = 3,
+        min_interval: float = 0.25,
+        max_interval: float = 5.0,
+        retry_interval: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if not nodes:
+            raise ValueError("A render farm needs at least one node")
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown policy {policy}, use one of {', '.join(POLICIES)}")
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if not 0 < min_interval <= max_interval:
+            raise ValueError("Intervals must be positive, with min_interval <= max_interval")
+        self.nodes = list(nodes)
+        self.policy = policy
+        self.max_attempts = max_attempts
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.retry_interval = retry_interval
+        self._clock = clock
+        self._sleep = sleep
+        self.jobs: List[FarmJob] = []
+        self.requeues = 0
+        self._down_at: Dict[str, float] = {}
+
+    def submit(
+        self,
+        settings: Optional[Dict[str, Any]] = None,
+        timeline: Optional[str] = None,
+        preset: Optional[str] = None,
+        frames: Optional[int] = None,
+        name: Optional[str] = None,
+        format: Optional[str] = None,
+        codec: Optional[str] = None,
+    ) -> FarmJob:
+        """
+        Adds a job to the farm. It starts on the next [``step``][pydavinci.wrappers.renderfarm.RenderFarm.step].
+
+        Args:
+            settings (Dict[str, Any], optional): render settings, see
+                [``Project.set_render_settings``][pydavinci.wrappers.project.Project.set_render_settings].
+                Without ``MarkIn`` and ``MarkOut`` the whole timeline is rendered. Other settings
+                left out keep their current value on the node.
+            timeline (str, optional): timeline to render. Defaults to each node's current timeline.
+            preset (str, optional): render preset loaded before ``settings``
+            frames (int, optional): frames to render, for scheduling. Defaults to
+                ``MarkOut - MarkIn + 1`` when ``SelectAllFrames`` is ``False``.
+            name (str, optional): job name. Defaults to ``"Job <n>"``.
+            format (str, optional): render format, see
+                [``Project.set_render_format_and_codec``][pydavinci.wrappers.project.Project.set_render_format_and_codec].
+                Defaults to each node's current format.
+            codec (str, optional): render codec, required with ``format``
+
+        Raises:
+            ValueError: if only one of ``format`` and ``codec`` is provided
+
+        Returns:
+            (FarmJob): job
+        """
+        job = FarmJob(
+            name or f"Job {len(self.jobs) + 1}",
+            dict(settings or {}),
+            timeline,
+            preset,
+            frames,
+            format,
+            codec,
+        )
+        self.jobs.append(job)
+        return job
+
+    def submit_queue(
+        self, project: "Project", job_ids: Optional[Sequence[str]] = None
+    ) -> List[FarmJob]:
+        """
+        Adds jobs from the render queue of ``project``, created with
+        [``Project.add_renderjob``][pydavinci.wrappers.project.Project.add_renderjob].
+        The jobs are copied with their preset, format and codec, they stay in the queue of
+        ``project``.
+
+        Args:
+            project (Project): project holding the jobs
+            job_ids (Sequence[str], optional): jobs to add. Defaults to every job.
+
+        Returns:
+            (List[FarmJob]): jobs added
+        """
+        added = []
+        for queued in project._obj.GetRenderJobList() or []:
+            if job_ids is not None and queued["JobId"] not in job_ids:
+                continue
+            settings = {new: queued[key] for key, new in JOB_SETTINGS.items() if key in queued}
+            settings["SelectAllFrames"] = False
+            # "Custom" when the job wasn't made from a preset
+            preset = queued.get("PresetName")
+            has_codec = queued.get("VideoFormat") and queued.get("VideoCodec")
+            added.append(
+                self.submit(
+                    settings,
+                    timeline=queued.get("TimelineName") or None,
+                    preset=preset if preset and preset != "Custom" else None,
+                    name=queued.get("RenderJobName"),
+                    format=queued["VideoFormat"] if has_codec else None,
+                    codec=queued["VideoCodec"] if has_codec else None,
+                )
+            )
+        return added
+
+    def _jobs(self, status: str) -> List[FarmJob]:
+        return [job for job in self.jobs if job.status == status]
+
+    @property
+    def pending(self) -> List[FarmJob]:
+        """Jobs waiting for a node."""
+        return self._jobs("pending")
+
+    @property
+    def rendering(self) -> List[FarmJob]:
+        """Jobs queued or rendering on a node."""
+        return self._jobs("rendering")
+
+    @property
+    def completed(self) -> List[FarmJob]:
+        """Jobs rendered."""
+        return self._jobs("complete")
+
+    @property
+    def failed(self) -> List[FarmJob]:
+        """Jobs that failed ``max_attempts`` times."""
+        return self._jobs("failed")
+
+    @property
+    def done(self) -> bool:
+        """``True`` once every job is complete or failed."""
+        return all(job.status in ("complete", "failed") for job in self.jobs)
+
+    def load(self, node: RenderNode) -> float:
+        """
+        Returns the work queued on ``node``, in seconds at the speed measured on it.
+        Nodes without measure yet are assumed as fast as the others on average.
+
+        Args:
+            node (RenderNode): render node
+
+        Returns:
+            float: seconds of rendering left
+        """
+        known = [job.frames for job in self.jobs if job.frames]
+        default = sum(known) / len(known) if known else 1.0
+        frames = sum((job.frames or default) * (100 - job.percentage) / 100 for job in node.jobs)
+        measured = [n.fps for n in self.nodes if n.fps is not None]
+        fps = node.fps or (sum(measured) / len(measured) if measured else 1.0)
+        return frames / fps
+
+    def _node_down(self, node: RenderNode, error: BaseException) -> None:
+        for job in node._down(error):
+            job._requeue(f"Node {node.name} down: {error!r}")
+            self.requeues += 1
+        self._down_at[node.name] = self._clock()
+
+    def _job_failed(self, job: FarmJob, node: RenderNode, reason: str) -> None:
+        if job in node.jobs:
+            node.jobs.remove(job)
+        job._failed_on.add(node.name)
+        job.attempts += 1
+        if job.attempts >= self.max_attempts:
+            job.errors.append(reason)
+            job.status = "failed"
+            return
+        job._requeue(reason)
+        self.requeues += 1
+
+    def _update(self, node: RenderNode, job: FarmJob, status: Dict[str, Any]) -> None:
+        state = status.get("JobStatus")
+        if not status:
+            # deleted from the node's queue, or the node restarted
+            node.jobs.remove(job)
+            job._requeue(f"Job missing from the render queue of {node.name}")
+            self.requeues += 1
+        elif state == "Complete":
+            node.jobs.remove(job)
+            node._measure(job, status)
+            job.status = "complete"
+            job.percentage = 100
+            job.eta = None
+        elif state in DONE:
+            self._job_failed(job, node, f"{state} on {node.name}")
+        else:
+            job.percentage = int(status.get("CompletionPercentage", 0))
+            eta = status.get("EstimatedTimeRemainingInMs")
+            job.eta = int(eta) / 1000 if eta is not None else None
+
+    def _revive(self) -> None:
+        now = self._clock()
+        for node in self.nodes:
+            if node.alive or now - self._down_at.get(node.name, now) < self.retry_interval:
+                continue
+            if node.reconnect():
+                del self._down_at[node.name]
+            else:
+                self._down_at[node.name] = now
+
+    def _dispatch(self) -> None:
+        pending = self.pending
+        if self.policy == "shortest_job_first":
+            pending.sort(key=lambda job: (job.frames is None, job.frames or 0))
+        for job in pending:
+            free = [n for n in self.nodes if n.alive and len(n.jobs) < n.capacity]
+            if not free:
+                return
+            alive = [n for n in self.nodes if n.alive]
+            fresh = [n for n in free if n.name not in job._failed_on]
+            if not fresh and any(n.name not in job._failed_on for n in alive):
+                # a node the job didn't fail on will free up
+                continue
+            node = min(fresh or free, key=self.load)
+            try:
+                node.start(job)
+            except _REJECTED as e:
+                self._job_failed(job, node, f"{node.name}: {e}")
+            except _UNREACHABLE as e:
+                self._node_down(node, e)
+
+    def step(self) -> bool:
+        """
+        Polls every busy node once, in parallel, requeues the jobs of nodes down and of failed
+        renders, then starts pending jobs on the nodes with room for them
+
+        Returns:
+            bool: ``True`` if every job is done
+        """
+        self._revive()
+        busy = [node for node in self.nodes if node.alive and node.jobs]
+        if busy:
+            with ThreadPoolExecutor(max_workers=len(busy)) as pool:
+                results = list(pool.map(_poll, busy))
+            for node, (statuses, error) in zip(busy, results, strict=True):
+                if error is not None:
+                    self._node_down(node, error)
+                    continue
+                for job, status in statuses:
+                    self._update(node, job, status)
+        self._dispatch()
+        return self.done
+
+    def next_interval(self) -> float:
+        """
+        Returns seconds until the next poll: half the smallest time left of the rendering jobs,
+        within ``min_interval`` and ``max_interval``
+
+        Returns:
+            float: seconds
+        """
+        left = [job.eta for job in self.rendering if job.eta is not None]
+        if not left:
+            return self.min_interval if self.rendering else self.max_interval
+        return min(max(min(left) / 2, self.min_interval), self.max_interval)
+
+    def run(self, timeout: Optional[float] = None) -> bool:
+        """
+        Steps until every job is done, or ``timeout`` seconds
+
+        Args:
+            timeout (float, optional): seconds to run. Defaults to no timeout.
+
+        Returns:
+            bool: ``True`` if every job is done
+        """
+        started = self._clock()
+        while not self.step():
+            if timeout is not None and self._clock() - started >= timeout:
+                return False
+            self._sleep(self.next_interval())
+        return True
+
+    def __repr__(self) -> str:
+        alive = sum(node.alive for node in self.nodes)
+        return (
+            f"RenderFarm(nodes: {alive}/{len(self.nodes)} alive, complete: {len(self.completed)}, "
+            f"failed: {len(self.failed)}, rendering: {len(self.rendering)}, "
+            f"pending: {len(self.pending)}, requeues: {self.requeues})"
+        )
@@ -0,0 +1,397 @@
+"""
+Render job monitoring for [``Project.render_monitor``][pydavinci.wrappers.project.Project.render_monitor].
+
+One background thread polls the status of every watched job, and delivers the changes to
+callbacks or to an ``asyncio`` iterator.
+"""
+
+import asyncio
+import threading
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+)
+
+if TYPE_CHECKING:
+    from pydavinci.wrappers._resolve_stubs import PyRemoteProject
+    from pydavinci.wrappers.project import Project
+
+DONE = ("Complete", "Failed", "Cancelled")
+
+
+class RenderStats:
+    """Throughput of the jobs watched by a [``RenderMonitor``][pydavinci.wrappers.rendermonitor.RenderMonitor].
+
+    Attributes:
+        frames (float): frames rendered, partly rendered jobs counted by completion percentage
+        elapsed (float): seconds since the monitor started
+        completed (int): jobs complete
+        failed (int): jobs failed or cancelled
+        remaining (int): jobs queued or rendering
+    """
+
+    __slots__ = ("frames", "elapsed", "completed", "failed", "remaining")
+
+    def __init__(
+        self, frames: float, elapsed: float, completed: int, failed: int, remaining: int
+    ) -> None:
+        self.frames = frames
+        self.elapsed = elapsed
+        self.completed = completed
+        self.failed = failed
+        self.remaining = remaining
+
+    @property
+    def fps(self) -> float:
+        """
+        Returns frames rendered per second
+
+        Returns:
+            float: frames per second
+        """
+        return self.frames / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def jobs_per_hour(self) -> float:
+        """
+        Returns jobs finished per hour, failed ones included
+
+        Returns:
+            float: jobs per hour
+        """
+        done = self.completed + self.failed
+        return done * 3600 / self.elapsed if self.elapsed > 0 else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"RenderStats(fps: {self.fps:.1f}, jobs/hour: {self.jobs_per_hour:.1f}, "
+            f"completed: {self.completed}, failed: {self.failed}, remaining: {self.remaining})"
+        )
+
+
+class RenderEvent:
+    """One change seen by a [``RenderMonitor``][pydavinci.wrappers.rendermonitor.RenderMonitor].
+
+    Attributes:
+        kind (str): ``"progress"``, ``"complete"`` or ``"failed"``. Cancelled jobs are ``"failed"``.
+        job_id (str): render job id
+        status (Dict[str, Any]): ``GetRenderJobStatus`` result
+        stats (RenderStats): throughput of every watched job at the time of the event
+    """
+
+    __slots__ = ("kind", "job_id", "status", "stats")
+
+    def __init__(self, kind: str, job_id: str, status: Dict[str, Any], stats: RenderStats) -> None:
+        self.kind = kind
+        self.job_id = job_id
+        self.status = status
+        self.stats = stats
+
+    @property
+    def percentage(self) -> int:
+        """
+        Returns the job completion percentage
+
+        Returns:
+            int: ``0`` to ``100``
+        """
+        return int(self.status.get("CompletionPercentage", 0))
+
+    def __repr__(self) -> str:
+        return f"RenderEvent(kind: {self.kind}, job: {self.job_id}, percentage: {self.percentage})"
+
+
+class RenderMonitor:
+    """Watches render jobs from one background thread.
+
+    Every poll asks for the status of the jobs still queued or rendering, one
+    ``GetRenderJobStatus`` call each. The next poll is scheduled from the smallest
+    ``EstimatedTimeRemainingInMs``, so long renders are polled rarely and the end of a job is
+    noticed quickly, within ``min_interval`` and ``max_interval``.
+
+    ```python
+    monitor = project.render_monitor()
+    monitor.on_progress(lambda e: print(e.job_id, e.percentage, f"{e.stats.fps:.0f} fps"))
+    monitor.on_failure(lambda e: print("failed", e.job_id))
+    project.render()
+    with monitor:
+        monitor.wait()
+    ```
+
+    Or, from ``asyncio`` code:
+
+    ```python
+    async for event in project.render_monitor().events():
+        print(event)
+    ```
+    """
+
+    def __init__(
+        self,
+        project: "Project",
+        job_ids: Optional[Sequence[str]] = None,
+        min_interval: float = 0.25,
+        max_interval: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not 0 < min_interval <= max_interval:
+            raise ValueError("Intervals must be positive, with min_interval <= max_interval")
+        self._project_obj: "PyRemoteProject" = project._obj
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self._clock = clock
+
+        jobs = self._project_obj.GetRenderJobList() or []
+        # frames per job, from the job marks
+        self._frames: Dict[str, int] = {
+            job["JobId"]: int(job.get("MarkOut", 0)) - int(job.get("MarkIn", 0)) + 1
+            for job in jobs
+            if job_ids is None or job["JobId"] in job_ids
+        }
+        self._status: Dict[str, Dict[str, Any]] = {}
+        self._listeners: Dict[str, List[Callable[[RenderEvent], None]]] = {
+            "progress": [],
+            "complete": [],
+            "failed": [],
+        }
+        self._started_at: Optional[float] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._done = threading.Event()
+        # events of the iterators waiting for the thread to end
+        self._waiters: List[threading.Event] = []
+        self._lock = threading.Lock()
+        self.polls = 0
+        """Polls made so far"""
+        self.error: Optional[BaseException] = None
+        """Exception that stopped the background thread, if any"""
+
+    @property
+    def job_ids(self) -> List[str]:
+        """
+        Returns ids of the jobs watched
+
+        Returns:
+            (List[str]): job ids
+        """
+        return list(self._frames)
+
+    def on_progress(self, callback: Callable[[RenderEvent], None]) -> None:
+        """
+        Registers ``callback`` to be called when a job completion percentage changes
+
+        Args:
+            callback (Callable[[RenderEvent], None]): function to call, from the monitor thread
+        """
+        self._listeners["progress"].append(callback)
+
+    def on_complete(self, callback: Callable[[RenderEvent], None]) -> None:
+        """
+        Registers ``callback`` to be called when a job completes
+
+        Args:
+            callback (Callable[[RenderEvent], None]): function to call, from the monitor thread
+        """
+        self._listeners["complete"].append(callback)
+
+    def on_failure(self, callback: Callable[[RenderEvent], None]) -> None:
+        """
+        Registers ``callback`` to be called when a job fails or is cancelled
+
+        Args:
+            callback (Callable[[RenderEvent], None]): function to call, from the monitor thread
+        """
+        self._listeners["failed"].append(callback)
+
+    @property
+    def done(self) -> bool:
+        """``True`` once every watched job is complete, failed or cancelled."""
+        return all(self._status.get(job, {}).get("JobStatus") in DONE for job in self._frames)
+
+    @property
+    def stats(self) -> RenderStats:
+        """
+        Returns current throughput of the watched jobs
+
+        Returns:
+            (RenderStats): throughput
+        """
+        frames = 0.0
+        completed = failed = 0
+        for job, total in self._frames.items():
+            state = self._status.get(job, {})
+            status = state.get("JobStatus")
+            if status == "Complete":
+                completed += 1
+                frames += total
+            elif status in DONE:
+                failed += 1
+            else:
+                frames += total * int(state.get("CompletionPercentage", 0)) / 100
+        elapsed = 0.0 if self._started_at is None else self._clock() - self._started_at
+        remaining = len(self._frames) - completed - failed
+        return RenderStats(frames, elapsed, completed, failed, remaining)
+
+    def poll(self) -> List[RenderEvent]:
+        """
+        Reads the status of every unfinished job once and calls the callbacks.
+        The background thread calls it, it can also be called directly.
+
+        Returns:
+            (List[RenderEvent]): events of this poll
+        """
+        with self._lock:
+            if self._started_at is None:
+                self._started_at = self._clock()
+            self.polls += 1
+            changed = []
+            for job in self._frames:
+                previous = self._status.get(job, {})
+                if previous.get("JobStatus") in DONE:
+                    continue
+                status = self._project_obj.GetRenderJobStatus(job) or {}
+                self._status[job] = status
+                state = status.get("JobStatus")
+                if state == "Complete":
+                    changed.append(("complete", job, status))
+                elif state in DONE:
+                    changed.append(("failed", job, status))
+                elif status.get("CompletionPercentage") != previous.get("CompletionPercentage"):
+                    changed.append(("progress", job, status))
+
+            stats = self.stats
+            events = [RenderEvent(kind, job, status, stats) for kind, job, status in changed]
+            finished = self.done
+
+        for event in events:
+            for callback in list(self._listeners[event.kind]):
+                callback(event)
+        # after the callbacks, so iterators get every event before they stop
+        if finished:
+            self._finish()
+        return events
+
+    def next_interval(self) -> float:
+        """
+        Returns seconds until the next poll: half the smallest time left of the rendering jobs,
+        within ``min_interval`` and ``max_interval``
+
+        Returns:
+            float: seconds
+        """
+        left = [
+            int(status["EstimatedTimeRemainingInMs"]) / 1000
+            for status in self._status.values()
+            if status.get("JobStatus") == "Rendering" and "EstimatedTimeRemainingInMs" in status
+        ]
+        if not left:
+            return self.min_interval if self._status else self.max_interval
+        return min(max(min(left) / 2, self.min_interval), self.max_interval)
+
+    def _run(self) -> None:
+        try:
+            while not self._stop.is_set():
+                self.poll()
+                if self.done:
+                    break
+                self._stop.wait(self.next_interval())
+        except BaseException as e:
+            self.error = e
+        finally:
+            self._finish()
+
+    def _finish(self) -> None:
+        self._done.set()
+        for waiter in list(self._waiters):
+            waiter.set()
+
+    def start(self) -> "RenderMonitor":
+        """
+        Starts watching in a background thread
+
+        Returns:
+            (RenderMonitor): this monitor
+        """
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._done.clear()
+            self._thread = threading.Thread(target=self._run, name="RenderMonitor", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stops the background thread."""
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Blocks until every job is done, or ``timeout`` seconds
+
+        Args:
+            timeout (float, optional): seconds to wait. Defaults to no timeout.
+
+        Returns:
+            bool: ``True`` if every job is done
+        """
+        if self._thread is None:
+            self.start()
+        self._done.wait(timeout)
+        return self.done
+
+    def __enter__(self) -> "RenderMonitor":
+        return self.start()
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    async def events(self) -> AsyncIterator[RenderEvent]:
+        """
+        Yields events as they happen, until every job is done. Starts the monitor if needed.
+
+        Yields:
+            (RenderEvent): progress, complete and failed events
+        """
+        loop = asyncio.get_running_loop()
+        queue: "asyncio.Queue[Optional[RenderEvent]]" = asyncio.Queue()
+
+        def forward(event: RenderEvent) -> None:
+            loop.call_soon_threadsafe(queue.put_nowait, event)
+
+        for listeners in self._listeners.values():
+            listeners.append(forward)
+        # set when the thread ends, or when the iterator is left early, so the executor thread
+        # waiting on it doesn't outlive the iterator
+        wake = threading.Event()
+        self._waiters.append(wake)
+        self.start()
+        if self._done.is_set():
+            wake.set()
+        watcher = loop.run_in_executor(None, wake.wait)
+        watcher.add_done_callback(lambda _: queue.put_nowait(None))
+        try:
+            while True:
+                event = await queue.get()
+                if event is None:
+                    # events forwarded before the thread ended are already queued
+                    while not queue.empty():
+                        event = queue.get_nowait()
+                        if event is not None:
+                            yield event
+                    break
+                yield event
+        finally:
+            wake.set()
+            self._waiters.remove(wake)
+            for listeners in self._listeners.values():
+                listeners.remove(forward)
+        if self.error is not None:
+            raise self.error
@@ -12,6 +12,8 @@ if TYPE_CHECKING:
 
 
 class Resolve:
+    __slots__ = ("pages", "_obj")
+
     def __init__(self, headless: Optional[bool] = None, path: Optional[str] = None):
 
         # this check is slow AF, to be implemented when we have auto-launch resolve
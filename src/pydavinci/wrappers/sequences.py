@@ -0,0 +1,166 @@
+"""
+Image sequence detection for [``MediaPool.import_media``][pydavinci.wrappers.mediapool.MediaPool.import_media].
+
+Frames are grouped by directory, name before the frame number, padding and extension:
+``plate.0001.exr`` and ``plate.0002.exr`` are one sequence, ``plate.1.exr`` and ``plate.0001.exr``
+are not. Frame numbers without leading zeros, ``plate.9.exr`` and ``plate.10.exr``, are one
+unpadded sequence. A gap in the frame numbers splits a sequence in two.
+"""
+
+import re
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+# name, frame number, extension. The frame number is the last digits before the extension.
+_FRAME = re.compile(r"^(.*?)(\d+)(\.[^.\d/\\][^./\\]*)$")
+
+DEFAULT_EXTENSIONS = (".dpx", ".exr", ".tif", ".tiff", ".png", ".jpg", ".jpeg", ".tga", ".cin")
+
+
+class ImageSequence:
+    """Contiguous frames of one image sequence.
+
+    Attributes:
+        head (str): path up to the frame number, ``/plates/sh010/plate.``
+        padding (int): digits of the frame number, ``0`` for unpadded frame numbers
+        ext (str): extension with the dot, ``.exr``
+        start (int): first frame number
+        end (int): last frame number, included
+    """
+
+    __slots__ = ("head", "padding", "ext", "start", "end")
+
+    def __init__(self, head: str, padding: int, ext: str, start: int, end: int) -> None:
+        self.head = head
+        self.padding = padding
+        self.ext = ext
+        self.start = start
+        self.end = end
+
+    @property
+    def pattern(self) -> str:
+        """
+        Returns the ``printf`` style path Davinci Resolve expects, ``/plates/sh010/plate.%04d.exr``,
+        or ``/plates/sh010/plate.%d.exr`` if unpadded
+
+        Returns:
+            str: file path pattern
+        """
+        if self.padding == 0:
+            return f"{self.head}%d{self.ext}"
+        return f"{self.head}%0{self.padding}d{self.ext}"
+
+    def path(self, frame: int) -> str:
+        """
+        Returns the file path of ``frame``
+
+        Args:
+            frame (int): frame number
+
+        Returns:
+            str: file path
+        """
+        return f"{self.head}{frame:0{self.padding}d}{self.ext}"
+
+    def clip_info(self) -> Dict[str, Any]:
+        """
+        Returns the ``ImportMedia`` ``ClipInfo`` of the sequence
+
+        Returns:
+            (Dict[str, Any]): ``FilePath``, ``StartIndex`` and ``EndIndex``
+        """
+        return {"FilePath": self.pattern, "StartIndex": self.start, "EndIndex": self.end}
+
+    def __len__(self) -> int:
+        return self.end - self.start + 1
+
+    def __repr__(self) -> str:
+        frames = f"{self.start:0{self.padding}d}-{self.end:0{self.padding}d}"
+        return f"ImageSequence({self.head}[{frames}]{self.ext})"
+
+
+def find_sequences(
+    paths: Iterable[str],
+    extensions: Optional[Sequence[str]] = DEFAULT_EXTENSIONS,
+    min_length: int = 2,
+) -> Tuple[List[ImageSequence], List[str]]:
+    """
+    Groups file paths into image sequences, with one regular expression match per path.
+
+    Args:
+        paths (Iterable[str]): file paths
+        extensions (Sequence[str], optional): extensions of sequence frames, case insensitive. ``None`` for any extension.
+        min_length (int, optional): shorter runs of frames are returned as single files. Defaults to ``2``.
+
+    Returns:
+        (Tuple[List[ImageSequence], List[str]]): sequences sorted by pattern and start frame, and every other path
+    """
+    wanted = {ext.lower() for ext in extensions} if extensions is not None else None
+    groups: Dict[Tuple[str, int, str], List[int]] = {}
+    # name and extension of frame numbers with leading zeros
+    padded: Set[Tuple[str, str]] = set()
+    singles: List[str] = []
+    match = _FRAME.match
+
+    for path in paths:
+        found = match(path)
+        if found is None or (wanted is not None and found.group(3).lower() not in wanted):
+            singles.append(path)
+            continue
+        head, digits, ext = found.groups()
+        groups.setdefault((head, len(digits), ext), []).append(int(digits))
+        if len(digits) > 1 and digits[0] == "0":
+            padded.add((head, ext))
+
+    # without leading zeros, plate.9.exr and plate.10.exr are one unpadded sequence
+    lengths: Dict[Tuple[str, str], int] = {}
+    for head, _, ext in groups:
+        lengths[(head, ext)] = lengths.get((head, ext), 0) + 1
+    merged: Dict[Tuple[str, int, str], List[int]] = {}
+    for (head, padding, ext), frames in groups.items():
+        if lengths[(head, ext)] > 1 and (head, ext) not in padded:
+            padding = 0
+        merged.setdefault((head, padding, ext), []).extend(frames)
+
+    sequences: List[ImageSequence] = []
+
+    def close(head: str, padding: int, ext: str, start: int, end: int) -> None:
+        if end - start + 1 >= min_length:
+            sequences.append(ImageSequence(head, padding, ext, start, end))
+        else:
+            singles.extend(f"{head}{n:0{padding}d}{ext}" for n in range(start, end + 1))
+
+    for (head, padding, ext), frames in sorted(merged.items()):
+        frames.sort()
+        start = prev = frames[0]
+        for frame in frames[1:]:
+            if frame != prev + 1:
+                # gap, split the sequence
+                close(head, padding, ext, start, prev)
+                start = frame
+            prev = frame
+        close(head, padding, ext, start, prev)
+    return sequences, singles
+
+
+def scan_sequences(
+    paths: Iterable[str],
+    extensions: Optional[Sequence[str]] = DEFAULT_EXTENSIONS,
+    min_length: int = 2,
+    workers: int = 8,
+) -> Tuple[List[ImageSequence], List[str]]:
+    """
+    Expands directories in ``paths`` locally and groups their files with
+    [``find_sequences``][pydavinci.wrappers.sequences.find_sequences].
+
+    Args:
+        paths (Iterable[str]): files and directories
+        extensions (Sequence[str], optional): extensions of sequence frames. ``None`` for any extension.
+        min_length (int, optional): shorter runs of frames are returned as single files. Defaults to ``2``.
+        workers (int, optional): directories listed at once. Defaults to ``8``.
+
+    Returns:
+        (Tuple[List[ImageSequence], List[str]]): sequences, and every other file
+    """
+    from pydavinci.wrappers.ingest import expand_paths
+
+    return find_sequences(expand_paths(paths, workers=workers), extensions, min_length)
@@ -0,0 +1,304 @@
+import csv
+import sys
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Sequence, Set
+
+from pydavinci.utils import TRACK_ERROR, TRACK_TYPES
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from pydavinci.wrappers._resolve_stubs import PyRemoteTimelineItem
+    from pydavinci.wrappers.timeline import Timeline
+    from pydavinci.wrappers.timelineitem import TimelineItem
+
+
+FRAME_FIELDS = ("start", "end", "duration", "left_offset", "right_offset")
+STRING_FIELDS = ("name", "id", "track_type", "track_name")
+
+# Raw reads of one field on a remote timeline item. ``duration`` is derived from start and end.
+_READERS: Dict[str, Callable[[Any], Any]] = {
+    "start": lambda obj: obj.GetStart(),
+    "end": lambda obj: obj.GetEnd(),
+    "left_offset": lambda obj: obj.GetLeftOffset(),
+    "right_offset": lambda obj: obj.GetRightOffset(),
+    "name": lambda obj: sys.intern(obj.GetName()),
+    "id": lambda obj: sys.intern(obj.GetUniqueId()),
+}
+
+
+def _wanted_fields(fields: Optional[Sequence[str]]) -> Set[str]:
+    wanted = set(FRAME_FIELDS + STRING_FIELDS if fields is None else fields)
+    unknown = wanted - set(FRAME_FIELDS + STRING_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown timeline item fields: {', '.join(sorted(unknown))}")
+    return wanted
+
+
+def _check_track_types(track_types: Sequence[str]) -> None:
+    for track_type in track_types:
+        if track_type not in TRACK_TYPES:
+            raise ValueError(TRACK_ERROR)
+
+
+def _numpy() -> Any:
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            "Timeline snapshots need numpy. Install it with `pip install pydavinci[analysis]`"
+        ) from None
+    return numpy
+
+
+class TimelineSnapshot:
+    """Column oriented table with every item of a timeline.
+
+    Frame fields (``start``, ``end``, ``duration``, ``left_offset``, ``right_offset``) and
+    ``track_index`` are ``numpy.int64`` arrays. ``name``, ``id``, ``track_type`` and ``track_name``
+    are ``numpy`` object arrays of interned strings. Rows are ordered by track type, track
+    index and start frame.
+
+    ```python
+    snap = timeline.snapshot()
+    short = snap.filter(snap["duration"] < 24)
+    print(len(short), short["name"])
+    ```
+    """
+
+    def __init__(
+        self,
+        columns: Dict[str, "np.ndarray"],
+        objs: Sequence["PyRemoteTimelineItem"],
+        timeline_start: int = 0,
+        timeline_end: int = 0,
+    ) -> None:
+        self.columns = columns
+        """``Dict`` of column name to array"""
+        self.timeline_start = timeline_start
+        self.timeline_end = timeline_end
+        self._objs = list(objs)
+
+    def __len__(self) -> int:
+        return len(self._objs)
+
+    def __getitem__(self, column: str) -> "np.ndarray":
+        return self.columns[column]
+
+    def __contains__(self, column: str) -> bool:
+        return column in self.columns
+
+    def __repr__(self) -> str:
+        return f"TimelineSnapshot(items: {len(self)}, columns: {', '.join(self.columns)})"
+
+    def filter(self, mask: Any) -> "TimelineSnapshot":
+        """
+        Returns a new snapshot with the rows selected by ``mask``
+
+        Args:
+            mask (np.ndarray): boolean mask or array of row indexes
+
+        Returns:
+            (TimelineSnapshot): filtered snapshot
+        """
+        numpy = _numpy()
+        rows = numpy.flatnonzero(mask) if numpy.asarray(mask).dtype == bool else numpy.asarray(mask)
+        return TimelineSnapshot(
+            {name: column[rows] for name, column in self.columns.items()},
+            [self._objs[i] for i in rows],
+            self.timeline_start,
+            self.timeline_end,
+        )
+
+    def item(self, row: int) -> "TimelineItem":
+        """
+        Returns the [``TimelineItem``][pydavinci.wrappers.timelineitem.TimelineItem-attributes] at ``row``
+
+        Args:
+            row (int): row index
+
+        Returns:
+            (TimelineItem): timeline item
+        """
+        from pydavinci.wrappers.timelineitem import TimelineItem
+
+        return TimelineItem(self._objs[row])
+
+    def rows(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterates rows as ``dict``s with plain Python values
+
+        Yields:
+            (Dict[str, Any]): one row
+        """
+        names = list(self.columns)
+        lists = [self.columns[name].tolist() for name in names]
+        for values in zip(*lists, strict=True):
+            yield dict(zip(names, values, strict=True))
+
+    def to_csv(self, path: str) -> None:
+        """
+        Writes the snapshot to a CSV file
+
+        Args:
+            path (str): output file path
+        """
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(self.columns))
+            writer.writeheader()
+            writer.writerows(self.rows())
+
+
+def take_snapshot(
+    timeline: "Timeline",
+    track_types: Sequence[str] = TRACK_TYPES,
+    fields: Optional[Sequence[str]] = None,
+) -> TimelineSnapshot:
+    """Builds a [``TimelineSnapshot``][pydavinci.wrappers.snapshot.TimelineSnapshot], see [``Timeline.snapshot``][pydavinci.wrappers.timeline.Timeline.snapshot]."""
+    numpy = _numpy()
+    _check_track_types(track_types)
+    wanted = _wanted_fields(fields)
+
+    tl = timeline._obj
+    # ``duration`` is derived from start and end, no need to ask Resolve for it
+    fetch = wanted | {"start", "end"} if "duration" in wanted else wanted
+
+    objs: List[Any] = []
+    track_type_col: List[str] = []
+    track_index_col: List[int] = []
+    track_name_col: List[str] = []
+
+    intern = sys.intern
+    for track_type in track_types:
+        track_type = intern(track_type)
+        for index in range(1, tl.GetTrackCount(track_type) + 1):
+            items = tl.GetItemListInTrack(track_type, index) or []
+            if not items:
+                continue
+            track_name = (
+                intern(tl.GetTrackName(track_type, index)) if "track_name" in wanted else ""
+            )
+            objs.extend(items)
+            track_type_col.extend([track_type] * len(items))
+            track_index_col.extend([index] * len(items))
+            track_name_col.extend([track_name] * len(items))
+
+    # One remote call per item and field, straight on the remote objects
+    values: Dict[str, List[Any]] = {
+        name: [read(obj) for obj in objs] for name, read in _READERS.items() if name in fetch
+    }
+
+    def strings(values: List[str]) -> "np.ndarray":
+        column = numpy.empty(len(values), dtype=object)
+        column[:] = values
+        return column
+
+    columns: Dict[str, "np.ndarray"] = {
+        "track_type": strings(track_type_col),
+        "track_index": numpy.asarray(track_index_col, dtype=numpy.int64),
+    }
+    if "track_name" in wanted:
+        columns["track_name"] = strings(track_name_col)
+    for name in ("name", "id"):
+        if name in wanted:
+            columns[name] = strings(values[name])
+    for name in ("start", "end", "left_offset", "right_offset"):
+        if name in wanted:
+            columns[name] = numpy.asarray(values[name], dtype=numpy.int64)
+    if "duration" in wanted:
+        starts = numpy.asarray(values["start"], dtype=numpy.int64)
+        columns["duration"] = numpy.asarray(values["end"], dtype=numpy.int64) - starts
+
+    return TimelineSnapshot(columns, objs, tl.GetStartFrame(), tl.GetEndFrame())
+
+
+class TimelineItemRecord:
+    """Lightweight read-only view of one timeline item, yielded by
+    [``Timeline.iter_items``][pydavinci.wrappers.timeline.Timeline.iter_items].
+
+    Only the requested fields are read from Davinci Resolve, the others are ``None``.
+    ``track_type`` and ``track_index`` are always set.
+    """
+
+    __slots__ = (
+        "track_type",
+        "track_index",
+        "track_name",
+        "start",
+        "end",
+        "duration",
+        "left_offset",
+        "right_offset",
+        "name",
+        "id",
+        "_obj",
+    )
+
+    def __init__(self, obj: "PyRemoteTimelineItem", track_type: str, track_index: int) -> None:
+        self._obj = obj
+        self.track_type = track_type
+        self.track_index = track_index
+        self.track_name: Optional[str] = None
+        self.start: Optional[int] = None
+        self.end: Optional[int] = None
+        self.duration: Optional[int] = None
+        self.left_offset: Optional[int] = None
+        self.right_offset: Optional[int] = None
+        self.name: Optional[str] = None
+        self.id: Optional[str] = None
+
+    def item(self) -> "TimelineItem":
+        """
+        Returns the full [``TimelineItem``][pydavinci.wrappers.timelineitem.TimelineItem-attributes] wrapper
+
+        Returns:
+            (TimelineItem): timeline item
+        """
+        from pydavinci.wrappers.timelineitem import TimelineItem
+
+        return TimelineItem(self._obj)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{name}: {getattr(self, name)}"
+            for name in self.__slots__[:-1]
+            if getattr(self, name) is not None
+        )
+        return f"TimelineItemRecord({fields})"
+
+
+def iter_records(
+    timeline: "Timeline",
+    track_types: Sequence[str] = TRACK_TYPES,
+    fields: Optional[Sequence[str]] = None,
+) -> Iterator[TimelineItemRecord]:
+    """Yields [``TimelineItemRecord``][pydavinci.wrappers.snapshot.TimelineItemRecord]s, see [``Timeline.iter_items``][pydavinci.wrappers.timeline.Timeline.iter_items]."""
+    # checked here rather than in the generator, so bad arguments raise before iterating
+    _check_track_types(track_types)
+    return _records(timeline, track_types, _wanted_fields(fields))
+
+
+def _records(
+    timeline: "Timeline", track_types: Sequence[str], wanted: Set[str]
+) -> Iterator[TimelineItemRecord]:
+    fetch = wanted | {"start", "end"} if "duration" in wanted else wanted
+    readers = [(name, read) for name, read in _READERS.items() if name in fetch]
+
+    tl = timeline._obj
+    for track_type in track_types:
+        for index in range(1, tl.GetTrackCount(track_type) + 1):
+            items = tl.GetItemListInTrack(track_type, index) or []
+            if not items:
+                continue
+            track_name = tl.GetTrackName(track_type, index) if "track_name" in wanted else None
+            for obj in items:
+                record = TimelineItemRecord(obj, track_type, index)
+                record.track_name = track_name
+                for name, read in readers:
+                    setattr(record, name, read(obj))
+                if "duration" in wanted:
+                    record.duration = record.end - record.start  # type: ignore
+                    if "start" not in wanted:
+                        record.start = None
+                    if "end" not in wanted:
+                        record.end = None
+                yield record
@@ -0,0 +1,267 @@
+"""
+Directory listings for [``MediaStorage.walk``][pydavinci.wrappers.mediastorage.MediaStorage.walk],
+and the local directory scans shared by ingest, proxy matching and relinking.
+
+Paths reachable from the script host are listed with ``os.scandir``, several directories at
+once. Other paths go through ``GetSubFolderList`` and ``GetFileList``, one directory at a time.
+Listings are cached: local ones are used again while the directory modification time is
+unchanged, remote ones for ``REMOTE_TTL`` seconds.
+"""
+
+import functools
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    overload,
+)
+
+if TYPE_CHECKING:
+    from pydavinci.wrappers._resolve_stubs import PyRemoteMediaStorage
+
+# subfolders and files, full paths
+Listing = Tuple[List[str], List[str]]
+# path, size in bytes, modification time
+FileEntry = Tuple[str, int, float]
+
+REMOTE_TTL = 60.0
+
+
+@overload
+def scan_dir(path: str, stat: Literal[False] = ...) -> Tuple[List[str], List[str]]: ...
+
+
+@overload
+def scan_dir(path: str, stat: Literal[True]) -> Tuple[List[FileEntry], List[str]]: ...
+
+
+def scan_dir(path: str, stat: bool = False) -> Tuple[List[Any], List[str]]:
+    """
+    Lists ``path`` with ``os.scandir``, unsorted and uncached. Symbolic links to directories
+    aren't followed, unreadable directories are empty.
+
+    Args:
+        path (str): directory
+        stat (bool, optional): return files as ``(path, size, mtime)``. Defaults to ``False``.
+
+    Returns:
+        (Tuple[List, List[str]]): files and subfolders
+    """
+    files: List[Any] = []
+    dirs: List[str] = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    dirs.append(entry.path)
+                elif entry.is_file():
+                    if stat:
+                        info = entry.stat()
+                        files.append((entry.path, info.st_size, info.st_mtime))
+                    else:
+                        files.append(entry.path)
+    except OSError:
+        pass
+    return files, dirs
+
+
+@overload
+def scan_tree(
+    roots: Iterable[str], workers: int = ..., stat: Literal[False] = ...
+) -> Iterator[List[str]]: ...
+
+
+@overload
+def scan_tree(
+    roots: Iterable[str], workers: int = ..., *, stat: Literal[True]
+) -> Iterator[List[FileEntry]]: ...
+
+
+def scan_tree(roots: Iterable[str], workers: int = 8, stat: bool = False) -> Iterator[List[Any]]:
+    """
+    Scans the directories under ``roots``, breadth first. Directories of the same depth are
+    listed in parallel, with [``scan_dir``][pydavinci.wrappers.storagewalk.scan_dir].
+
+    Args:
+        roots (Iterable[str]): directories, the ones missing are skipped
+        workers (int, optional): directories listed at once. Defaults to ``8``.
+        stat (bool, optional): return files as ``(path, size, mtime)``. Defaults to ``False``.
+
+    Yields:
+        (List): files of one directory
+    """
+    scan = functools.partial(scan_dir, stat=stat)
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as pool:
+        level = [root for root in roots if os.path.isdir(root)]
+        while level:
+            nxt: List[str] = []
+            for files, dirs in pool.map(scan, level):
+                yield files
+                nxt.extend(dirs)
+            level = nxt
+
+
+class ListingCache:
+    """Least recently used cache of directory listings.
+
+    Local listings are stored with the directory ``st_mtime_ns``, remote ones with the time
+    they were read. The cache holds at most ``max_paths`` subfolder and file paths in total, so
+    walking a large volume only keeps its most recently listed directories. Listings larger
+    than that aren't cached.
+    """
+
+    def __init__(self, max_paths: int = 20000) -> None:
+        if max_paths < 0:
+            raise ValueError("max_paths can't be negative")
+        self.max_paths = max_paths
+        self._entries: "OrderedDict[Tuple[bool, str], Tuple[float, Listing]]" = OrderedDict()
+        self._paths = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple[bool, str], stamp: Callable[[float], bool]) -> Optional[Listing]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or not stamp(entry[0]):
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: Tuple[bool, str], stamp: float, listing: Listing) -> None:
+        size = len(listing[0]) + len(listing[1])
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._paths -= len(old[1][0]) + len(old[1][1])
+            if size > self.max_paths:
+                return
+            self._entries[key] = (stamp, listing)
+            self._paths += size
+            while self._paths > self.max_paths:
+                _, (_, dropped) = self._entries.popitem(last=False)
+                self._paths -= len(dropped[0]) + len(dropped[1])
+
+    def clear(self) -> None:
+        """Drops every listing."""
+        with self._lock:
+            self._entries.clear()
+            self._paths = 0
+
+    @property
+    def paths(self) -> int:
+        """Subfolder and file paths held by the cache."""
+        return self._paths
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+listing_cache = ListingCache()
+"""Listings shared by every ``MediaStorage``"""
+
+
+def list_local(path: str, cache: Optional[ListingCache] = listing_cache) -> Listing:
+    """
+    Lists ``path`` with ``os.scandir``. Symbolic links to directories aren't followed.
+
+    Args:
+        path (str): directory
+        cache (ListingCache, optional): cache to use, ``None`` to always list
+
+    Returns:
+        (Tuple[List[str], List[str]]): sorted subfolders and files
+    """
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return [], []
+    if cache is not None:
+        listing = cache.get((True, path), lambda stamp: stamp == mtime)
+        if listing is not None:
+            return listing
+
+    files, dirs = scan_dir(path)
+    listing = (sorted(dirs), sorted(files))
+    if cache is not None:
+        cache.put((True, path), mtime, listing)
+    return listing
+
+
+def list_remote(
+    storage: "PyRemoteMediaStorage", path: str, cache: Optional[ListingCache] = listing_cache
+) -> Listing:
+    """
+    Lists ``path`` through Davinci Resolve, two remote calls
+
+    Args:
+        storage (PyRemoteMediaStorage): remote media storage
+        path (str): directory
+        cache (ListingCache, optional): cache to use, ``None`` to always list
+
+    Returns:
+        (Tuple[List[str], List[str]]): subfolders and files
+    """
+    now = time.monotonic()
+    if cache is not None:
+        listing = cache.get((False, path), lambda stamp: now - stamp < REMOTE_TTL)
+        if listing is not None:
+            return listing
+    listing = (
+        list(storage.GetSubFolderList(path) or []),
+        list(storage.GetFileList(path) or []),
+    )
+    if cache is not None:
+        cache.put((False, path), now, listing)
+    return listing
+
+
+def walk(
+    storage: "PyRemoteMediaStorage",
+    root: str,
+    local: Optional[bool] = None,
+    workers: int = 8,
+    cache: Optional[ListingCache] = listing_cache,
+) -> Iterator[Tuple[str, List[str], List[str]]]:
+    """Walks ``root`` breadth first, see [``MediaStorage.walk``][pydavinci.wrappers.mediastorage.MediaStorage.walk]."""
+    if local is None:
+        local = os.path.isdir(root)
+
+    if not local:
+        pending = deque([root])
+        while pending:
+            path = pending.popleft()
+            dirs, files = list_remote(storage, path, cache)
+            dirs = list(dirs)
+            yield path, dirs, list(files)
+            # ``dirs`` may have been pruned by the caller, like ``os.walk``
+            pending.extend(dirs)
+        return
+
+    # listings are started ahead of the caller, at most ``workers * 4`` at a time
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as pool:
+        waiting: Deque[str] = deque([root])
+        running: Deque[Tuple[str, "Future[Listing]"]] = deque()
+        while waiting or running:
+            while waiting and len(running) < workers * 4:
+                path = waiting.popleft()
+                running.append((path, pool.submit(list_local, path, cache)))
+            path, future = running.popleft()
+            dirs, files = future.result()
+            dirs = list(dirs)
+            yield path, dirs, list(files)
+            waiting.extend(dirs)
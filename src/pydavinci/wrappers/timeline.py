@@ -1,21 +1,25 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Sequence, Union
 
 import pydavinci.logger as log
 from pydavinci.exceptions import TimelineNotFound
+from pydavinci.identity import IdentityMeta, identity_map
 from pydavinci.main import resolve_obj
 from pydavinci.utils import TRACK_ERROR, TRACK_TYPES, get_resolveobjs, is_resolve_obj
 from pydavinci.wrappers.marker import MarkerCollection
 from pydavinci.wrappers.settings.constructor import get_tl_settings
+from pydavinci.wrappers.timelineindex import TimelineIndex
 from pydavinci.wrappers.timelineitem import TimelineItem
 
-
 if TYPE_CHECKING:
     from pydavinci.wrappers._resolve_stubs import PyRemoteTimeline
     from pydavinci.wrappers.gallerystill import GalleryStill
     from pydavinci.wrappers.settings.constructor import TimelineSettings
+    from pydavinci.wrappers.snapshot import TimelineItemRecord, TimelineSnapshot
+
 
+class Timeline(metaclass=IdentityMeta):
+    __slots__ = ("_obj", "_markers", "_item_index", "_settings", "__weakref__")
 
-class Timeline:
     def __init__(self, *args: Any) -> None:
         if args:
             if is_resolve_obj(args[0]):
@@ -32,9 +36,41 @@ class Timeline:
                     extra="Couldn't find any active timeline. Are you sure there's any timeline in the project?"
                 )
 
-        self.markers = MarkerCollection(self)
+        self._markers: Optional[MarkerCollection] = None
+        self._item_index: Optional[TimelineIndex] = None
         self._settings: Optional[TimelineSettings] = None
 
+    @property
+    def markers(self) -> "MarkerCollection":
+        """
+        Returns the [``MarkerCollection``][pydavinci.wrappers.marker.MarkerCollection] for this ``Timeline``.
+        Markers are only fetched from Davinci Resolve the first time they're used.
+
+        Returns:
+            (MarkerCollection): markers
+        """
+        if self._markers is None:
+            self._markers = MarkerCollection(self)
+        return self._markers
+
+    @property
+    def item_index(self) -> "TimelineIndex":
+        """
+        Returns the [``TimelineIndex``][pydavinci.wrappers.timelineindex.TimelineIndex] for this ``Timeline``,
+        to look up items by frame, by frame range or by edit point.
+        Items are only fetched from Davinci Resolve the first time it's used.
+
+        Returns:
+            (TimelineIndex): timeline items index
+        """
+        if self._item_index is None:
+            self._item_index = TimelineIndex(self)
+        return self._item_index
+
+    def _items_changed(self) -> None:
+        if self._item_index is not None:
+            self._item_index.invalidate()
+
     def custom_settings(self, use: bool) -> bool:
         # Davinci only allows setting timeline settings if "useCustomSettings" is true, otherwise it returns False every time.
         """Allows this timeline to have settings independent from the project settings. See [Quickstart on Settings](../settings#project-vs-timeline-settings) for more details.
@@ -162,6 +198,68 @@ class Timeline:
 
         return [TimelineItem(x) for x in self._obj.GetItemListInTrack(track_type, track_index)]
 
+    def iter_items(
+        self,
+        track_types: Sequence[str] = TRACK_TYPES,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Iterator["TimelineItemRecord"]:
+        """
+        Walks every track lazily, yielding a
+        [``TimelineItemRecord``][pydavinci.wrappers.snapshot.TimelineItemRecord] per item.
+
+        Tracks are fetched one at a time and only ``fields`` are read from each item, so
+        stopping early skips the remaining items and tracks. Call ``record.item()`` to get the
+        full ``TimelineItem``.
+
+        ```python
+        clip = next(x for x in timeline.iter_items(["video"], ["name"]) if x.name == "A001C003")
+        ```
+
+        Args:
+            track_types (Sequence[str], optional): track types to walk. Defaults to all.
+            fields (Sequence[str], optional): subset of ``start``, ``end``, ``duration``,
+                ``left_offset``, ``right_offset``, ``name``, ``id`` and ``track_name``.
+                Defaults to all.
+
+        Raises:
+            ValueError: Not a valid track type or field
+
+        Yields:
+            (TimelineItemRecord): one record per item, by track type, track index and start frame
+        """
+        from pydavinci.wrappers.snapshot import iter_records
+
+        return iter_records(self, track_types, fields)
+
+    def snapshot(
+        self,
+        track_types: Sequence[str] = TRACK_TYPES,
+        fields: Optional[Sequence[str]] = None,
+    ) -> "TimelineSnapshot":
+        """
+        Reads every item of every track in one pass into a column oriented
+        [``TimelineSnapshot``][pydavinci.wrappers.snapshot.TimelineSnapshot]. Requires ``numpy``.
+
+        Items are read straight from Davinci Resolve without building ``TimelineItem`` wrappers,
+        and ``duration`` is computed from ``start`` and ``end``, so a snapshot costs a fixed
+        number of calls per item instead of one per attribute read afterwards.
+
+        Args:
+            track_types (Sequence[str], optional): track types to read. Defaults to all.
+            fields (Sequence[str], optional): subset of ``start``, ``end``, ``duration``,
+                ``left_offset``, ``right_offset``, ``name``, ``id`` and ``track_name``.
+                Defaults to all.
+
+        Raises:
+            ValueError: Not a valid track type or field
+
+        Returns:
+            (TimelineSnapshot): timeline items table
+        """
+        from pydavinci.wrappers.snapshot import take_snapshot
+
+        return take_snapshot(self, track_types, fields)
+
     def grab_all_stills(self, still_frame_source: int) -> List["GalleryStill"]:
         """
         Grabs stills from all the clips of the timeline.
@@ -310,6 +408,7 @@ class Timeline:
         Returns:
             (TimelineItem): compound clip
         """
+        self._items_changed()
         if not clip_info:
             return TimelineItem(self._obj.CreateCompoundClip(get_resolveobjs(timeline_items)))
 
@@ -327,6 +426,7 @@ class Timeline:
         Returns:
             (TimelineItem): resulting fusion clip
         """
+        self._items_changed()
         return TimelineItem(self._obj.CreateFusionClip(get_resolveobjs(timeline_items)))
 
     def import_aaf_into_timeline(
@@ -364,6 +464,7 @@ class Timeline:
              bool: ``True`` if successful, ``False`` otherwise
 
         """
+        self._items_changed()
         if not import_options:
             return self._obj.ImportIntoTimeline(file_path)
         return self._obj.ImportIntoTimeline(file_path, import_options)
@@ -496,6 +597,7 @@ class Timeline:
         Returns:
             (TimelineItem): generator
         """
+        self._items_changed()
         return TimelineItem(self._obj.InsertGeneratorIntoTimeline(generator_name))
 
     def insert_fusion_generator(self, generator_name: str) -> "TimelineItem":
@@ -508,6 +610,7 @@ class Timeline:
         Returns:
             (TimelineItem): fusion generator
         """
+        self._items_changed()
         return TimelineItem(self._obj.InsertFusionGeneratorIntoTimeline(generator_name))
 
     def insert_ofx_generator(self, generator_name: str) -> "TimelineItem":
@@ -520,6 +623,7 @@ class Timeline:
         Returns:
             (TimelineItem): OFX generator
         """
+        self._items_changed()
         return TimelineItem(self._obj.InsertOFXGeneratorIntoTimeline(generator_name))
 
     def insert_title(self, title_name: str) -> "TimelineItem":
@@ -532,6 +636,7 @@ class Timeline:
         Returns:
             (TimelineItem): title
         """
+        self._items_changed()
         return TimelineItem(self._obj.InsertTitleIntoTimeline(title_name))
 
     def insert_fusion_title(self, title_name: str) -> "TimelineItem":
@@ -544,6 +649,7 @@ class Timeline:
         Returns:
             (TimelineItem): fusion title
         """
+        self._items_changed()
         return TimelineItem(self._obj.InsertFusionTitleIntoTimeline(title_name))
 
     @property
@@ -558,3 +664,13 @@ class Timeline:
 
     def __repr__(self) -> str:
         return f"Timeline(name: {self.name})"
+
+
+def _current_items_changed() -> None:
+    # Items added from the media pool land on the current timeline. The current timeline is only
+    # looked up when a live Timeline wrapper has an item index to invalidate.
+    if all(timeline._item_index is None for timeline in identity_map.alive(Timeline)):
+        return
+    current = resolve_obj.GetProjectManager().GetCurrentProject().GetCurrentTimeline()
+    if current:
+        Timeline(current)._items_changed()
@@ -0,0 +1,237 @@
+from bisect import bisect_left, bisect_right
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from pydavinci.utils import TRACK_ERROR, TRACK_TYPES
+
+if TYPE_CHECKING:
+    from pydavinci.wrappers.timeline import Timeline
+    from pydavinci.wrappers.timelineitem import TimelineItem
+
+Track = Tuple[str, int]
+
+
+class _TrackIntervals:
+    """Sorted ``start``/``end`` arrays of one track.
+
+    Items on a single track never overlap, so both arrays are sorted and a frame or a range
+    maps to a contiguous slice found with two bisections.
+    """
+
+    __slots__ = ("starts", "ends", "objs")
+
+    def __init__(self, rows: List[Tuple[int, int, Any]]) -> None:
+        rows.sort(key=lambda row: row[0])
+        self.starts = [row[0] for row in rows]
+        self.ends = [row[1] for row in rows]
+        self.objs = [row[2] for row in rows]
+
+    def span(self, start: int, end: int) -> range:
+        # first item ending after ``start`` up to the last one starting before ``end``
+        return range(bisect_right(self.ends, start), bisect_left(self.starts, end))
+
+
+class TimelineIndex:
+    """Interval index over the items of a [``Timeline``][pydavinci.wrappers.timeline.Timeline].
+
+    Start and end frames are read once per item and kept in sorted arrays per track, so
+    frame, range and edit point lookups are answered with bisections instead of fetching
+    every item of every track again. Ranges are half open, ``[start, end)``, like
+    ``TimelineItem.start`` and ``TimelineItem.end``.
+
+    The index doesn't know when items change in Davinci Resolve. Call
+    [``invalidate``][pydavinci.wrappers.timelineindex.TimelineIndex.invalidate] for the tracks
+    that changed and only those are read again on the next lookup.
+    ``Timeline`` methods that add or replace items invalidate their timeline's index already.
+
+    ```python
+    index = timeline.item_index
+    under_playhead = index.at(86400 + 120)
+    next_cut = index.next_edit(86400 + 120)
+    ```
+    """
+
+    def __init__(self, timeline: "Timeline", track_types: Sequence[str] = TRACK_TYPES) -> None:
+        for track_type in track_types:
+            if track_type not in TRACK_TYPES:
+                raise ValueError(TRACK_ERROR)
+        self._timeline = timeline
+        self.track_types = tuple(track_types)
+        self._tracks: Dict[Track, _TrackIntervals] = {}
+        self._edits: List[int] = []
+        self._dirty: Optional[Set[Track]] = None
+        """``None`` means every track needs to be read"""
+
+    @property
+    def loaded(self) -> bool:
+        """``True`` if the index is built and no track has been invalidated since."""
+        return self._dirty is not None and not self._dirty
+
+    def invalidate(
+        self, track_type: Optional[str] = None, track_index: Optional[int] = None
+    ) -> None:
+        """
+        Marks tracks as changed. They're read again from Davinci Resolve on the next lookup.
+
+        Args:
+            track_type (str, optional): track type. Defaults to every track type.
+            track_index (int, optional): track index. Defaults to every track of ``track_type``.
+        """
+        if self._dirty is None:
+            return
+        if track_type is None:
+            self._dirty = None
+        elif track_index is None:
+            # index ``0`` stands for "every track of this type", tracks may have been added
+            self._dirty.add((track_type, 0))
+        else:
+            self._dirty.add((track_type, track_index))
+
+    def rebuild(self) -> None:
+        """Reads every track again."""
+        self._dirty = None
+        self._ensure_fresh()
+
+    def _read_track(self, track_type: str, index: int) -> None:
+        tl = self._timeline._obj
+        items = tl.GetItemListInTrack(track_type, index) or []
+        rows = [(obj.GetStart(), obj.GetEnd(), obj) for obj in items]
+        if rows:
+            self._tracks[(track_type, index)] = _TrackIntervals(rows)
+        else:
+            self._tracks.pop((track_type, index), None)
+
+    def _ensure_fresh(self) -> None:
+        if self._dirty is not None and not self._dirty:
+            return
+
+        tl = self._timeline._obj
+        if self._dirty is None:
+            self._tracks.clear()
+            dirty: Set[Track] = {(t, 0) for t in self.track_types}
+        else:
+            dirty = self._dirty
+
+        for track_type in {t for t, _ in dirty}:
+            if track_type not in self.track_types:
+                continue
+            count = tl.GetTrackCount(track_type)
+            if (track_type, 0) in dirty:
+                indexes = set(range(1, count + 1))
+                # drop tracks that no longer exist
+                for track in [t for t in self._tracks if t[0] == track_type and t[1] > count]:
+                    del self._tracks[track]
+            else:
+                indexes = {i for t, i in dirty if t == track_type and 1 <= i <= count}
+            for index in indexes:
+                self._read_track(track_type, index)
+
+        edits: Set[int] = set()
+        for intervals in self._tracks.values():
+            edits.update(intervals.starts)
+            edits.update(intervals.ends)
+        self._edits = sorted(edits)
+        self._dirty = set()
+
+    def _selected(
+        self, track_type: Optional[str], track_index: Optional[int]
+    ) -> List[Tuple[Track, _TrackIntervals]]:
+        self._ensure_fresh()
+        return sorted(
+            (
+                (track, intervals)
+                for track, intervals in self._tracks.items()
+                if (track_type is None or track[0] == track_type)
+                and (track_index is None or track[1] == track_index)
+            ),
+            key=lambda pair: pair[0],
+        )
+
+    def overlapping(
+        self,
+        start: int,
+        end: int,
+        track_type: Optional[str] = None,
+        track_index: Optional[int] = None,
+    ) -> List["TimelineItem"]:
+        """
+        Returns items overlapping the frame range ``[start, end)``
+
+        Args:
+            start (int): first frame of the range
+            end (int): frame after the last one of the range
+            track_type (str, optional): only look in this track type. Defaults to all.
+            track_index (int, optional): only look in this track index. Defaults to all.
+
+        Returns:
+            (List[TimelineItem]): items ordered by track type, track index and start frame
+        """
+        from pydavinci.wrappers.timelineitem import TimelineItem
+
+        result = []
+        for _, intervals in self._selected(track_type, track_index):
+            for i in intervals.span(start, end):
+                result.append(TimelineItem(intervals.objs[i]))
+        return result
+
+    def at(
+        self, frame: int, track_type: Optional[str] = None, track_index: Optional[int] = None
+    ) -> List["TimelineItem"]:
+        """
+        Returns items covering ``frame``
+
+        Args:
+            frame (int): timeline frame
+            track_type (str, optional): only look in this track type. Defaults to all.
+            track_index (int, optional): only look in this track index. Defaults to all.
+
+        Returns:
+            (List[TimelineItem]): at most one item per track
+        """
+        return self.overlapping(frame, frame + 1, track_type, track_index)
+
+    @property
+    def edit_points(self) -> List[int]:
+        """
+        Returns every frame where an item starts or ends, sorted
+
+        Returns:
+            (List[int]): edit points
+        """
+        self._ensure_fresh()
+        return list(self._edits)
+
+    def next_edit(self, frame: int) -> Optional[int]:
+        """
+        Returns the first edit point after ``frame``
+
+        Args:
+            frame (int): timeline frame
+
+        Returns:
+            (int, optional): edit point or ``None`` if there's none after ``frame``
+        """
+        self._ensure_fresh()
+        i = bisect_right(self._edits, frame)
+        return self._edits[i] if i < len(self._edits) else None
+
+    def previous_edit(self, frame: int) -> Optional[int]:
+        """
+        Returns the last edit point before ``frame``
+
+        Args:
+            frame (int): timeline frame
+
+        Returns:
+            (int, optional): edit point or ``None`` if there's none before ``frame``
+        """
+        self._ensure_fresh()
+        i = bisect_left(self._edits, frame)
+        return self._edits[i - 1] if i else None
+
+    def __len__(self) -> int:
+        self._ensure_fresh()
+        return sum(len(track.objs) for track in self._tracks.values())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.loaded else "stale"
+        return f"TimelineIndex(timeline: {self._timeline.name}, {state})"
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 from typing_extensions import Literal
 
@@ -11,6 +11,8 @@ if TYPE_CHECKING:
 
 
 class TimelineItem:
+    __slots__ = ("_obj", "_markers")
+
     def __init__(self, obj: "PyRemoteTimelineItem") -> None:
 
         if is_resolve_obj(obj):
@@ -18,7 +20,20 @@ class TimelineItem:
         else:
             raise TypeError(f"{type(obj)} is not a valid {self.__class__.__name__} type")
 
-        self.markers = MarkerCollection(self)
+        self._markers: Optional[MarkerCollection] = None
+
+    @property
+    def markers(self) -> "MarkerCollection":
+        """
+        Returns the [``MarkerCollection``][pydavinci.wrappers.marker.MarkerCollection] for this ``TimelineItem``.
+        Markers are only fetched from Davinci Resolve the first time they're used.
+
+        Returns:
+            (MarkerCollection): markers
+        """
+        if self._markers is None:
+            self._markers = MarkerCollection(self)
+        return self._markers
 
     @property
     def name(self) -> str:
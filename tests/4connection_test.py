@@ -0,0 +1,60 @@
+# flake8: noqa
+# type: ignore
+import sys
+
+import pytest
+
+from pydavinci.main import ResolveConnection
+
+
+class Remote:
+    def GetProductName(self):
+        return "DaVinci Resolve"
+
+
+def test_import_is_lazy():
+    import pydavinci.main
+
+    assert isinstance(pydavinci.main.resolve_obj, ResolveConnection)
+    assert "fusionscript" not in sys.modules
+
+
+def test_connects_on_first_call():
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return Remote()
+
+    conn = ResolveConnection(factory)
+    assert not conn.connected
+    assert conn.GetProductName() == "DaVinci Resolve"
+    assert conn.GetProductName() == "DaVinci Resolve"
+    assert conn.connected
+    assert len(calls) == 1
+    assert conn.remote_type is Remote
+
+
+def test_reset_and_reconnect():
+    remotes = []
+
+    def factory():
+        remotes.append(Remote())
+        return remotes[-1]
+
+    conn = ResolveConnection(factory)
+    first = conn.connect()
+    conn.reset()
+    assert not conn.connected
+    assert conn.reconnect() is not first
+    assert len(remotes) == 2
+
+
+def test_use():
+    remote = Remote()
+    conn = ResolveConnection(lambda: None)
+    with pytest.raises(ConnectionError):
+        conn.connect()
+
+    conn.use(remote)
+    assert conn.connect() is remote
@@ -0,0 +1,110 @@
+# flake8: noqa
+# type: ignore
+import pytest
+
+import pydavinci.main
+import pydavinci.wrappers.resolve as davinci
+from pydavinci.fakeresolve import FakeRemoteObject, FakeResolveServer
+from pydavinci.wrappers.mediapoolitem import MediaPoolItem
+from pydavinci.wrappers.project import Project
+from pydavinci.wrappers.timeline import Timeline
+from pydavinci.wrappers.timelineitem import TimelineItem
+
+
+@pytest.fixture
+def server():
+    server = FakeResolveServer().install()
+    yield server
+    server.uninstall()
+
+
+@pytest.fixture
+def resolve(server):
+    return davinci.Resolve()
+
+
+def test_install(server, resolve):
+    assert pydavinci.main.connection.connect() is server.resolve
+    assert resolve.product_name == "DaVinci Resolve Studio"
+
+
+def test_every_object_shares_one_type(server, resolve):
+    project = resolve.project_manager.create_project("pydavinci_fake")
+    assert isinstance(project, Project)
+    assert type(project._obj) is FakeRemoteObject
+    assert type(project.mediapool._obj) is FakeRemoteObject
+
+
+def test_import_and_timeline(server, resolve):
+    resolve.project_manager.create_project("pydavinci_fake")
+    clips = resolve.media_pool.import_media(["/media/a.mov", "/media/b.mov"])
+    assert all(isinstance(x, MediaPoolItem) for x in clips)
+    assert clips[0].properties["File Path"] == "/media/a.mov"
+
+    timeline = resolve.media_pool.create_timeline_from_clips("pydavinci_tl", clips)
+    assert isinstance(timeline, Timeline)
+    items = timeline.items("video", 1)
+    assert all(isinstance(x, TimelineItem) for x in items)
+    assert [x.start for x in items] == [86400, 86640]
+    assert timeline.end_frame == 86880
+    assert items[1].mediapoolitem.id == clips[1].id
+
+
+def test_markers(server, resolve):
+    resolve.project_manager.create_project("pydavinci_fake")
+    clip = resolve.media_pool.import_media(["/media/a.mov"])[0]
+    assert clip.markers.add(10, "Blue", "one", customdata="x")
+    assert clip.markers.add(10, "Red", "two") is None
+    assert clip.markers.add(10_000, "Red", "out of range") is None
+    assert clip._obj.GetMarkerByCustomData("x") == {
+        10: {"color": "Blue", "duration": 1, "note": "", "name": "one", "customData": "x"}
+    }
+
+
+def test_render_queue():
+    clock = [0.0]
+    server = FakeResolveServer(render_fps=100, clock=lambda: clock[0])
+    with server:
+        resolve = davinci.Resolve()
+        resolve.project_manager.create_project("pydavinci_fake")
+        clips = resolve.media_pool.import_media(["/media/a.mov"])
+        resolve.media_pool.create_timeline_from_clips("pydavinci_tl", clips)
+
+        project = resolve.project
+        first, second = project.add_renderjob(), project.add_renderjob()
+        assert len(project.render_jobs) == 2
+        assert project.render()
+
+        clock[0] = 1.2
+        assert project.render_status(first)["JobStatus"] == "Rendering"
+        assert project.render_status(first)["EstimatedTimeRemainingInMs"] == 1200
+        assert project.render_status(second)["JobStatus"] == "Queued"
+
+        clock[0] = 10
+        assert project.render_status(second)["JobStatus"] == "Complete"
+        assert not project.is_rendering()
+
+
+def test_counts_round_trips(server, resolve):
+    server.populate(clips=10, timelines=1)
+    server.reset_stats()
+    timeline = resolve.project.timeline
+    timeline.items("video", 1)
+    assert server.calls["Timeline.GetItemListInTrack"] == 1
+    assert server.calls["TimelineItem.GetName"] == 0
+    assert server.round_trips == sum(server.calls.values())
+
+
+def test_latency():
+    server = FakeResolveServer(latency=0.01, method_latency={"GetName": 0})
+    server.resolve.GetProductName()
+    server.resolve.GetProjectManager().GetCurrentProject().GetName()
+    assert server.busy_time >= 0.03
+    assert server.busy_time < 0.04 + 0.03
+
+
+def test_handles_are_bound_to_their_server():
+    one, two = FakeResolveServer(), FakeResolveServer()
+    project = one.resolve.GetProjectManager().GetCurrentProject()
+    with pytest.raises(ValueError):
+        two.resolve.GetProjectManager().CloseProject(project)
@@ -0,0 +1,85 @@
+# flake8: noqa
+# type: ignore
+import json
+
+import pytest
+
+import pydavinci.main
+import pydavinci.wrappers.resolve as davinci
+from pydavinci import instrument
+from pydavinci.fakeresolve import FakeResolveServer
+from pydavinci.wrappers.timelineitem import TimelineItem
+
+
+@pytest.fixture
+def resolve():
+    server = FakeResolveServer().install()
+    server.populate(clips=5, timelines=1)
+    yield davinci.Resolve()
+    server.uninstall()
+
+
+def test_records_calls_by_wrapper(resolve):
+    with instrument.record() as stats:
+        items = resolve.project.timeline.items("video", 1)
+        names = [x.name for x in items]
+
+    assert len(names) == 5
+    assert all(isinstance(x, TimelineItem) for x in items)
+    assert stats.by_call[("TimelineItem", "GetName")].count == 5
+    assert stats.by_call[("Timeline", "GetItemListInTrack")].count == 1
+    assert "GetMarkers" not in stats.by_method
+    assert stats.calls == sum(x.count for x in stats.by_wrapper.values())
+    assert pydavinci.main.connection.proxy is None
+
+
+def test_not_recording_outside_block(resolve):
+    with instrument.record() as stats:
+        timeline = resolve.project.timeline
+    before = stats.calls
+    timeline.items("video", 1)
+    assert stats.calls == before
+
+
+def test_instrumented_objects_are_passed_back_unwrapped(resolve):
+    with instrument.record():
+        project = resolve.project
+        timeline = project.timeline
+        assert project._obj.SetCurrentTimeline(timeline._obj)
+        clip = resolve.media_pool.root_folder.clips[0]
+        info = {"mediaPoolItem": clip._obj, "startFrame": 0, "endFrame": 10}
+        assert len(project._obj.GetMediaPool().AppendToTimeline([info])) == 1
+
+
+def test_remote_objects_in_results_are_wrapped(resolve):
+    with instrument.record() as stats:
+        timeline = resolve.project.timeline._obj
+        items = timeline.GetItemsInTrack("video", 1)
+        names = [item.GetName() for item in items.values()]
+        # lists where the first element isn't remote
+        mixed = timeline._wrap([None, instrument.unwrap(items[1])])
+        mixed[1].GetDuration()
+
+    assert len(names) == 5
+    assert stats.by_call[("-", "GetName")].count == 5
+    assert stats.by_method["GetDuration"].count == 1
+
+
+def test_export(resolve, tmp_path):
+    with instrument.record() as stats:
+        resolve.project.timeline.items("video", 1)
+
+    stats.export(str(tmp_path / "stats.json"))
+    stats.export(str(tmp_path / "stats.csv"))
+    data = json.loads((tmp_path / "stats.json").read_text())
+    assert data["calls"] == stats.calls
+    assert (tmp_path / "stats.csv").read_text().startswith("wrapper,method,count")
+
+
+def test_percentiles():
+    stats = instrument.CallStats()
+    for x in range(1, 101):
+        stats.add(x)
+    assert stats.percentile(50) == 50
+    assert stats.percentile(99) == 99
+    assert stats.mean == 50.5
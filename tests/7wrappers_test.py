@@ -0,0 +1,846 @@
+# flake8: noqa
+# type: ignore
+import gc
+import os
+import time
+
+import pytest
+
+import pydavinci.main
+import pydavinci.wrappers.resolve as davinci
+from pydavinci.fakeresolve import FakeResolveServer
+from pydavinci.identity import identity_map
+from pydavinci.wrappers.mediapoolitem import MediaPoolItem
+from pydavinci.wrappers.timeline import Timeline
+
+
+@pytest.fixture
+def server():
+    server = FakeResolveServer().install()
+    server.populate(clips=20, folders=2, timelines=1, video_tracks=2)
+    yield server
+    server.uninstall()
+
+
+@pytest.fixture
+def resolve(server):
+    return davinci.Resolve()
+
+
+def test_wrappers_are_reused(server, resolve):
+    timeline = resolve.project.timeline
+    assert resolve.project.timeline is timeline
+    assert resolve.project is resolve.project
+
+    # items and clips are built in bulk, without a GetUniqueId round trip each
+    server.reset_stats()
+    items = timeline.items("video", 1)
+    resolve.media_pool.root_folder.clips
+    assert server.calls["TimelineItem.GetUniqueId"] == 0
+    assert server.calls["MediaPoolItem.GetUniqueId"] == 0
+    assert items[0].markers is items[0].markers
+    # not in the identity map, so no weak reference slot either
+    assert not hasattr(items[0], "__weakref__") and not hasattr(MediaPoolItem, "__weakref__")
+
+
+def test_identity_map_is_weak(server, resolve):
+    timeline = resolve.project.timeline
+    assert any(x is timeline for x in identity_map._wrappers.values())
+    del timeline
+    gc.collect()
+    assert not any(isinstance(x, Timeline) for x in identity_map._wrappers.values())
+
+
+def test_identity_map_is_per_session(server, resolve):
+    timeline = resolve.project.timeline
+    assert Timeline(timeline._obj) is timeline
+
+    pydavinci.main.connection.use(server.resolve)
+    assert Timeline(timeline._obj) is not timeline
+
+
+def test_identity_map_can_be_disabled(server, resolve):
+    timeline = resolve.project.timeline
+    identity_map.enabled = False
+    try:
+        assert Timeline(timeline._obj) is not timeline
+    finally:
+        identity_map.enabled = True
+
+
+def test_invalid_objects_still_raise(resolve):
+    with pytest.raises(TypeError):
+        MediaPoolItem(None)
+
+
+def test_markers_are_lazy(server, resolve):
+    server.reset_stats()
+    items = resolve.project.timeline.items("video", 1)
+    assert server.calls["TimelineItem.GetMarkers"] == 0
+
+    clip = items[0].mediapoolitem
+    assert len(clip.markers.all) == 0
+    assert server.calls["MediaPoolItem.GetMarkers"] == 1
+
+
+def test_marker_refresh_policies(server, resolve):
+    clip = resolve.media_pool.root_folder.clips[0]
+    clip.markers.add(1, "Blue", "one")
+    clip._obj.AddMarker(2, "Red", "added in the GUI", "", 1, "")
+    server.reset_stats()
+
+    assert len(clip.markers.all) == 1
+    assert server.calls["MediaPoolItem.GetMarkers"] == 0
+
+    clip.markers.refresh = "always"
+    assert len(clip.markers.all) == 2
+    list(clip.markers)
+    assert server.calls["MediaPoolItem.GetMarkers"] == 2
+
+    clip.markers.refresh = "ttl"
+    clip.markers.ttl = 60
+    clip.markers.find("one")
+    assert server.calls["MediaPoolItem.GetMarkers"] == 2
+    clip.markers.ttl = 0
+    clip.markers.find("one")
+    assert server.calls["MediaPoolItem.GetMarkers"] == 3
+
+
+def test_timeline_snapshot(server, resolve):
+    np = pytest.importorskip("numpy")
+    timeline = resolve.project.timeline
+    snap = timeline.snapshot()
+
+    assert len(snap) == 40
+    assert snap["start"].dtype == np.int64
+    assert (snap["duration"] == snap["end"] - snap["start"]).all()
+    assert set(snap["track_index"].tolist()) == {1, 2}
+    assert snap["name"][0] is snap["name"][20]
+
+    items = timeline.items("video", 2)
+    second = snap.filter(snap["track_index"] == 2)
+    assert second["start"].tolist() == [x.start for x in items]
+    assert second.item(0).id == items[0].id
+
+
+def test_timeline_snapshot_fields(server, resolve):
+    pytest.importorskip("numpy")
+    timeline = resolve.project.timeline
+    server.reset_stats()
+    snap = timeline.snapshot(track_types=["video"], fields=["start", "end"])
+    assert set(snap.columns) == {"track_type", "track_index", "start", "end"}
+    assert server.calls["TimelineItem.GetName"] == 0
+
+    with pytest.raises(ValueError):
+        timeline.snapshot(fields=["colour"])
+
+
+def test_timeline_item_index(server, resolve):
+    timeline = resolve.project.timeline
+    index = timeline.item_index
+    assert len(index) == 40
+
+    server.reset_stats()
+    at = index.at(86640)
+    assert [x.start for x in at] == [86640, 86640]
+    assert index.at(86639, "video", 2)[0].end == 86640
+    assert [x.start for x in index.overlapping(86500, 86900, "video", 1)] == [86400, 86640, 86880]
+    assert index.at(86400 - 1) == []
+    assert index.next_edit(86640) == 86880
+    assert index.previous_edit(86640) == 86400
+    assert index.previous_edit(86400) is None
+    assert server.calls["Timeline.GetItemListInTrack"] == 0
+
+
+def test_timeline_item_index_invalidation(server, resolve):
+    timeline = resolve.project.timeline
+    index = timeline.item_index
+    items = timeline.items("video", 1)
+    assert len(index) == 40
+
+    timeline.create_compound_clip(items[:3])
+    assert not index.loaded
+    assert len(index.at(86400, "video", 1)) == 1
+    assert index.next_edit(86400) == 86640
+    assert len(index) == 38
+
+    server.reset_stats()
+    index.invalidate("video", 2)
+    assert len(index) == 38
+    assert server.calls["Timeline.GetItemListInTrack"] == 1
+
+    resolve.media_pool.append_to_timeline(resolve.media_pool.root_folder.clips[:1])
+    # one video and one audio item
+    assert not index.loaded and len(index) == 40
+
+
+def test_timeline_iter_items(server, resolve):
+    timeline = resolve.project.timeline
+    server.reset_stats()
+
+    records = timeline.iter_items(fields=["name", "duration"])
+    assert server.calls["Timeline.GetTrackCount"] == 0
+    first = next(records)
+    assert (first.track_type, first.track_index, first.duration) == ("video", 1, 240)
+    assert first.start is None and first.id is None
+    assert server.calls["Timeline.GetItemListInTrack"] == 1
+    assert server.calls["TimelineItem.GetName"] == 1
+
+    found = next(x for x in records if x.track_index == 2)
+    assert found.item().id == timeline.items("video", 2)[0].id
+    assert server.calls["TimelineItem.GetLeftOffset"] == 0
+
+    # raised by the call, not on the first next()
+    with pytest.raises(ValueError):
+        timeline.iter_items(["color"])
+    with pytest.raises(ValueError):
+        timeline.iter_items(fields=["bogus"])
+
+
+def test_marker_indexes(server, resolve):
+    markers = resolve.project.timeline.markers
+    markers.add(10, "Blue", "shot 010", note="Focus pull late", customdata="qc:010")
+    markers.add(20, "Red", "shot 020", note="focus ok", customdata="qc:020")
+    markers.add(30, "Blue", "vfx 030", customdata="vfx:030")
+
+    assert [m.frameid for m in markers.find_all("Blue")] == [10, 30]
+    assert markers.find("qc:020").frameid == 20
+    assert [m.frameid for m in markers.search("shot")] == [10, 20]
+    assert [m.frameid for m in markers.search("qc:", fields=["customdata"])] == [10, 20]
+    assert [m.frameid for m in markers.search("03", match="substring")] == [30]
+    assert [m.frameid for m in markers.search("FOCUS", match="token")] == [10, 20]
+
+    markers.find("qc:020").customdata = "done"
+    assert markers.find("qc:020") is None
+    assert markers.find("done").frameid == 20
+
+    markers.delete(color="Blue")
+    assert markers.find_all("Blue") is None
+    assert markers.search("pull", match="token") == []
+    with pytest.raises(ValueError):
+        markers.search("x", fields=["duration"])
+
+
+def test_marker_batch(server, resolve):
+    markers = resolve.project.timeline.markers
+    markers.add(10, "Blue", "a")
+    markers.add(20, "Blue", "b")
+    server.reset_stats()
+
+    with markers.batch():
+        marker = markers.find("a")
+        marker.name = "aa"
+        marker.note = "note"
+        marker.color = "Red"
+        markers.find("b").color = "Blue"
+        markers.add(30, "Green", "c")
+        assert server.round_trips == 0
+
+    assert server.calls["Timeline.DeleteMarkerAtFrame"] == 1
+    assert server.calls["Timeline.AddMarker"] == 2
+    assert server.round_trips == 3
+    remote = server.project.timelines[0]._markers
+    assert remote[10]["color"] == "Red" and remote[10]["note"] == "note"
+    assert sorted(remote) == [10, 20, 30]
+
+    server.reset_stats()
+    with markers.batch():
+        markers.find("b").customdata = "x"
+    assert server.round_trips == 1
+    assert remote[20]["customData"] == "x"
+
+
+def test_marker_batch_rolls_back(server, resolve):
+    markers = resolve.project.timeline.markers
+    markers.add(10, "Blue", "a")
+    server.reset_stats()
+
+    with pytest.raises(RuntimeError):
+        with markers.batch():
+            markers.delete(frameid=10)
+            markers.add(40, "Red", "b")
+            raise RuntimeError
+
+    assert server.round_trips == 0
+    assert [m.frameid for m in markers.all] == [10]
+    assert markers.find("b") is None
+
+
+def test_marker_frame_queries(server, resolve):
+    markers = resolve.project.timeline.markers
+    for frame in (10, 20, 40):
+        markers.add(frame, "Blue", f"m{frame}", duration=5, customdata="dup")
+    markers.add(100, "Red", "long", duration=50)
+
+    assert [m.frameid for m in markers.in_range(10, 40)] == [10, 20]
+    assert markers.before(20).frameid == 10
+    assert markers.before(10) is None
+    assert markers.after(20).frameid == 40
+    assert markers.after(100) is None
+    assert markers.nearest(15).frameid == 10
+    assert markers.nearest(33).frameid == 40
+    assert [m.frameid for m in markers.overlapping(24, 41)] == [20, 40]
+    assert [m.frameid for m in markers.overlapping(140, 141)] == [100]
+
+    assert markers.delete(customdata="dup")
+    assert [m.frameid for m in markers.all] == [20, 40, 100]
+    assert sorted(server.project.timelines[0]._markers) == [20, 40, 100]
+
+
+def test_marker_fetch_diffs(server, resolve):
+    markers = resolve.project.timeline.markers
+    markers.add(10, "Blue", "a")
+    markers.add(20, "Blue", "b")
+    kept = markers.find("a")
+    seen = []
+    markers.on_change(seen.append)
+
+    assert not markers.fetch()
+    assert seen == []
+
+    # changes made elsewhere, like in the GUI
+    remote = server.project.timelines[0]
+    remote.DeleteMarkerAtFrame(20)
+    remote.AddMarker(30, "Red", "c", "", 1, "")
+    remote._markers[10]["note"] = "edited"
+
+    changes = markers.fetch()
+    assert (changes.added, changes.removed, changes.changed) == ({30}, {20}, {10})
+    assert seen == [changes]
+    assert markers.find("a") is kept and kept.note == "edited"
+    assert [m.frameid for m in markers.in_range(0, 100)] == [10, 30]
+    assert markers.find("b") is None
+
+
+def test_marker_bulk_import_export(server, resolve, tmp_path):
+    markers = resolve.project.timeline.markers
+    markers.add(5, "Blue", "existing")
+
+    rows = [
+        {"frameid": 5, "color": "Red", "name": "dup"},
+        {"frameid": 10, "color": "Green", "name": "a", "note": "n", "customdata": "c"},
+        {"frameid": 20, "color": "Purple", "name": "b", "duration": 3},
+        {"frameid": 30, "color": "Orange", "name": "bad color"},
+        {"frameid": 10**9, "color": "Blue", "name": "too far"},
+        {"color": "Blue", "name": "no frame"},
+    ]
+    server.reset_stats()
+    report = markers.import_markers(rows)
+    assert report.added == [10, 20]
+    assert report.skipped == [5]
+    assert [row for row, _ in report.failed] == [4, 5, 6]
+    assert server.calls["Timeline.AddMarker"] == 2
+
+    for ext in ("csv", "jsonl", "edl"):
+        path = str(tmp_path / f"markers.{ext}")
+        assert markers.export_markers(path) == 3
+
+        other = resolve.media_pool.create_empty_timeline(f"copy {ext}").markers
+        report = other.import_markers(path)
+        assert report.added == [5, 10, 20] and not report.failed
+        if ext != "edl":
+            assert other.find("c").note == "n"
+        assert [m.color for m in other.all] == ["Blue", "Green", "Purple"]
+
+    with open(tmp_path / "markers.edl") as f:
+        assert "* LOC: 01:00:00:10 GREEN a" in f.read()
+
+
+def test_wrappers_use_slots(server, resolve):
+    timeline = resolve.project.timeline
+    markers = timeline.markers
+    marker = markers.add(10, "Blue", "a", note="n")
+    item = timeline.items("video", 1)[0]
+
+    for obj in (marker, markers, item, item.mediapoolitem, timeline, resolve.media_pool):
+        assert not hasattr(obj, "__dict__"), type(obj).__name__
+    assert marker._data == {
+        "frameid": 10,
+        "color": "Blue",
+        "name": "a",
+        "note": "n",
+        "duration": 1,
+        "customdata": "",
+    }
+
+
+def test_media_pool_index(server, resolve):
+    pool = resolve.media_pool
+    server.reset_stats()
+    index = pool.index()
+    assert len(index) == 3
+    assert index.paths == ["Master", "Master/Bin 0001", "Master/Bin 0002"]
+    assert server.calls["Folder.GetSubFolderList"] == 3
+    server.reset_stats()
+
+    assert pool.index() is index
+    assert len(index.clips()) == 20
+    assert len(index.clips("Master", recursive=False)) == 7
+    walked = [(path, len(subs), len(clips)) for path, _, subs, clips in pool.walk()]
+    assert walked == [("Master", 2, 7), ("Master/Bin 0001", 0, 7), ("Master/Bin 0002", 0, 6)]
+    assert server.calls["Folder.GetSubFolderList"] == 0
+    assert server.calls["Folder.GetClipList"] == 0
+
+    bin1 = index.folder("Master/Bin 0001")
+    new = pool.add_subfolder("Day 1", bin1)
+    assert index.path(new) == "Master/Bin 0001/Day 1"
+    pool.move_folders([new], index.folder("Master/Bin 0002"))
+    assert "Master/Bin 0002/Day 1" in index and "Master/Bin 0001/Day 1" not in index
+
+    # changes made elsewhere only need their subtree crawled again
+    server.project.mediapool.AddSubFolder(server.unwrap(bin1._obj), "GUI")
+    server.reset_stats()
+    index.refresh("Master/Bin 0001")
+    assert "Master/Bin 0001/GUI" in index
+    assert server.calls["Folder.GetSubFolderList"] == 2
+    assert index.paths[1:3] == ["Master/Bin 0001", "Master/Bin 0002"]
+
+    with pytest.raises(KeyError):
+        index.folder("Master/Nope")
+
+
+def test_media_pool_clip_lookups(server, resolve):
+    pool = resolve.media_pool
+    index = pool.index()
+    server.reset_stats()
+    clip = index.find_clip(file_path="/media/A001/A001C003.mov")
+    assert clip is not None and clip.name == "A001C003.mov"
+    assert server.calls["MediaPoolItem.GetClipProperty"] == 20
+    server.reset_stats()
+
+    assert pool.find_clips(reel="A001C004")[0].id == index.find_clip(name="A001C004.mov").id
+    assert index.find_clip(media_id=clip.media_id).id == clip.id
+    assert index.find_clips(reel="A001C003", name="A001C004.mov") == []
+    assert index.find_clip(id="nope") is None
+    assert server.calls["MediaPoolItem.GetClipProperty"] == 0
+
+    bin2 = index.folder("Master/Bin 0002")
+    assert pool.move_clips([clip], bin2)
+    assert index.clip_entry(clip).folder == bin2.id
+    assert clip.id in [c.id for c in index.clips(bin2, recursive=False)]
+    assert pool.delete_clips([clip])
+    assert index.find_clip(file_path="/media/A001/A001C003.mov") is None
+    assert len(index.clips()) == 19
+
+    imported = pool.import_media(["/media/B001/B001C001.mov"])
+    assert index.find_clip(file_path="/media/B001/B001C001.mov").id == imported[0].id
+    assert server.calls["MediaPoolItem.GetClipProperty"] == 1
+
+    # deleting before the clips are read makes the folders fetch their clip lists again,
+    # imported clips must not be added on top of them
+    index.refresh()
+    assert pool.delete_clips([imported[0]])
+    again = pool.import_media(["/media/B001/B001C002.mov"])
+    paths = [c.properties["File Path"] for c in index.clips()]
+    assert len(paths) == 20 and paths.count("/media/B001/B001C002.mov") == 1
+    assert index.find_clip(id=again[0].id) is not None
+
+    with pytest.raises(ValueError):
+        index.find_clips()
+
+
+def test_media_pool_metadata_table(server, resolve, tmp_path):
+    pool = resolve.media_pool
+    clips = pool.index().clips()
+    clips[0].set_metadata({"Scene": "12"})
+    clips[3].set_metadata({"Scene": "12"})
+    server.reset_stats()
+
+    seen = []
+    table = pool.metadata_table(batch_size=8, progress=lambda done, total: seen.append(done))
+    assert len(table) == 20 and seen == [8, 16, 20]
+    assert server.calls["MediaPoolItem.GetClipProperty"] == 20
+    assert server.calls["MediaPoolItem.GetMetadata"] == 20
+    assert table["Scene"].count("12") == 2 and table["Scene"][1] == ""
+    assert table["File Path"][0] == clips[0].properties["File Path"]
+
+    scene = table.where("Scene", "12")
+    assert [scene.item(i).id for i in range(len(scene))] == [clips[0].id, clips[3].id]
+    assert len(table.filter(lambda row: row["Reel Name"].endswith("1"))) == 2
+
+    narrow = pool.metadata_table(clips[:2], fields=["Reel Name", "Nope"], sources=["properties"])
+    assert narrow.fields == ["Reel Name", "Nope"] and narrow["Nope"] == ["", ""]
+    narrow.to_csv(str(tmp_path / "meta.csv"))
+    with open(tmp_path / "meta.csv") as f:
+        assert f.read().splitlines()[0] == "Reel Name,Nope"
+
+    with pytest.raises(ValueError):
+        pool.metadata_table(sources=["nope"])
+
+
+def test_media_pool_metadata_parquet(resolve, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    table = resolve.media_pool.metadata_table(fields=["Clip Name", "Reel Name"])
+    table.to_parquet(str(tmp_path / "meta.parquet"), row_group_size=8)
+    written = pq.read_table(str(tmp_path / "meta.parquet"))
+    assert written.column_names == ["Clip Name", "Reel Name"]
+    assert written.column("Reel Name").to_pylist() == table["Reel Name"]
+
+
+def test_media_pool_bulk_writes(server, resolve):
+    pool = resolve.media_pool
+    clips = pool.index().clips()[:4]
+    clips[0].set_metadata({"Scene": "12"})
+    server.reset_stats()
+
+    report = pool.set_metadata({clip: {"Scene": "12", "Take": "1"} for clip in clips})
+    assert [r.written for r in report.clips] == [["Take"]] + [["Scene", "Take"]] * 3
+    assert report.clips[0].unchanged == ["Scene"]
+    assert server.calls["MediaPoolItem.SetMetadata"] == 4
+    assert report.calls == 8 and report.baseline == 4
+
+    table = pool.metadata_table(clips, fields=["Scene", "Take", "Reel Name"])
+    server.reset_stats()
+    report = pool.set_metadata({clip: {"Scene": "12", "Take": "2"} for clip in clips}, table)
+    assert server.calls["MediaPoolItem.GetMetadata"] == 0
+    assert report.calls == 4 and report.saved == 0 and table["Take"] == ["2"] * 4
+    assert pool.set_metadata({clip: {"Take": "2"} for clip in clips}, table).saved == 4
+    # clips fetched again are matched to the table by id
+    fetched = [x for x in pool.root_folder.clips if x.id in {c.id for c in clips}]
+    server.reset_stats()
+    report = pool.set_metadata({clip: {"Take": "2"} for clip in fetched}, table)
+    assert len(fetched) == 4 and report.calls == 8
+    assert server.calls["MediaPoolItem.GetMetadata"] == 0
+
+    reel = pool.find_clips(id=clips[1].id)[0].properties["Reel Name"]
+    report = pool.set_properties({clips[1]: {"Reel Name": "B001", "Nope": "x"}}, table)
+    assert report.clips[0].written == ["Reel Name"] and report.clips[0].failed == ["Nope"]
+    assert pool.find_clips(reel="B001")[0].id == clips[1].id
+    assert pool.find_clips(reel=reel) == []
+    assert table["Reel Name"][1] == "B001"
+
+
+def test_media_pool_ingest(server, resolve, tmp_path):
+    for day in ("day1", "day1/sub", "day2"):
+        (tmp_path / day).mkdir()
+    for name in ("day1/A.mov", "day1/B.mov", "day1/notes.txt", "day1/sub/C.mov", "day2/D.mov"):
+        (tmp_path / name).write_text("")
+    pool = resolve.media_pool
+    pool.import_media([str(tmp_path / "day1/B.mov")])
+    journal = str(tmp_path / "ingest.jsonl")
+
+    seen = []
+    report = pool.ingest(
+        [str(tmp_path / "day1")],
+        chunk_size=1,
+        journal=journal,
+        extensions=[".MOV"],
+        progress=lambda done, total: seen.append((done, total)),
+    )
+    assert report.imported == [str(tmp_path / "day1/A.mov"), str(tmp_path / "day1/sub/C.mov")]
+    assert report.skipped == [str(tmp_path / "day1/B.mov")] and report.chunks == 2
+    assert seen == [(0, 2), (1, 2), (2, 2)]
+
+    # resumed run: journal and media pool both know day1
+    server.reset_stats()
+    paths = [str(tmp_path / "day1"), str(tmp_path / "day2")]
+    report = pool.ingest(paths, journal=journal, extensions=[".mov"])
+    assert report.imported == [str(tmp_path / "day2/D.mov")] and len(report.skipped) == 3
+    assert server.calls["MediaPool.ImportMedia"] == 1
+
+    # current folder created outside of pydavinci, unknown to the index
+    (tmp_path / "day3").mkdir()
+    (tmp_path / "day3/E.mov").write_text("")
+    folder = pool._obj.AddSubFolder(pool._obj.GetRootFolder(), "From the GUI")
+    pool._obj.SetCurrentFolder(folder)
+    report = pool.ingest([str(tmp_path / "day3")])
+    assert report.imported == [str(tmp_path / "day3/E.mov")] and report.failed == []
+    assert pool.find_clips(file_path=str(tmp_path / "day3/E.mov"))
+
+
+def test_image_sequences(server, resolve, tmp_path):
+    from pydavinci.wrappers.sequences import find_sequences
+
+    names = [f"/vfx/sh010/plate.{n:04d}.exr" for n in (1, 2, 3, 7, 8, 12)]
+    found, singles = find_sequences(names + ["/vfx/sh010/plate.5.exr", "/vfx/notes.txt"])
+    assert [(s.start, s.end, s.padding) for s in found] == [(1, 3, 4), (7, 8, 4)]
+    assert found[0].clip_info()["FilePath"] == "/vfx/sh010/plate.%04d.exr"
+    assert sorted(singles) == [
+        "/vfx/notes.txt",
+        "/vfx/sh010/plate.0012.exr",
+        "/vfx/sh010/plate.5.exr",
+    ]
+
+    # unpadded frame numbers aren't split by digit count
+    found, singles = find_sequences([f"/vfx/sh020/plate.{n}.exr" for n in range(1, 120)])
+    assert [(s.start, s.end, s.padding) for s in found] == [(1, 119, 0)] and singles == []
+    assert found[0].pattern == "/vfx/sh020/plate.%d.exr"
+    assert found[0].path(7) == "/vfx/sh020/plate.7.exr"
+
+    for n in list(range(1001, 1101)) + [1200]:
+        (tmp_path / f"bg.{n:04d}.dpx").write_text("")
+    (tmp_path / "slate.mov").write_text("")
+    server.reset_stats()
+    clips = resolve.media_pool.import_media([str(tmp_path)], sequences=True)
+    assert len(clips) == 3 and server.calls["MediaPool.ImportMedia"] == 2
+    paths = [clip.properties["File Path"] for clip in clips]
+    assert str(tmp_path / "bg.[1001-1100].dpx") in paths
+
+
+def test_media_pool_link_proxies(server, resolve, tmp_path):
+    from pydavinci.wrappers.proxies import ProxyIndex, match_basename
+
+    (tmp_path / "day1").mkdir()
+    names = ("A001C001_proxy.mov", "A001C002.mov", "day1/A001C002.mp4", "a001_c004.mp4")
+    for name in names + ("day1/A001C003.mxf", "notes.txt"):
+        (tmp_path / name).write_text("")
+    proxies = ProxyIndex([str(tmp_path)])
+    assert len(proxies) == 5 and len(proxies.by_stem["a001c002"]) == 2
+
+    pool = resolve.media_pool
+    report = pool.link_proxies(proxies, dry_run=True)
+    # C002 has two proxies, C004 is only matched by reel
+    assert len(report.matched) == 3 and len(report.missing) == 16
+    assert report.ambiguous[0].clip_name == "A001C002.mov"
+    assert not any(match.linked for match in report.matched)
+
+    report = pool.link_proxies([str(tmp_path)], rules=[match_basename])
+    assert sorted(m.clip_name for m in report.matched) == ["A001C001.mov", "A001C003.mov"]
+    linked = report.matched[0].item().properties
+    assert linked["Proxy Media Path"] == report.matched[0].proxy
+
+
+def test_media_pool_relink(server, resolve, tmp_path):
+    from pydavinci.wrappers.relink import FileIndex
+
+    for directory in ("raid_a/A001", "raid_b/A001", "raid_b/old/A001", "raid_c"):
+        (tmp_path / directory).mkdir(parents=True)
+    (tmp_path / "raid_a/A001/A001C001.mov").write_text("x")
+    (tmp_path / "raid_a/A001/A001C002.mov").write_text("x")
+    (tmp_path / "raid_b/A001/A001C003.mov").write_text("x")
+    # same trailing directories, different sizes
+    (tmp_path / "raid_b/A001/A001C004.mov").write_text("x")
+    (tmp_path / "raid_b/old/A001/A001C004.mov").write_text("xx")
+    (tmp_path / "raid_c/A001C005.mov").write_text("x")
+
+    pool = resolve.media_pool
+    clips = [pool.find_clips(reel=f"A001C00{n}")[0] for n in range(1, 7)]
+    paths = [clip.properties["File Path"] for clip in clips]
+    # clip names aren't unique, the report is keyed by file path
+    clips[1].set_property("Clip Name", clips[0].name)
+    pool.unlink_clips(clips)
+    files = FileIndex(
+        [str(tmp_path / "raid_a"), str(tmp_path / "raid_b"), str(tmp_path / "raid_c")]
+    )
+    assert len(files) == 6
+
+    server.reset_stats()
+    plan = pool.relink(files, dry_run=True)
+    assert plan.calls == 3 and server.calls["MediaPool.RelinkClips"] == 0
+    assert plan.groups[str(tmp_path / "raid_a/A001")] == paths[:2]
+    assert list(plan.ambiguous) == [paths[3]] and plan.missing == [paths[5]]
+
+    assert all(plan.apply().values()) and server.calls["MediaPool.RelinkClips"] == 3
+    moved = str(tmp_path / "raid_c/A001C005.mov")
+    assert clips[4].properties["File Path"] == moved
+    assert pool.find_clips(file_path=moved)[0].id == clips[4].id
+    assert pool.relink(files).calls == 0
+
+
+def test_media_storage_walk(server, resolve, tmp_path):
+    from pydavinci.wrappers.storagewalk import listing_cache
+
+    for directory in ("a/x", "b", "skip/deep"):
+        (tmp_path / directory).mkdir(parents=True)
+    for name in ("top.mov", "a/1.mov", "a/x/2.mov", "b/3.mov", "skip/deep/4.mov"):
+        (tmp_path / name).write_text("")
+    storage = resolve.media_storage
+    root = str(tmp_path)
+
+    def walked(**kwargs):
+        files = []
+        for _, subfolders, found in storage.walk(root, **kwargs):
+            subfolders[:] = [d for d in subfolders if not d.endswith("skip")]
+            files += [os.path.relpath(f, root) for f in found]
+        return files
+
+    server.reset_stats()
+    assert walked() == ["top.mov", "a/1.mov", "b/3.mov", "a/x/2.mov"]
+    assert server.calls["MediaStorage.GetFileList"] == 0
+    hits = listing_cache.hits
+    (tmp_path / "b/5.mov").write_text("")
+    assert walked()[-2:] == ["b/5.mov", "a/x/2.mov"]
+    assert listing_cache.hits == hits + 3
+
+    assert walked(local=False) == ["top.mov", "a/1.mov", "b/3.mov", "b/5.mov", "a/x/2.mov"]
+    assert server.calls["MediaStorage.GetFileList"] == 4
+    walked(local=False)
+    assert server.calls["MediaStorage.GetFileList"] == 4
+
+
+def test_listing_cache_is_bounded_by_paths():
+    from pydavinci.wrappers.storagewalk import ListingCache
+
+    cache = ListingCache(max_paths=5)
+    cache.put((True, "/a"), 1, (["/a/x"], ["/a/1", "/a/2"]))
+    cache.put((True, "/b"), 1, ([], ["/b/1", "/b/2"]))
+    assert len(cache) == 2 and cache.paths == 5
+    # least recently used listings are dropped first
+    cache.put((True, "/c"), 1, ([], ["/c/1"]))
+    assert cache.get((True, "/a"), lambda stamp: True) is None
+    assert len(cache) == 2 and cache.paths == 3
+    # listings too large for the cache aren't kept
+    cache.put((True, "/d"), 1, ([], [f"/d/{n}" for n in range(6)]))
+    assert cache.get((True, "/d"), lambda stamp: True) is None and cache.paths == 3
+
+
+def test_render_monitor(server, resolve):
+    clock = [0.0]
+    server.clock = lambda: clock[0]
+    server.render_fps = 4800  # one second per job
+    project = resolve.project
+    first, second = project.add_renderjob(), project.add_renderjob()
+    server.project.jobs[second].fail = True
+
+    monitor = project.render_monitor(min_interval=0.1, max_interval=2)
+    monitor._clock = server.clock
+    seen = {"progress": [], "complete": [], "failed": []}
+    monitor.on_progress(lambda e: seen["progress"].append((e.job_id, e.percentage)))
+    monitor.on_complete(lambda e: seen["complete"].append(e.job_id))
+    monitor.on_failure(lambda e: seen["failed"].append(e.job_id))
+    assert monitor.job_ids == [first, second]
+    project.render()
+
+    monitor.poll()
+    clock[0] = 0.8
+    server.reset_stats()
+    monitor.poll()
+    assert server.calls["Project.GetRenderJobStatus"] == 2
+    assert seen["progress"][-1] == (first, 80)
+    assert monitor.next_interval() == pytest.approx(0.1)
+    clock[0] = 1.2
+    monitor.poll()
+    assert seen["complete"] == [first] and monitor.next_interval() == pytest.approx(0.4)
+
+    clock[0] = 2
+    server.reset_stats()
+    monitor.poll()
+    assert seen["failed"] == [second] and monitor.done
+    assert server.calls["Project.GetRenderJobStatus"] == 1
+    stats = monitor.stats
+    assert (stats.completed, stats.failed, stats.remaining) == (1, 1, 0)
+    assert stats.fps == 2400 and stats.jobs_per_hour == 3600
+
+
+def test_render_monitor_thread_and_events(server, resolve):
+    import asyncio
+
+    server.render_fps = 480000
+    project = resolve.project
+    job = project.add_renderjob()
+    project.render()
+    monitor = project.render_monitor(min_interval=0.01, max_interval=0.05)
+    completed = []
+    monitor.on_complete(completed.append)
+    with monitor:
+        assert monitor.wait(timeout=5)
+    assert completed[0].job_id == job and monitor.error is None
+
+    job = project.add_renderjob()
+    project.render([job])
+
+    async def collect():
+        monitor = project.render_monitor([job], min_interval=0.01, max_interval=0.05)
+        return [event.kind async for event in monitor.events()]
+
+    assert asyncio.run(collect())[-1] == "complete"
+
+    # leaving early doesn't keep an executor thread waiting for the jobs
+    server.render_fps = 24
+    job = project.add_renderjob()
+    project.render([job])
+    monitor = project.render_monitor([job], min_interval=0.01, max_interval=0.05)
+
+    async def first():
+        async for event in monitor.events():
+            return event.kind
+
+    started = time.monotonic()
+    assert asyncio.run(first()) == "progress" and time.monotonic() - started < 5
+    assert not monitor.done and monitor._waiters == []
+    monitor.stop()
+
+
+def test_render_farm_requeues_on_node_failure():
+    from pydavinci.wrappers.renderfarm import RenderFarm, RenderNode
+
+    clock = [0.0]
+    servers = [FakeResolveServer(render_fps=480, clock=lambda: clock[0]) for _ in range(3)]
+    for server in servers:
+        server.populate(clips=20, timelines=1)
+    nodes = [
+        RenderNode("a", remote=servers[0].resolve),
+        RenderNode("b", factory=lambda: servers[1].scriptapp("Resolve", "10.0.0.2")),
+        RenderNode("c", remote=servers[2].resolve),
+    ]
+    farm = RenderFarm(
+        nodes, policy="shortest_job_first", sleep=lambda s: clock.__setitem__(0, clock[0] + s)
+    )
+    full = farm.submit(timeline="Timeline 1")
+    short, long, mid = (
+        farm.submit({"SelectAllFrames": False, "MarkIn": 0, "MarkOut": n - 1})
+        for n in (480, 2400, 960)
+    )
+    farm.step()
+    assert [job.node.name for job in (short, mid, long)] == ["a", "b", "c"]
+    assert full.status == "pending" and full.frames is None
+
+    def crash(*args, **kwargs):
+        raise ConnectionError("node lost")
+
+    servers[2]._call = crash
+    servers[0].project.jobs[short.job_id].fail = True
+    clock[0] = 0.6
+    farm.step()
+    # a is free again, short waits for b rather than going back to the node it failed on
+    assert not nodes[2].alive and "node lost" in long.errors[0] and long.node.name == "a"
+    assert short.attempts == 1 and short.status == "pending"
+
+    assert farm.run(timeout=60)
+    assert [job.status for job in farm.jobs] == ["complete"] * 4
+    assert short.node.name != "a" and long.node.name != "c" and full.frames == 4800
+    assert farm.requeues == 2 and nodes[0].fps == pytest.approx(480)
+    assert "Failed on a" in short.errors
+
+    del servers[2]._call
+    assert nodes[2].reconnect() and servers[2].project.jobs == {}
+
+
+def test_render_farm_least_loaded(server, resolve):
+    from pydavinci.wrappers.renderfarm import RenderFarm, RenderNode
+
+    other = FakeResolveServer().populate(clips=20, timelines=1)
+    nodes = [
+        RenderNode("a", remote=server.resolve, capacity=2),
+        RenderNode("b", remote=other.resolve, capacity=2),
+    ]
+    farm = RenderFarm(nodes)
+    project = resolve.project
+    assert project.set_render_format_and_codec("mp4", "H265")
+    assert project.load_render_preset("YouTube - 1080p")
+    project.add_renderjob()
+    project.set_render_settings({"SelectAllFrames": False, "MarkIn": 0, "MarkOut": 479})
+    project.add_renderjob()
+    project.add_renderjob()
+    jobs = farm.submit_queue(project)
+    assert [job.frames for job in jobs] == [4800, 480, 480]
+    assert [job.preset for job in jobs] == ["YouTube - 1080p", None, None]
+    farm.step()
+    assert [job.node.name for job in jobs] == ["a", "b", "b"]
+    assert len(other.project.jobs) == 2 and other.project.current_timeline.name == "Timeline 1"
+    # rendered with the codec of the copied jobs, not the one the node had set
+    assert [job.render_format for job in other.project.jobs.values()] == [
+        {"format": "mp4", "codec": "H265"}
+    ] * 2
+    with pytest.raises(ValueError):
+        RenderFarm(nodes, policy="random")
+
+    # only connection errors take a node down, others are bugs and propagate
+    def broken(job):
+        raise KeyError("MarkOut")
+
+    nodes[0].start = broken
+    farm.submit()
+    with pytest.raises(KeyError):
+        farm.step()
+    assert nodes[0].alive and farm.requeues == 0